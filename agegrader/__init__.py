@@ -1 +1,48 @@
-from .agegrader import power_of_ten_grader
\ No newline at end of file
+"""
+Running age grading.
+
+The public API is loaded lazily: importing the package is cheap, submodules are imported when one
+of their names is first used, and the standards are read when the first grader is built.
+"""
+import importlib
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    'AgeGrader': 'agegrader',
+    'POWER_OF_TEN_DISCIPLINE_MAP': 'agegrader',
+    'format_time': 'agegrader',
+    'parse_time': 'agegrader',
+    'power_of_ten_grader': 'agegrader',
+    'load_standards': 'standards',
+    'parse_times': 'times',
+    'parse_time_value': 'times',
+    'format_times': 'times',
+    'grade_results': 'batch',
+    'grade_results_deduped': 'batch',
+    'age_graded_results': 'batch',
+    'validate_results': 'batch',
+    'error_summary': 'batch',
+    'GradingJob': 'batch',
+    'GradeCache': 'cache',
+    'ResultsTail': 'live',
+    'grade_record': 'live',
+    'FeedConsumer': 'feed',
+    'instrument': 'instrumentation',
+    'GraderStats': 'instrumentation',
+    'CompactAgeGrader': 'compact',
+    'compact_grader': 'compact',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{_EXPORTS[name]}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
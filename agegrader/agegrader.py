@@ -1,5 +1,7 @@
 import re
-from .combined_standards import STANDARDS
+from functools import cached_property
+
+from .standards import load_standards
 
 # Constants
 MARATHON_LENGTH = 42.194988
@@ -68,6 +70,9 @@ def parse_time(time_str):
 class AgeGrader:
     """An Age Grader instance is used to compute age gradings."""
 
+    # GraderStats recording grading calls, only set on instrumented graders (see instrumentation.py)
+    stats = None
+
     def __init__(self, standards, discipline_to_heading_map):
         self.standards = standards
         # Map from discipline names to headings from standards spreadsheet
@@ -86,8 +91,10 @@ class AgeGrader:
 
     def _get_standard(self, discipline, gender, age):
         """Get the age graded standard in seconds"""
-        heading = self._get_heading(discipline)
+        return self._standard_for_heading(self._get_heading(discipline), gender, age)
 
+    def _standard_for_heading(self, heading, gender, age):
+        """The standard for a discipline's heading, False as _get_standard gives it"""
         if not heading:
             return False
 
@@ -103,6 +110,36 @@ class AgeGrader:
         except KeyError:
             return False
 
+    @cached_property
+    def age_factors(self):
+        """
+        Age factors by gender and heading, one for each age from 5 to 100: the open class standard
+        (the fastest age's) divided by the age's standard. Built on first use.
+        """
+        factors = {}
+        for gender, by_heading in self.standards.items():
+            for heading, times in by_heading.items():
+                open_standard = min(times)
+                factors.setdefault(gender, {})[heading] = [open_standard / t for t in times]
+        return factors
+
+    def _get_age_factor(self, discipline, gender, age):
+        """Get the age factor, or False as _get_standard does"""
+        heading = self._get_heading(discipline)
+
+        if not heading:
+            return False
+
+        if gender not in self.standards:
+            return False
+
+        age = max(5, min(100, age))
+
+        try:
+            return self.age_factors[gender][heading][age - 5]
+        except KeyError:
+            return False
+
     def _age_from_category(self, category):
         """Extract age from category string like 'M45' or 'Senior'"""
         if 'Senior' in category or 'SM' in category or 'SF' in category:
@@ -129,7 +166,11 @@ class AgeGrader:
 
     def get_age_grade(self, discipline, gender, age, time_seconds):
         """Calculate age grading percentage"""
-        standard = self._get_standard(discipline, gender, age)
+        return self._grade(self._get_standard(discipline, gender, age), time_seconds)
+
+    @staticmethod
+    def _grade(standard, time_seconds):
+        """The age grade for a standard from _get_standard, "" for none"""
         if standard is False:
             return ""
 
@@ -141,6 +182,30 @@ class AgeGrader:
         gender = self._gender_from_category(category)
         return self.get_age_grade(discipline, gender, cat_age, time_seconds)
 
+    def get_age_factor(self, discipline, gender, age):
+        """Calculate the age factor, the open class standard divided by the standard for the age"""
+        factor = self._get_age_factor(discipline, gender, age)
+        if factor is False:
+            return ""
+        return factor
+
+    def get_age_factor_by_category(self, discipline, category):
+        cat_age = self._age_from_category(category)
+        gender = self._gender_from_category(category)
+        return self.get_age_factor(discipline, gender, cat_age)
+
+    def get_age_graded_time(self, discipline, gender, age, time_seconds):
+        """Calculate the age-graded time in seconds, the time scaled to the open class by the age factor"""
+        factor = self._get_age_factor(discipline, gender, age)
+        if factor is False:
+            return ""
+        return time_seconds * factor
+
+    def get_age_graded_time_by_category(self, discipline, category, time_seconds):
+        cat_age = self._age_from_category(category)
+        gender = self._gender_from_category(category)
+        return self.get_age_graded_time(discipline, gender, cat_age, time_seconds)
+
 
 def power_of_ten_grader(year=2015):
-    return AgeGrader(STANDARDS[str(year)], POWER_OF_TEN_DISCIPLINE_MAP)
+    return AgeGrader(load_standards()[str(year)], POWER_OF_TEN_DISCIPLINE_MAP)
@@ -0,0 +1,436 @@
+"""
+Vectorised age grading of whole results tables.
+
+The scalar AgeGrader methods are used once per distinct discipline, category and gender so the
+results match get_age_grade exactly; the per-row work is done with numpy array operations.
+"""
+import math
+import threading
+from functools import lru_cache
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
+
+from .instrumentation import UNKNOWN_LABEL
+from .times import parse_time_value, parse_times
+
+MIN_AGE = 5
+MAX_AGE = 100
+
+# Row problems found by validate_results, as bit flags of a uint8 code per row; 0 is a clean row
+UNKNOWN_DISCIPLINE = 1    # no distance, or one with no standards heading
+UNKNOWN_CATEGORY = 2      # a category with no age in it, which AgeGrader grades as age 5
+MISSING_GENDER = 4        # no gender in the standards from the category or Gender column
+UNPARSABLE_TIME = 8       # missing, unparsable or not positive
+OUT_OF_RANGE_AGE = 16     # an age outside 5-100, graded as the nearest of those unless infinite
+MISSING_AGE = 32          # no category, and a missing or non-numeric Age
+ROW_ERRORS = {
+    'unknown_discipline': UNKNOWN_DISCIPLINE,
+    'unknown_category': UNKNOWN_CATEGORY,
+    'missing_gender': MISSING_GENDER,
+    'unparsable_time': UNPARSABLE_TIME,
+    'out_of_range_age': OUT_OF_RANGE_AGE,
+    'missing_age': MISSING_AGE,
+}
+
+
+class StandardsTable:
+    """Dense (gender, heading, age) array of the standards used by an AgeGrader."""
+
+    def __init__(self, standards):
+        self.genders = list(standards)
+        self.headings = sorted({heading for by_heading in standards.values() for heading in by_heading})
+        self.gender_index = {gender: i for i, gender in enumerate(self.genders)}
+        self.heading_index = {heading: i for i, heading in enumerate(self.headings)}
+
+        n_ages = MAX_AGE - MIN_AGE + 1
+        self.values = np.full((len(self.genders), len(self.headings), n_ages), np.nan)
+        for gender, by_heading in standards.items():
+            for heading, times in by_heading.items():
+                column = np.asarray(times[:n_ages], dtype=float)
+                self.values[self.gender_index[gender], self.heading_index[heading], :len(column)] = column
+        # Open class (fastest age) standard over each age's standard, as AgeGrader.age_factors
+        self.factors = np.fmin.reduce(self.values, axis=2, keepdims=True) / self.values
+
+    def lookup(self, gender_codes, heading_codes, ages, values=None):
+        """
+        Look up standards for arrays of gender/heading codes and ages, NaN where a code is -1.
+        values is an array shaped like the standards to look up instead, such as the factors.
+        """
+        values = self.values if values is None else values
+        valid = (gender_codes >= 0) & (heading_codes >= 0)
+        age_codes = np.clip(ages, MIN_AGE, MAX_AGE).astype(np.intp) - MIN_AGE
+        result = np.full(len(valid), np.nan)
+        result[valid] = values[gender_codes[valid], heading_codes[valid], age_codes[valid]]
+        return result
+
+
+@lru_cache(maxsize=None)
+def standards_table(grader):
+    """The StandardsTable for a grader, built once and shared by every batch call"""
+    return StandardsTable(grader.standards)
+
+
+def _codes(values, resolve):
+    """Map each distinct value through resolve and broadcast the integer results back to every row"""
+    codes, uniques = pd.factorize(pd.Series(values, copy=False), use_na_sentinel=True)
+    resolved = np.array([resolve(value) for value in uniques] + [-1], dtype=np.intp)
+    return resolved[codes]
+
+
+def round_grades(values):
+    """Round to 2 decimal places exactly as the builtin round does for each element"""
+    rounded = np.round(values, 2)
+    # np.round scales by 100 before rounding, which can land on the other side of a half for
+    # values very close to one; defer those few to the builtin so results stay identical.
+    scaled = values * 100
+    near_half = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    for i in np.flatnonzero(near_half):
+        rounded[i] = round(float(values[i]), 2)
+    return rounded
+
+
+def _heading_resolver(grader, table):
+    def resolve(discipline):
+        if not isinstance(discipline, str):
+            return -1
+        return table.heading_index.get(grader._get_heading(discipline), -1)
+    return resolve
+
+
+def _category_resolvers(grader, table):
+    def resolve_gender(category):
+        if not isinstance(category, str):
+            return -1
+        return table.gender_index.get(grader._gender_from_category(category), -1)
+
+    def resolve_age(category):
+        if not isinstance(category, str):
+            return MIN_AGE
+        return grader._age_from_category(category)
+
+    return resolve_gender, resolve_age
+
+
+def _times(df):
+    """Seconds for each row's time, NaN where it is missing, unparsable or not positive"""
+    times, _ = parse_times(df['Time'])
+    times[times <= 0] = np.nan
+    return times
+
+
+def _resolve(grader, table, df):
+    """
+    Standards table codes for every row: (distance_codes, distances, heading_codes, gender_codes,
+    ages, has_category, age_errors), with -1 codes for anything that does not resolve. age_errors is
+    MISSING_AGE or OUT_OF_RANGE_AGE for rows graded by age and gender with no age to grade at, a
+    missing or an infinite one; they keep their gender code, so each problem is reported on its own,
+    and _graded_genders drops them for the lookup.
+    """
+    n = len(df)
+    distance_codes, distances = pd.factorize(df['Distance'], use_na_sentinel=True)
+    resolve_heading = _heading_resolver(grader, table)
+    heading_codes = np.array([resolve_heading(d) for d in distances] + [-1], dtype=np.intp)[distance_codes]
+
+    gender_codes = np.full(n, -1, dtype=np.intp)
+    ages = np.full(n, MIN_AGE, dtype=np.intp)
+    age_errors = np.full(n, MISSING_AGE, dtype=np.uint8)
+    if 'Age' in df.columns and 'Gender' in df.columns:
+        age_values = pd.to_numeric(df['Age'], errors='coerce').to_numpy(dtype=float)
+        gender_codes = _codes(df['Gender'], lambda g: table.gender_index.get(g, -1))
+        ages = _whole_ages(age_values)
+        age_errors = np.where(np.isnan(age_values), MISSING_AGE, 0).astype(np.uint8)
+        age_errors[np.isinf(age_values)] = OUT_OF_RANGE_AGE
+
+    has_category = np.zeros(n, dtype=bool)
+    if 'Category' in df.columns:
+        has_category = df['Category'].notna().to_numpy()
+        resolve_gender, resolve_age = _category_resolvers(grader, table)
+        gender_codes = np.where(has_category, _codes(df['Category'], resolve_gender), gender_codes)
+        ages = np.where(has_category, _codes(df['Category'], resolve_age), ages)
+    age_errors[has_category] = 0
+    return distance_codes, distances, heading_codes, gender_codes, ages, has_category, age_errors
+
+
+def _whole_ages(age_values):
+    """
+    Ages truncated to whole years as int() truncates them, MIN_AGE for NaN. Ages are first limited
+    to one year either side of 5-100, which grades and flags them the same, so that huge and
+    infinite values cannot overflow the cast.
+    """
+    limited = np.clip(np.nan_to_num(age_values, nan=MIN_AGE), MIN_AGE - 1, MAX_AGE + 1)
+    return limited.astype(np.intp)
+
+
+def _graded_genders(gender_codes, age_errors):
+    """Gender codes to look standards up with: -1 for rows with no age to grade at"""
+    return np.where(age_errors != 0, -1, gender_codes)
+
+
+def _row_errors(times, heading_codes, gender_codes, ages, has_category, age_errors):
+    unknown_category = has_category & (ages == -1)
+    errors = np.where(heading_codes < 0, UNKNOWN_DISCIPLINE, 0).astype(np.uint8) | age_errors
+    errors[unknown_category] |= UNKNOWN_CATEGORY
+    errors[gender_codes < 0] |= MISSING_GENDER
+    errors[np.isnan(times)] |= UNPARSABLE_TIME
+    missing_age = (age_errors & MISSING_AGE) != 0
+    errors[~unknown_category & ~missing_age & ((ages < MIN_AGE) | (ages > MAX_AGE))] |= OUT_OF_RANGE_AGE
+    return errors
+
+
+def validate_results(grader, df):
+    """
+    Classify every row of a results frame without grading it: a uint8 array of ROW_ERRORS flags,
+    0 for rows with no problems. Rows with UNKNOWN_DISCIPLINE, MISSING_GENDER, UNPARSABLE_TIME or
+    MISSING_AGE get no grade; rows with UNKNOWN_CATEGORY or OUT_OF_RANGE_AGE are graded at a clamped age,
+    except infinite ages, which get no grade.
+    """
+    table = standards_table(grader)
+    _, _, heading_codes, gender_codes, ages, has_category, age_errors = _resolve(grader, table, df)
+    return _row_errors(_times(df), heading_codes, gender_codes, ages, has_category, age_errors)
+
+
+def error_summary(errors):
+    """Number of rows with each of the ROW_ERRORS, and of rows with none"""
+    summary = {name: int(np.count_nonzero(errors & flag)) for name, flag in ROW_ERRORS.items()}
+    summary['ok'] = int(np.count_nonzero(errors == 0))
+    return summary
+
+
+def grade_results(grader, df):
+    """
+    Age grade every row of a results frame.
+
+    Uses the same columns as the app: 'Distance' and 'Time', plus 'Category' or 'Age' and 'Gender'.
+    Rows with a category are graded by category, other rows by age and gender.
+    Returns a float Series aligned to df, NaN where the row cannot be graded.
+    """
+    return grade_and_validate(grader, df)[0]
+
+
+def grade_and_validate(grader, df):
+    """grade_results, with the row errors of validate_results from the same pass"""
+    start = perf_counter()
+    table = standards_table(grader)
+    times = _times(df)
+    parsed = perf_counter()
+
+    distance_codes, _, heading_codes, gender_codes, ages, has_category, age_errors = _resolve(grader, table, df)
+    graded_genders = _graded_genders(gender_codes, age_errors)
+    resolved = perf_counter()
+
+    standards = table.lookup(graded_genders, heading_codes, ages)
+    looked_up = perf_counter()
+
+    with np.errstate(invalid='ignore'):
+        grades = round_grades((standards / times) * 100)
+    computed = perf_counter()
+    errors = _row_errors(times, heading_codes, gender_codes, ages, has_category, age_errors)
+
+    if grader.stats is not None:
+        stats = grader.stats
+        for stage, seconds in (('parse', parsed - start), ('resolve', resolved - parsed),
+                               ('lookup', looked_up - resolved), ('compute', computed - looked_up),
+                               ('total', computed - start)):
+            stats.observe('batch', stage, seconds)
+        by_discipline = {
+            'rows': np.ones(len(df), dtype=bool),
+            'unknown_discipline': (heading_codes < 0) & (distance_codes >= 0),
+            'unknown_category': has_category & ((ages == -1) | (gender_codes < 0)),
+            'clamped_age': (gender_codes >= 0) & (heading_codes >= 0) & ((ages < MIN_AGE) | (ages > MAX_AGE)),
+            'failed_lookup': np.isnan(standards),
+        }
+        # By heading, as InstrumentedAgeGrader labels them, with unknown distances last
+        labels = table.headings + [UNKNOWN_LABEL]
+        label_codes = np.where(heading_codes >= 0, heading_codes, len(table.headings))
+        for name, mask in by_discipline.items():
+            counts = np.bincount(label_codes[mask], minlength=len(labels))
+            for label, count in zip(labels, counts):
+                if count:
+                    stats.count(name, label, int(count))
+
+    return pd.Series(grades, index=df.index, name='Age Grade'), errors
+
+
+# Largest (distance x person) table grade_results_deduped builds; beyond it, grade_results is used
+MAX_DEDUPED_KEYS = 1_000_000
+
+
+def _person_keys(grader, df):
+    """
+    Integer person codes for every row, -1 where there is neither a category nor an age and gender,
+    and the (gender, age) of each code. Categories are factorized; age rows are coded by the pair of
+    their factorized gender and age.
+    """
+    n = len(df)
+    codes = np.full(n, -1, dtype=np.intp)
+    persons = []
+
+    has_category = np.zeros(n, dtype=bool)
+    if 'Category' in df.columns:
+        has_category = df['Category'].notna().to_numpy()
+        category_codes, categories = pd.factorize(df['Category'], use_na_sentinel=True)
+        for category in categories:
+            if isinstance(category, str):
+                persons.append((grader._gender_from_category(category), grader._age_from_category(category)))
+            else:
+                persons.append(None)
+        codes[has_category] = category_codes[has_category]
+
+    if 'Age' in df.columns and 'Gender' in df.columns:
+        ages = pd.to_numeric(df['Age'], errors='coerce').to_numpy(dtype=float)
+        # Infinite ages are not graded, as grade_results leaves them
+        has_age = np.isfinite(ages) & ~has_category
+        gender_codes, genders = pd.factorize(df['Gender'], use_na_sentinel=True)
+        age_codes, age_values = pd.factorize(_whole_ages(ages[has_age]))
+        pair_codes = gender_codes[has_age] * len(age_values) + age_codes
+        codes[has_age] = np.where(gender_codes[has_age] >= 0, len(persons) + pair_codes, -1)
+        persons += [(gender, int(age)) for gender in genders for age in age_values]
+    return codes, persons
+
+
+def grade_results_deduped(grader, df):
+    """
+    grade_results by distinct key: factorize the distance column and the category (or gender and age)
+    columns, look up the standard once for every distinct (distance, person) with the scalar AgeGrader,
+    then broadcast the standards back to the rows with a single gather by integer codes before
+    dividing by the times. Results files have few distinct keys for their rows, so almost all of the
+    per-row work is the gather and the division. Same results as grade_results, without instrumentation.
+    """
+    times = _times(df)
+    distance_codes, distances = pd.factorize(df['Distance'], use_na_sentinel=True)
+    person_codes, persons = _person_keys(grader, df)
+    if (len(distances) + 1) * (len(persons) + 1) > MAX_DEDUPED_KEYS:
+        return grade_results(grader, df)
+
+    # The last row and column hold NaN for rows with code -1
+    standards = np.full((len(distances) + 1, len(persons) + 1), np.nan)
+    for i, distance in enumerate(distances):
+        if not isinstance(distance, str) or not grader._get_heading(distance):
+            continue
+        for j, person in enumerate(persons):
+            if person is not None:
+                standard = grader._get_standard(distance, *person)
+                if standard is not False:
+                    standards[i, j] = standard
+
+    row_standards = standards[distance_codes, person_codes]
+    with np.errstate(invalid='ignore'):
+        grades = round_grades((row_standards / times) * 100)
+    return pd.Series(grades, index=df.index, name='Age Grade')
+
+
+def age_graded_results(grader, df):
+    """
+    Age grade, age factor and age-graded time for every row of a results frame, in one pass.
+
+    Takes the same columns as grade_results and returns a frame aligned to df with float columns
+    'Age Grade', 'Age Factor' and 'Age Graded Time' (seconds), NaN where the row cannot be graded.
+    The factors and times match AgeGrader.get_age_factor and get_age_graded_time exactly.
+    """
+    table = standards_table(grader)
+    times = _times(df)
+    _, _, heading_codes, gender_codes, ages, _, age_errors = _resolve(grader, table, df)
+    gender_codes = _graded_genders(gender_codes, age_errors)
+    standards = table.lookup(gender_codes, heading_codes, ages)
+    factors = table.lookup(gender_codes, heading_codes, ages, table.factors)
+    with np.errstate(invalid='ignore'):
+        grades = round_grades((standards / times) * 100)
+    factors[np.isnan(times)] = np.nan
+    return pd.DataFrame({'Age Grade': grades, 'Age Factor': factors, 'Age Graded Time': times * factors},
+                        index=df.index)
+
+
+def grade_rows(grader, df):
+    """
+    Age grade a results frame row by row with the scalar AgeGrader methods and parse_time_value.
+
+    Takes the same columns and returns the same Series as grade_results; much slower, but it is the
+    reference the vectorised engines are checked against.
+    """
+    n = len(df)
+    missing = [None] * n
+    distances = df['Distance'].tolist()
+    times = df['Time'].tolist()
+    categories = df['Category'].tolist() if 'Category' in df.columns else missing
+    has_age = 'Age' in df.columns and 'Gender' in df.columns
+    # Numbers as grade_results takes them, whether the column was read as numbers or as text
+    ages = pd.to_numeric(df['Age'], errors='coerce').tolist() if has_age else missing
+    genders = df['Gender'].tolist() if has_age else missing
+
+    grades = np.full(n, np.nan)
+    for i in range(n):
+        seconds = parse_time_value(times[i])
+        if seconds is None or seconds <= 0 or not isinstance(distances[i], str):
+            continue
+        if isinstance(categories[i], str):
+            grade = grader.get_age_grade_by_category(distances[i], categories[i], seconds)
+        elif pd.notna(categories[i]):
+            continue
+        elif has_age and math.isfinite(ages[i]) and pd.notna(genders[i]):
+            grade = grader.get_age_grade(distances[i], genders[i], int(ages[i]), seconds)
+        else:
+            continue
+        if grade != "":
+            grades[i] = grade
+    return pd.Series(grades, index=df.index, name='Age Grade')
+
+
+class GradingJob:
+    """Grades a results frame in chunks on a background thread, with progress and cancellation."""
+
+    def __init__(self, grader, df, chunk_size=10_000):
+        self.grader = grader
+        self.df = df
+        self.chunk_size = chunk_size
+        self.rows_done = 0
+        self.result = None
+        # ROW_ERRORS flags for each row of the result
+        self.row_errors = None
+        self.error = None
+        self._cancelled = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    @property
+    def total_rows(self):
+        return len(self.df)
+
+    @property
+    def progress(self):
+        return self.rows_done / self.total_rows if self.total_rows else 1.0
+
+    @property
+    def running(self):
+        return self._thread.is_alive()
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def cancel(self):
+        self._cancelled.set()
+
+    def join(self, timeout=None):
+        self._thread.join(timeout)
+
+    def _run(self):
+        try:
+            chunks, errors = [], []
+            for start in range(0, self.total_rows, self.chunk_size):
+                if self.cancelled:
+                    return
+                grades, chunk_errors = grade_and_validate(self.grader, self.df.iloc[start:start + self.chunk_size])
+                chunks.append(grades)
+                errors.append(chunk_errors)
+                self.rows_done = min(start + self.chunk_size, self.total_rows)
+            graded = self.df.copy()
+            graded['Age Grade'] = pd.concat(chunks) if chunks else pd.Series(dtype=float)
+            self.row_errors = np.concatenate(errors) if errors else np.zeros(0, dtype=np.uint8)
+            self.result = graded
+        except Exception as e:
+            self.error = e
@@ -0,0 +1,130 @@
+"""
+A persistent cache of graded rows, so re-grading a growing results file only grades the rows that
+are new or have changed.
+
+Each row is keyed by a 64 bit hash of the inputs that decide its grade (Distance, Time, Category,
+Age and Gender), salted with the standards year and version. The inputs are normalised first, times
+to seconds, ages to numbers and text trimmed of surrounding whitespace, so '20:00' and '0:20:00'
+share a key; rows the cache grades are graded with the trimmed text, so cached and newly graded
+rows always agree. Keys and grades are kept sorted in an
+.npz file with the standards version they were graded with; a cache written with other standards
+is discarded when it is opened, so regenerated standards never serve stale grades.
+"""
+import hashlib
+import os
+
+import numpy as np
+import pandas as pd
+
+from .batch import grade_results
+from .standards import standards_version
+from .times import parse_times
+
+# The columns a row's grade depends on
+KEY_COLUMNS = ('Distance', 'Time', 'Category', 'Age', 'Gender')
+# Those that are trimmed of surrounding whitespace, for keys and grading alike
+TEXT_COLUMNS = ('Distance', 'Category', 'Gender')
+
+
+def _trimmed(column):
+    """
+    A column with surrounding whitespace stripped from its strings, as a categorical: each distinct
+    value is stripped once, and hashing it hashes each category once rather than every row
+    """
+    codes, uniques = pd.factorize(column, use_na_sentinel=True)
+    stripped = pd.Series([u.strip() if isinstance(u, str) else u for u in uniques], dtype=object)
+    category_codes, categories = pd.factorize(stripped, use_na_sentinel=True)
+    codes = np.append(category_codes, -1)[codes]
+    return pd.Series(pd.Categorical.from_codes(codes, categories), index=column.index, name=column.name)
+
+
+def _trim_text(df, categorical=False):
+    """df with its TEXT_COLUMNS trimmed, as plain columns for grading or categoricals for hashing"""
+    trimmed = {column: _trimmed(df[column]) for column in TEXT_COLUMNS if column in df.columns}
+    if not categorical:
+        trimmed = {column: values.astype(object) for column, values in trimmed.items()}
+    return df.assign(**trimmed)
+
+
+class GradeCache:
+    """Age grades of rows graded before, loaded from and saved to an .npz file"""
+
+    def __init__(self, path, year=2015):
+        self.path = path
+        self.year = year
+        self.version = standards_version()
+        stored = self._load()
+        # A missing cache, or one for other standards, is written afresh on save
+        self.stale = stored is None
+        self.keys, self.grades = stored or (np.zeros(0, dtype=np.uint64), np.zeros(0))
+        self._index = pd.Index(self.keys)
+        self._new_keys, self._new_grades = [], []
+        self.hits = 0
+        self.misses = 0
+
+    def _load(self):
+        """The stored keys and grades, or None if there is no cache or it is for other standards"""
+        try:
+            with np.load(self.path) as stored:
+                if str(stored['version']) == self.version:
+                    return stored['keys'], stored['grades']
+        except (OSError, KeyError, ValueError):
+            pass
+        return None
+
+    def row_keys(self, df):
+        """The cache key of every row of a results frame"""
+        columns = [column for column in KEY_COLUMNS if column in df.columns]
+        # hash_pandas_object takes a 16 character key; the columns are in it so that frames with different
+        # columns never share keys, and NaN and None hash alike so missing values need no normalising
+        salt = f'{self.year}:{self.version}:{",".join(columns)}'
+        hash_key = hashlib.sha256(salt.encode('utf-8')).hexdigest()[:16]
+        inputs = _trim_text(df[columns], categorical=True)
+        if 'Time' in columns:
+            inputs = inputs.assign(Time=parse_times(df['Time'])[0])
+        if 'Age' in columns:
+            inputs = inputs.assign(Age=pd.to_numeric(df['Age'], errors='coerce').astype(float))
+        return pd.util.hash_pandas_object(inputs, index=False, hash_key=hash_key).to_numpy()
+
+    def grade(self, grader, df, engine=grade_results):
+        """
+        Age grades for a results frame, as engine gives them: cached grades for rows seen before, and
+        the rest graded with engine and added to the cache. Rows graded by this call are only looked
+        up by later calls once the cache has been saved.
+        """
+        keys = self.row_keys(df)
+        positions = self._index.get_indexer(keys)
+        found = positions >= 0
+        grades = np.full(len(keys), np.nan)
+        grades[found] = self.grades[positions[found]]
+        missing = np.flatnonzero(~found)
+        if len(missing):
+            grades[missing] = engine(grader, _trim_text(df.iloc[missing])).to_numpy()
+            self._new_keys.append(keys[missing])
+            self._new_grades.append(grades[missing])
+        self.hits += len(keys) - len(missing)
+        self.misses += len(missing)
+        return pd.Series(grades, index=df.index, name='Age Grade')
+
+    def save(self):
+        """Merge the rows graded since loading into the cache file, replacing it atomically"""
+        if not self._new_keys and not self.stale:
+            return
+        keys, first = np.unique(np.concatenate([self.keys] + self._new_keys), return_index=True)
+        self.keys, self.grades = keys, np.concatenate([self.grades] + self._new_grades)[first]
+        self._index = pd.Index(self.keys)
+        self._new_keys, self._new_grades = [], []
+        self.stale = False
+        temporary = f'{self.path}.tmp'
+        with open(temporary, 'wb') as f:
+            np.savez(f, keys=self.keys, grades=self.grades, version=np.array(self.version))
+        os.replace(temporary, self.path)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.save()
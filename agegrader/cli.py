@@ -0,0 +1,222 @@
+"""
+Command line batch grading: python -m agegrader grade results.csv -o graded.csv
+and live grading of a file as it is written: python -m agegrader watch results.csv -o graded.csv
+or of a timing feed: python -m agegrader feed HOST:PORT
+
+With --window N, CSV and Parquet files are graded out of core: read N rows at a time and appended
+to the output as each window is graded, so memory stays bounded by the window size rather than the
+file size.
+"""
+import argparse
+import asyncio
+import json
+import sys
+from contextlib import nullcontext
+
+import pandas as pd
+
+from .agegrader import power_of_ten_grader
+from .batch import grade_results, grade_rows
+from .cache import GradeCache
+from .compact import compact_grader
+from .export import EXPORT_FORMATS, export_bytes
+from .feed import FeedConsumer
+from .live import POLL_INTERVAL, ResultsTail
+from .profiling import run_profiled, run_traced
+
+ENGINES = {
+    'batch': grade_results,
+    'scalar': grade_rows,
+}
+
+
+def read_results(path):
+    """Read a CSV, Excel or Parquet results file"""
+    if path.endswith('.parquet'):
+        return pd.read_parquet(path)
+    if path.endswith(('.xlsx', '.xls')):
+        return pd.read_excel(path, dtype={'Time': str})
+    return pd.read_csv(sys.stdin if path == '-' else path, dtype={'Time': str})
+
+
+def write_results(df, path):
+    """Write graded results in the format given by the file extension, or CSV to stdout for -"""
+    if path == '-':
+        df.to_csv(sys.stdout, index=False)
+        return
+    extension = path.rsplit('.', 1)[-1].lower()
+    format_name = next((name for name, f in EXPORT_FORMATS.items() if f.extension == extension), 'CSV')
+    with open(path, 'wb') as f:
+        f.write(export_bytes(df, format_name))
+
+
+def read_windows(path, window_rows):
+    """
+    Read a CSV or Parquet results file window_rows rows at a time. Parquet files are memory mapped;
+    CSV files are read through a buffer instead, as the pages of a mapped CSV stay resident once
+    parsed and the process would grow with the file.
+    """
+    if path.endswith('.parquet'):
+        import pyarrow.parquet as pq
+        with pq.ParquetFile(path, memory_map=True) as parquet:
+            for batch in parquet.iter_batches(batch_size=window_rows):
+                yield batch.to_pandas()
+        return
+    source = sys.stdin if path == '-' else path
+    # As text, so a column has the same type in every window however its values fall across them
+    with pd.read_csv(source, dtype=str, chunksize=window_rows) as reader:
+        yield from reader
+
+
+def _parquet_schema(window):
+    """
+    The Parquet schema for every window, from the first: columns with no values in it, which have no
+    type of their own, are written as strings, as CSV windows are read as text
+    """
+    import pyarrow as pa
+    schema = pa.Schema.from_pandas(window, preserve_index=False)
+    for i, field in enumerate(schema):
+        if pa.types.is_null(field.type):
+            schema = schema.set(i, field.with_type(pa.string()))
+    return schema
+
+
+def write_windows(windows, path):
+    """
+    Write graded windows to a CSV or Parquet file as each arrives, or CSV to stdout for -,
+    holding one window at a time. Returns the number of rows and of graded rows written.
+    """
+    rows = graded = 0
+    if path.endswith('.parquet'):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        writer = None
+        try:
+            for window in windows:
+                if writer is None:
+                    writer = pq.ParquetWriter(path, _parquet_schema(window))
+                writer.write_table(pa.Table.from_pandas(window, schema=writer.schema, preserve_index=False))
+                rows += len(window)
+                graded += int(window['Age Grade'].notna().sum())
+        finally:
+            if writer is not None:
+                writer.close()
+        return rows, graded
+
+    with (nullcontext(sys.stdout) if path == '-' else open(path, 'w', newline='')) as f:
+        for window in windows:
+            window.to_csv(f, header=rows == 0, index=False)
+            rows += len(window)
+            graded += int(window['Age Grade'].notna().sum())
+    return rows, graded
+
+
+def grade_file(args):
+    grader = power_of_ten_grader(args.year)
+    engine = ENGINES[args.engine]
+    if args.window and any(path.endswith(('.xlsx', '.xls')) for path in (args.input, args.output)):
+        sys.exit("Excel files cannot be graded in windows; use CSV or Parquet with --window")
+
+    cache = GradeCache(args.cache, args.year) if args.cache else None
+
+    def grade_window(df):
+        df['Age Grade'] = cache.grade(grader, df, engine) if cache is not None else engine(grader, df)
+        return df
+
+    def grade():
+        if args.window:
+            return write_windows(map(grade_window, read_windows(args.input, args.window)), args.output)
+        df = grade_window(read_results(args.input))
+        write_results(df, args.output)
+        return len(df), int(df['Age Grade'].notna().sum())
+
+    run = grade
+    if args.profile:
+        run = lambda inner=run: run_profiled(inner, args.profile)
+    # Outermost, so the tracemalloc report is not part of the profile
+    if args.trace_malloc:
+        run = lambda inner=run: run_traced(inner, args.trace_malloc)
+    rows, graded = run()
+    print(f"Graded {graded:,} of {rows:,} rows", file=sys.stderr)
+    if cache is not None:
+        cache.save()
+        print(f"{cache.hits:,} rows from the cache, {cache.misses:,} graded", file=sys.stderr)
+
+
+def watch_file(args):
+    grader = compact_grader(args.year)
+    with nullcontext(sys.stdout) if args.output == '-' else open(args.output, 'a', newline='') as output:
+        tail = ResultsTail(grader, args.input, output, args.state)
+        try:
+            tail.follow(interval=args.interval)
+        except KeyboardInterrupt:
+            pass
+    print(tail.latency_report(), file=sys.stderr)
+
+
+def consume_feed(args):
+    host, port = args.address.rsplit(':', 1)
+    consumer = FeedConsumer(compact_grader(args.year))
+
+    async def print_graded():
+        queue = consumer.subscribe()
+        feed = asyncio.create_task(consumer.run(host, int(port)))
+        while (record := await queue.get()) is not None:
+            sys.stdout.write(json.dumps(record) + '\n')
+            sys.stdout.flush()
+        await feed
+
+    try:
+        asyncio.run(print_graded())
+    except KeyboardInterrupt:
+        pass
+    print(consumer.report(), file=sys.stderr)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='python -m agegrader', description='Running age grader')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    grade = commands.add_parser('grade', help='age grade a results file',
+                                description="Age grade a CSV, Excel or Parquet results file with columns "
+                                            "Distance and Time, plus Category or Age and Gender.")
+    grade.add_argument('input', help='results file, or - for CSV on stdin')
+    grade.add_argument('-o', '--output', default='-', help='graded file (.csv, .xlsx or .parquet), default stdout')
+    grade.add_argument('--year', type=int, default=2015, help='standards year (default 2015)')
+    grade.add_argument('--engine', choices=ENGINES, default='batch',
+                       help='vectorised batch engine or the row by row scalar engine (default batch)')
+    grade.add_argument('--profile', metavar='PREFIX',
+                       help='run under cProfile, writing PREFIX.pstats and PREFIX.collapsed (flame graph stacks)')
+    grade.add_argument('--trace-malloc', type=int, nargs='?', const=10, default=0, metavar='N',
+                       help='report the top N allocation sites with tracemalloc (default 10)')
+    grade.add_argument('--window', type=int, metavar='ROWS',
+                       help='grade a CSV or Parquet file out of core, ROWS rows at a time, '
+                            'so memory is bounded by the window rather than the file')
+    grade.add_argument('--cache', metavar='PATH',
+                       help='keep grades in PATH (.npz) and grade only rows that are not already there')
+    grade.set_defaults(func=grade_file)
+
+    watch = commands.add_parser('watch', help='age grade rows as they are appended to a CSV results file',
+                                description="Follow a CSV results file that is being written, grading each "
+                                            "row as it is appended, until interrupted.")
+    watch.add_argument('input', help='CSV results file to follow')
+    watch.add_argument('-o', '--output', default='-', help='CSV file to append graded rows to, default stdout')
+    watch.add_argument('--year', type=int, default=2015, help='standards year (default 2015)')
+    watch.add_argument('--state', metavar='PATH',
+                       help='where the offset read up to is kept across restarts (default INPUT.offset)')
+    watch.add_argument('--interval', type=float, default=POLL_INTERVAL,
+                       help=f'seconds between checks for new rows (default {POLL_INTERVAL})')
+    watch.set_defaults(func=watch_file)
+
+    feed = commands.add_parser('feed', help='age grade finish records from a live timing feed',
+                               description="Connect to a timing feed sending one JSON finish record per line "
+                                           "and print each record with its age grade as a JSON line.")
+    feed.add_argument('address', help='HOST:PORT of the feed')
+    feed.add_argument('--year', type=int, default=2015, help='standards year (default 2015)')
+    feed.set_defaults(func=consume_feed)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    args.func(args)
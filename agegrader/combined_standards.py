@@ -4417,7 +4417,7 @@ STANDARDS = {
         5289.0,
         5965.0
       ],
-      "5 MIle": [
+      "5 Mile": [
         2079.0,
         2111.0,
         1932.0,
@@ -6575,7 +6575,7 @@ STANDARDS = {
         7471.0,
         8829.0
       ],
-      "5 MIle": [
+      "5 Mile": [
         2002.0,
         1911.0,
         1832.0,
@@ -0,0 +1,141 @@
+"""
+A dependency free age grader for small deployments that cannot carry numpy or pandas.
+
+CompactAgeGrader keeps each (gender, heading) standards column in an array('d') rather than a list
+of float objects, uses __slots__, and resolves disciplines and categories through lookup tables,
+precomputed for the common names and memoised for the rest. Its results are the same as AgeGrader's.
+"""
+import sys
+from array import array
+
+from .agegrader import POWER_OF_TEN_DISCIPLINE_MAP, AgeGrader
+from .standards import ARRAY_MODULE_FILE, ChecksumError, _verified_bytes, load_standards
+
+# Precomputed names: the Power of 10 disciplines and headings with their suffixes, and the usual categories
+DISCIPLINE_SUFFIXES = ('NAD', 'XC', 'MT')
+CATEGORY_PREFIXES = ('M', 'F', 'SM', 'SF', 'VM', 'VW', 'JM', 'JW')
+CATEGORY_AGES = ('', 'U13', 'U15', 'U17', 'U20', 'U23') + tuple(str(age) for age in range(35, 95, 5))
+# Names beyond the precomputed ones are remembered until a table has this many, so odd input cannot grow it
+MEMO_LIMIT = 2048
+
+_MISSING = object()
+
+
+class Grade:
+    """The outcome of one grading: grade is None when no standard was found"""
+    __slots__ = ('heading', 'gender', 'age', 'grade')
+
+    def __init__(self, heading, gender, age, grade):
+        self.heading = heading
+        self.gender = gender
+        self.age = age
+        self.grade = grade
+
+    def __repr__(self):
+        return f"Grade(heading={self.heading!r}, gender={self.gender!r}, age={self.age!r}, grade={self.grade!r})"
+
+
+class CompactAgeGrader:
+    """An AgeGrader with the same scalar grading methods, in less memory and without per-call parsing."""
+    __slots__ = ('columns', 'discipline_to_heading', 'headings', 'categories')
+
+    # Never instrumented; see instrumentation.py
+    stats = None
+
+    # The same resolution rules as AgeGrader, used to fill the tables
+    _get_heading = AgeGrader._get_heading
+    _age_from_category = AgeGrader._age_from_category
+    _gender_from_category = AgeGrader._gender_from_category
+
+    def __init__(self, standards, discipline_to_heading_map):
+        self.columns = {(gender, heading): array('d', times)
+                        for gender, by_heading in standards.items() for heading, times in by_heading.items()}
+        self.discipline_to_heading = discipline_to_heading_map
+
+        self.headings = {}
+        for name in list(discipline_to_heading_map) + list(discipline_to_heading_map.values()):
+            for suffix in ('',) + DISCIPLINE_SUFFIXES:
+                self.headings[name + suffix] = self._get_heading(name + suffix)
+
+        self.categories = {}
+        for prefix in CATEGORY_PREFIXES:
+            for age in CATEGORY_AGES:
+                self._category(prefix + age)
+        self._category('Senior')
+
+    def _heading(self, discipline):
+        heading = self.headings.get(discipline, _MISSING)
+        if heading is _MISSING:
+            heading = self._get_heading(discipline)
+            if len(self.headings) < MEMO_LIMIT:
+                self.headings[discipline] = heading
+        return heading
+
+    def _category(self, category):
+        """(gender, age) for a category"""
+        resolved = self.categories.get(category)
+        if resolved is None:
+            resolved = (self._gender_from_category(category), self._age_from_category(category))
+            if len(self.categories) < MEMO_LIMIT:
+                self.categories[category] = resolved
+        return resolved
+
+    def _standard(self, heading, gender, age):
+        """The standard in seconds for a resolved heading, or None"""
+        if not heading:
+            return None
+        column = self.columns.get((gender, heading))
+        if column is None:
+            return None
+        return column[max(5, min(100, age)) - 5]
+
+    def grade(self, discipline, gender, age, time_seconds):
+        """The Grade for a discipline, gender and age"""
+        heading = self._heading(discipline)
+        standard = self._standard(heading, gender, age)
+        grade = None if standard is None else round((standard / time_seconds) * 100, 2)
+        return Grade(heading, gender, age, grade)
+
+    def grade_by_category(self, discipline, category, time_seconds):
+        gender, age = self._category(category)
+        return self.grade(discipline, gender, age, time_seconds)
+
+    def get_age_grade(self, discipline, gender, age, time_seconds):
+        """Calculate age grading percentage, "" when there is no standard as AgeGrader gives"""
+        standard = self._standard(self._heading(discipline), gender, age)
+        if standard is None:
+            return ""
+        return round((standard / time_seconds) * 100, 2)
+
+    def get_age_grade_by_category(self, discipline, category, time_seconds):
+        gender, age = self._category(category)
+        return self.get_age_grade(discipline, gender, age, time_seconds)
+
+
+def _packed_standards(year):
+    """A year's standards as array('d') columns straight from the packed standards module"""
+    _verified_bytes(ARRAY_MODULE_FILE)
+    from .standards_array import DATA, INDEX
+
+    standards = {}
+    offset = 0
+    for column_year, gender, heading, n in INDEX:
+        if column_year == year:
+            column = array('d')
+            column.frombytes(DATA[offset * 8:(offset + n) * 8])
+            if sys.byteorder == 'big':
+                column.byteswap()
+            standards.setdefault(gender, {})[heading] = column
+        offset += n
+    if not standards:
+        raise KeyError(year)
+    return standards
+
+
+def compact_grader(year=2015):
+    """A CompactAgeGrader for Power of 10 disciplines, built without lists of floats where the packed standards exist"""
+    try:
+        standards = _packed_standards(str(year))
+    except (OSError, ImportError, ChecksumError):
+        standards = load_standards()[str(year)]
+    return CompactAgeGrader(standards, POWER_OF_TEN_DISCIPLINE_MAP)
@@ -0,0 +1,46 @@
+"""
+Serialise graded results for download.
+"""
+import hashlib
+import io
+from collections import namedtuple
+
+import pandas as pd
+
+ExportFormat = namedtuple('ExportFormat', ['extension', 'mime', 'writer'])
+
+
+def _csv_bytes(df):
+    return df.to_csv(index=False).encode('utf-8')
+
+
+def _excel_bytes(df):
+    buffer = io.BytesIO()
+    df.to_excel(buffer, index=False, engine='openpyxl')
+    return buffer.getvalue()
+
+
+def _parquet_bytes(df):
+    buffer = io.BytesIO()
+    df.to_parquet(buffer, index=False)
+    return buffer.getvalue()
+
+
+EXPORT_FORMATS = {
+    'CSV': ExportFormat('csv', 'text/csv', _csv_bytes),
+    'Excel': ExportFormat('xlsx', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet', _excel_bytes),
+    'Parquet': ExportFormat('parquet', 'application/vnd.apache.parquet', _parquet_bytes),
+}
+
+
+def frame_digest(df):
+    """A hash of a frame's columns, index and values, used as the cache key for its exports"""
+    digest = hashlib.sha256()
+    digest.update(repr(list(df.columns)).encode('utf-8'))
+    digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def export_bytes(df, format_name):
+    """Serialise df in one of the EXPORT_FORMATS"""
+    return EXPORT_FORMATS[format_name].writer(df)
@@ -0,0 +1,160 @@
+"""
+Live grading of a chip timing feed.
+
+FeedConsumer reads line-delimited JSON finish records from a TCP socket, grades each with grade_record
+and a CompactAgeGrader, whose lookup tables resolve the usual disciplines and categories without
+parsing them, and publishes the graded record to every subscriber's queue. A subscriber that falls
+behind loses its oldest records rather than holding up the feed or the other subscribers.
+
+serve_records is a stand-in feed for tests and rehearsals, sending records as a timing system would.
+"""
+import asyncio
+import json
+import time
+from collections import deque
+
+from .live import grade_record, percentile
+
+SUBSCRIBER_QUEUE_SIZE = 10_000
+# A record's send time in epoch seconds, when the feed stamps one; latency is measured from it,
+# or from when the record was read for feeds that do not
+SENT_FIELD = 'Sent'
+# Latencies kept for the report, the most recent ones
+LATENCY_WINDOW = 100_000
+
+
+class FeedConsumer:
+    """Grades finish records from a timing feed and publishes them to subscribers"""
+
+    def __init__(self, grader, queue_size=SUBSCRIBER_QUEUE_SIZE):
+        self.grader = grader
+        self.queue_size = queue_size
+        self.subscribers = []
+        self.records = 0
+        self.malformed = 0
+        self.dropped = 0
+        self.latencies = deque(maxlen=LATENCY_WINDOW)
+        self.first_received = None
+        self.last_published = None
+
+    def subscribe(self):
+        """A queue of graded records, each a dict with 'Age Grade' added (None if ungradeable), then None at the end"""
+        queue = asyncio.Queue(self.queue_size)
+        self.subscribers.append(queue)
+        return queue
+
+    def unsubscribe(self, queue):
+        self.subscribers.remove(queue)
+
+    def publish(self, record):
+        for queue in self.subscribers:
+            if queue.full():
+                queue.get_nowait()
+                self.dropped += 1
+            queue.put_nowait(record)
+
+    def handle_line(self, line, received):
+        """Grade and publish one line of the feed, read at received (epoch seconds)"""
+        try:
+            record = json.loads(line)
+        except ValueError:
+            record = None
+        if not isinstance(record, dict):
+            self.malformed += 1
+            return
+        try:
+            record['Age Grade'] = grade_record(self.grader, record)
+        except (TypeError, AttributeError, ValueError, OverflowError):
+            # A record the grader cannot take is counted, and the feed carries on
+            self.malformed += 1
+            return
+        self.publish(record)
+        sent = record.get(SENT_FIELD)
+        self.last_published = time.time()
+        self.latencies.append(self.last_published - (sent if isinstance(sent, (int, float)) else received))
+        self.records += 1
+
+    async def consume(self, reader):
+        """Grade the records from a StreamReader until the feed closes, then publish None"""
+        try:
+            while line := await self.read_line(reader):
+                received = time.time()
+                if self.first_received is None:
+                    self.first_received = received
+                if line.strip():
+                    self.handle_line(line, received)
+        finally:
+            self.publish(None)
+
+    async def read_line(self, reader):
+        """
+        The next line from a StreamReader, b'' when the feed closes. Lines longer than the reader's
+        limit are counted malformed and skipped to their newline, where readline would raise.
+        """
+        overlong = False
+        while True:
+            try:
+                line = await reader.readuntil(b'\n')
+            except asyncio.IncompleteReadError as e:
+                line = e.partial
+            except asyncio.LimitOverrunError as e:
+                # The line is left in the buffer: drop what has been read of it and read on
+                await reader.readexactly(e.consumed)
+                overlong = True
+                continue
+            if not overlong:
+                return line
+            self.malformed += 1
+            if not line.endswith(b'\n'):
+                return b''
+            overlong = False
+
+    async def run(self, host, port):
+        """Connect to a timing feed and grade its records until it closes"""
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            await self.consume(reader)
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+    @property
+    def throughput(self):
+        """Records graded per second from the first record read to the last published"""
+        if not self.records or self.last_published == self.first_received:
+            return None
+        return self.records / (self.last_published - self.first_received)
+
+    def report(self):
+        """Records graded, throughput and end-to-end latency, for the end of a feed"""
+        report = f"{self.records:,} records graded, {self.malformed:,} malformed, {self.dropped:,} dropped"
+        if self.throughput:
+            report += f"; {self.throughput:,.0f} records/s"
+        if self.latencies:
+            report += (f"; latency p50 {percentile(self.latencies, 0.5) * 1000:.1f} ms,"
+                       f" p99 {percentile(self.latencies, 0.99) * 1000:.1f} ms")
+        return report
+
+
+async def serve_records(records, host='127.0.0.1', port=0, rate=None):
+    """
+    A stand-in timing feed: an asyncio Server sending records to each connection as JSON lines
+    stamped with SENT_FIELD, rate records per second or as fast as the connection takes them for
+    None, and closing the connection after the last.
+    """
+    async def send(reader, writer):
+        start = time.perf_counter()
+        sent = 0
+        while sent < len(records):
+            due = len(records) if not rate else min(len(records), int((time.perf_counter() - start) * rate) + 1)
+            now = time.time()
+            writer.write(''.join(json.dumps({**record, SENT_FIELD: now}) + '\n'
+                                 for record in records[sent:due]).encode('utf-8'))
+            sent = due
+            await writer.drain()
+            if rate and sent < len(records):
+                await asyncio.sleep(0.001)
+        writer.close()
+        await writer.wait_closed()
+
+    return await asyncio.start_server(send, host, port)
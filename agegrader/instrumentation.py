@@ -0,0 +1,229 @@
+"""
+Optional instrumentation of grading: call and failure counters and per-stage timing histograms.
+
+Plain AgeGrader instances carry no instrumentation and pay nothing for it. instrument() returns an
+InstrumentedAgeGrader over the same standards whose scalar and batch grading record into a GraderStats.
+"""
+import threading
+from bisect import bisect_left
+from collections import defaultdict, deque
+from time import perf_counter
+
+from .agegrader import AgeGrader
+
+# Histogram bucket upper bounds in seconds
+LATENCY_BUCKETS = (1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 2.5e-3, 5e-3,
+                   0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+COUNTERS = ('calls', 'rows', 'unknown_discipline', 'unknown_category', 'clamped_age', 'failed_lookup')
+STAGES = ('parse', 'resolve', 'lookup', 'compute', 'total')
+# Scalar calls timed, one in this many; timing a call costs several clock reads and histogram
+# updates, about as much again as grading it, while counters are cheap and kept for every call
+TIMING_SAMPLE_EVERY = 16
+# The discipline label of gradings whose discipline has no standards heading, so that arbitrary
+# input cannot add labels without limit
+UNKNOWN_LABEL = 'unknown'
+
+
+class Histogram:
+    """Counts of observations per latency bucket, with their total"""
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds):
+        self.counts[bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+
+    def snapshot(self):
+        """Cumulative counts per bucket upper bound, as Prometheus histograms report them"""
+        cumulative, total = [], 0
+        for bound, count in zip(self.buckets + (float('inf'),), self.counts):
+            total += count
+            cumulative.append((bound, total))
+        return {'buckets': cumulative, 'count': self.count, 'sum': self.sum}
+
+
+class GraderStats:
+    """
+    Counters and timing histograms for one instrumented grader.
+
+    Counters are kept per discipline, labelled by its standards heading ('5 km' for '5K' and '5KXC')
+    or UNKNOWN_LABEL, so there are at most as many labels as headings. Stage timings are kept per
+    path ('scalar' or 'batch') and stage, and the total time of each scalar call also per discipline.
+    Counters count every call; scalar calls are timed one in sample_every, so their histograms hold
+    a sample of the calls.
+    """
+
+    def __init__(self, stage_timings=True, sample_every=TIMING_SAMPLE_EVERY, **labels):
+        # Per-stage histograms of scalar calls cost a few clock reads per timed call; counters and
+        # the latency of timed calls are always recorded
+        self.stage_timings = stage_timings
+        self.sample_every = sample_every
+        self.labels = {name: str(value) for name, value in labels.items()}
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            # (counter name, discipline) -> count, flat so a scalar call updates it cheaply
+            self.counters = {}
+            # (discipline, counter names) of untimed scalar calls not yet added to counters
+            self._pending = deque()
+            self.timings = defaultdict(Histogram)
+            self.latency = defaultdict(Histogram)
+
+    def count(self, name, discipline, n=1):
+        with self._lock:
+            key = name, discipline
+            self.counters[key] = self.counters.get(key, 0) + n
+
+    def observe(self, path, stage, seconds):
+        with self._lock:
+            self.timings[path, stage].observe(seconds)
+
+    def observe_latency(self, discipline, seconds):
+        with self._lock:
+            self.latency[discipline].observe(seconds)
+
+    def record_call(self, discipline, counts, stages=(), latency=None):
+        """
+        Record one scalar call under a single lock: counter names to increment and, for a timed call,
+        (stage, seconds) pairs and its latency
+        """
+        if latency is None:
+            # deque.append is atomic, so untimed calls take no lock; their counts are added in
+            # batches by the next timed call or snapshot
+            self._pending.append((discipline, counts))
+            return
+        with self._lock:
+            self._add_pending()
+            self._add_counts(discipline, counts)
+            for stage, seconds in stages:
+                self.timings['scalar', stage].observe(seconds)
+            self.latency[discipline].observe(latency)
+
+    def _add_pending(self):
+        """Add the counts of untimed calls to counters; the lock must be held"""
+        pending = self._pending
+        while pending:
+            self._add_counts(*pending.popleft())
+
+    def _add_counts(self, discipline, counts):
+        counters = self.counters
+        for name in counts:
+            key = name, discipline
+            counters[key] = counters.get(key, 0) + 1
+
+    def snapshot(self):
+        """A plain dict copy of everything recorded so far"""
+        with self._lock:
+            self._add_pending()
+            counters = {name: {} for name in COUNTERS}
+            for (name, discipline), count in self.counters.items():
+                counters[name][discipline] = count
+            timings = defaultdict(dict)
+            for (path, stage), histogram in self.timings.items():
+                timings[path][stage] = histogram.snapshot()
+            return {
+                'labels': dict(self.labels),
+                'counters': counters,
+                'timings': dict(timings),
+                'latency': {discipline: histogram.snapshot() for discipline, histogram in self.latency.items()},
+            }
+
+
+class InstrumentedAgeGrader(AgeGrader):
+    """An AgeGrader that records what each grading call does into its stats"""
+
+    def __init__(self, standards, discipline_to_heading_map, stats=None):
+        super().__init__(standards, discipline_to_heading_map)
+        self.stats = stats if stats is not None else GraderStats()
+        # Calls left until the next timed one; the first call is timed. Unlocked, so concurrent
+        # callers may shift which calls are timed, but not what is counted
+        self._until_timed = 1
+
+    def get_age_grade(self, discipline, gender, age, time_seconds):
+        if self._time_this_call():
+            return self._timed_age_grade(discipline, gender, age, time_seconds, perf_counter())
+        return self._counted_age_grade(discipline, gender, age, time_seconds, [])
+
+    def get_age_grade_by_category(self, discipline, category, time_seconds):
+        timed = self._time_this_call()
+        start = perf_counter() if timed else None
+        cat_age = self._age_from_category(category)
+        gender = self._gender_from_category(category)
+        counts = ['unknown_category'] if cat_age == -1 or gender is None else []
+        if not timed:
+            return self._counted_age_grade(discipline, gender, cat_age, time_seconds, counts)
+        stages = [('parse', perf_counter() - start)] if self.stats.stage_timings else []
+        return self._timed_age_grade(discipline, gender, cat_age, time_seconds, start, counts, stages)
+
+    def _time_this_call(self):
+        """Whether to time this scalar call: one in stats.sample_every is"""
+        self._until_timed -= 1
+        if self._until_timed > 0:
+            return False
+        self._until_timed = self.stats.sample_every
+        return True
+
+    def _count_lookup(self, heading, gender, age, standard, counts):
+        """Add the counter names for a lookup of heading's standard to counts"""
+        counts.append('calls')
+        if not heading:
+            counts.append('unknown_discipline')
+        elif gender in self.standards and not 5 <= age <= 100:
+            counts.append('clamped_age')
+        if standard is False:
+            counts.append('failed_lookup')
+
+    def _counted_age_grade(self, discipline, gender, age, time_seconds, counts):
+        """get_age_grade, counting what it does without timing it"""
+        heading = self._get_heading(discipline)
+        standard = self._standard_for_heading(heading, gender, age)
+        self._count_lookup(heading, gender, age, standard, counts)
+        self.stats.record_call(heading or UNKNOWN_LABEL, counts)
+        return self._grade(standard, time_seconds)
+
+    def _timed_age_grade(self, discipline, gender, age, time_seconds, start, counts=None, stages=None):
+        """get_age_grade, recording each stage; start is when the call began"""
+        counts = counts if counts is not None else []
+        stages = stages if stages is not None else []
+
+        resolve_start = perf_counter()
+        heading = self._get_heading(discipline)
+        lookup_start = perf_counter()
+
+        standard = self._standard_for_heading(heading, gender, age)
+        compute_start = perf_counter()
+        self._count_lookup(heading, gender, age, standard, counts)
+
+        result = self._grade(standard, time_seconds)
+        end = perf_counter()
+
+        if self.stats.stage_timings:
+            stages += [('resolve', lookup_start - resolve_start), ('lookup', compute_start - lookup_start)]
+            if standard is not False:
+                stages.append(('compute', end - compute_start))
+            stages.append(('total', end - start))
+        self.stats.record_call(heading or UNKNOWN_LABEL, counts, stages, end - start)
+        return result
+
+
+def instrument(grader, stats=None, stage_timings=True, sample_every=TIMING_SAMPLE_EVERY, **labels):
+    """
+    An instrumented copy of grader sharing its standards, timing one in sample_every scalar calls.
+
+    labels, such as year=2015, are attached to the stats and reported with them; stats given
+    already have their labels, so labels cannot be given with them.
+    """
+    if stats is not None and labels:
+        raise ValueError(f"labels {', '.join(labels)} cannot be added to existing stats; "
+                         f"give them to GraderStats instead")
+    if stats is None:
+        stats = GraderStats(stage_timings, sample_every, **labels)
+    return InstrumentedAgeGrader(grader.standards, grader.discipline_to_heading, stats)
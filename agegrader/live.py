@@ -0,0 +1,161 @@
+"""
+Live grading of results files that grow while a race finishes.
+
+ResultsTail follows a CSV that timing software appends to as runners cross the line, grading each
+complete new line and writing it out straight away. It works line by line with the csv module and a
+CompactAgeGrader rather than through pandas, as building a DataFrame costs more than grading the
+handful of rows that arrive at once. The byte offset read up to is saved after every write, so a
+restarted watch carries on where it stopped, and a file that is truncated or replaced is read again
+from its start.
+"""
+import csv
+import json
+import os
+import time
+
+from .times import parse_time_value
+
+# Most bytes read in one poll, so a long backlog is graded in steps rather than read whole
+MAX_READ_BYTES = 1 << 20
+POLL_INTERVAL = 0.001
+
+
+def _present(value):
+    return value is not None and value != ''
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _check_types(record):
+    """Raise TypeError for a field of a type no results file gives, such as a numeric category"""
+    for field in ('Distance', 'Category', 'Gender'):
+        if record.get(field) is not None and not isinstance(record[field], str):
+            raise TypeError(f"{field} must be text, not {type(record[field]).__name__}")
+    for field in ('Time', 'Age'):
+        value = record.get(field)
+        if value is not None and not isinstance(value, str) and not _is_number(value):
+            raise TypeError(f"{field} must be text or a number, not {type(value).__name__}")
+
+
+def grade_record(grader, record):
+    """
+    The age grade for one results record, a mapping with the columns grade_results uses, or None
+    where grade_results gives NaN. Empty values count as missing, as they do when pandas reads a CSV.
+    Times are read as parse_times reads them, including a number of seconds as timing feeds send it.
+    Raises TypeError for fields of the wrong type.
+    """
+    _check_types(record)
+    seconds = parse_time_value(record.get('Time'))
+    distance = record.get('Distance')
+    if seconds is None or seconds <= 0 or not distance:
+        return None
+    if _present(record.get('Category')):
+        grade = grader.get_age_grade_by_category(distance, record['Category'], seconds)
+    elif _present(record.get('Age')) and _present(record.get('Gender')):
+        try:
+            age = int(float(record['Age']))
+        except (TypeError, ValueError, OverflowError):
+            return None
+        grade = grader.get_age_grade(distance, record['Gender'], age, seconds)
+    else:
+        return None
+    return None if grade == "" else grade
+
+
+def percentile(values, fraction):
+    """The value at a fraction (0-1) of the way through the sorted values, None for no values"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class ResultsTail:
+    """Follows a growing results CSV, writing each complete appended line with its age grade"""
+
+    def __init__(self, grader, path, output, state_path=None):
+        self.grader = grader
+        self.path = path
+        self.output = output
+        self.state_path = state_path or f'{path}.offset'
+        self.offset, self.header, self.file_id = self._load_state()
+        # Set when the file was replaced, so its header line is read again
+        self._new_file = False
+        self._writer = csv.writer(output, lineterminator='\n')
+        self.rows = 0
+        # Seconds from the input's last modification to the graded rows being flushed, per poll
+        self.latencies = []
+
+    def _load_state(self):
+        try:
+            with open(self.state_path) as f:
+                state = json.load(f)
+            file_id = state.get('file')
+            return state['offset'], state['header'], tuple(file_id) if file_id else None
+        except (OSError, ValueError, KeyError):
+            return 0, None, None
+
+    def _save_state(self):
+        temporary = f'{self.state_path}.tmp'
+        with open(temporary, 'w') as f:
+            json.dump({'offset': self.offset, 'header': self.header, 'file': self.file_id}, f)
+        os.replace(temporary, self.state_path)
+
+    def poll(self):
+        """Grade and write the complete lines appended since the last poll; the number of rows written"""
+        try:
+            with open(self.path, 'rb') as f:
+                stat = os.fstat(f.fileno())
+                file_id = (stat.st_dev, stat.st_ino)
+                if stat.st_size < self.offset or self.file_id not in (None, file_id):
+                    # Truncated or replaced by a new file: start again from its header
+                    self.offset, self._new_file = 0, True
+                self.file_id = file_id
+                if stat.st_size == self.offset:
+                    return 0
+                f.seek(self.offset)
+                chunks = [f.read(MAX_READ_BYTES)]
+                # A line longer than MAX_READ_BYTES is read on to its end
+                while b'\n' not in chunks[-1] and len(chunks[-1]) == MAX_READ_BYTES:
+                    chunks.append(f.read(MAX_READ_BYTES))
+                data = b''.join(chunks)
+        except FileNotFoundError:
+            return 0
+        end = data.rfind(b'\n') + 1
+        if not end:
+            return 0
+
+        lines = data[:end].decode('utf-8').splitlines()
+        if self.header is None or self._new_file:
+            header = next(csv.reader([lines.pop(0)]))
+            # A replacement file with the same columns carries on under the header already written
+            if header != self.header:
+                self._writer.writerow(header + ['Age Grade'])
+            self.header, self._new_file = header, False
+        rows = [row for row in csv.reader(lines) if row]
+        for row in rows:
+            grade = grade_record(self.grader, dict(zip(self.header, row)))
+            self._writer.writerow(row + ['' if grade is None else grade])
+        self.output.flush()
+        self.latencies.append((time.time_ns() - stat.st_mtime_ns) / 1e9)
+
+        self.offset += end
+        self._save_state()
+        self.rows += len(rows)
+        return len(rows)
+
+    def follow(self, stop=None, interval=POLL_INTERVAL):
+        """Poll until stop (a threading.Event) is set, sleeping interval seconds whenever nothing is new"""
+        while stop is None or not stop.is_set():
+            if not self.poll():
+                time.sleep(interval)
+
+    def latency_report(self):
+        """Rows graded and the median and 99th percentile latency, for the end of a watch"""
+        report = f"{self.rows:,} rows graded"
+        if self.latencies:
+            report += (f"; latency from append to output p50 {percentile(self.latencies, 0.5) * 1000:.1f} ms,"
+                       f" p99 {percentile(self.latencies, 0.99) * 1000:.1f} ms")
+        return report
@@ -0,0 +1,118 @@
+"""
+Prometheus text exposition of grading metrics, served from a local HTTP endpoint.
+
+The metrics are read from the GraderStats of instrumented graders only when scraped, so serving
+them adds nothing to grading beyond the instrumentation itself. Everything runs offline with the
+standard library.
+"""
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+COUNTER_METRICS = {
+    'calls': ('agegrader_grading_calls_total', 'Scalar grading calls'),
+    'rows': ('agegrader_rows_graded_total', 'Rows graded by batch grading'),
+    'unknown_discipline': ('agegrader_unknown_discipline_total', 'Gradings of a discipline with no standards heading'),
+    'unknown_category': ('agegrader_unknown_category_total', 'Gradings whose category gave no age or gender'),
+    'clamped_age': ('agegrader_clamped_age_total', 'Gradings with an age outside 5-100, clamped to the range'),
+    'failed_lookup': ('agegrader_failed_lookups_total', 'Gradings that found no standard and gave no grade'),
+}
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _labels(labels):
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + '}'
+
+
+def _bound(bound):
+    return '+Inf' if bound == float('inf') else repr(bound)
+
+
+def _histogram_lines(name, labels, histogram):
+    for bound, count in histogram['buckets']:
+        yield f"{name}_bucket{_labels({**labels, 'le': _bound(bound)})} {count}"
+    yield f"{name}_sum{_labels(labels)} {histogram['sum']!r}"
+    yield f"{name}_count{_labels(labels)} {histogram['count']}"
+
+
+def render_prometheus(stats_list):
+    """Render the snapshots of several GraderStats, for instance one per standards year, as exposition text"""
+    snapshots = [stats.snapshot() for stats in stats_list]
+    lines = []
+
+    for key, (name, help_text) in COUNTER_METRICS.items():
+        lines += [f'# HELP {name} {help_text}', f'# TYPE {name} counter']
+        for snapshot in snapshots:
+            for discipline, value in sorted(snapshot['counters'][key].items()):
+                lines.append(f"{name}{_labels({**snapshot['labels'], 'discipline': discipline})} {value}")
+
+    name = 'agegrader_grading_latency_seconds'
+    lines += [f'# HELP {name} Latency of a sample of scalar grading calls', f'# TYPE {name} histogram']
+    for snapshot in snapshots:
+        for discipline, histogram in sorted(snapshot['latency'].items()):
+            lines += _histogram_lines(name, {**snapshot['labels'], 'discipline': discipline}, histogram)
+
+    name = 'agegrader_stage_seconds'
+    lines += [f'# HELP {name} Time spent in each grading stage, per scalar call or batch', f'# TYPE {name} histogram']
+    for snapshot in snapshots:
+        for path, stages in sorted(snapshot['timings'].items()):
+            for stage, histogram in sorted(stages.items()):
+                lines += _histogram_lines(name, {**snapshot['labels'], 'path': path, 'stage': stage}, histogram)
+
+    return '\n'.join(lines) + '\n'
+
+
+class MetricsServer:
+    """Serves /metrics for a list of GraderStats from a daemon thread"""
+
+    def __init__(self, stats_list, host='127.0.0.1', port=9108):
+        self.stats_list = stats_list
+        metrics_server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = render_prometheus(metrics_server.stats_list).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', CONTENT_TYPE)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def port(self):
+        return self.httpd.server_address[1]
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def serve_metrics(graders, host='127.0.0.1', port=9108):
+    """
+    Start serving the metrics of instrumented graders; port 0 picks a free port.
+
+    Instrument graders for serving with instrument(grader, stage_timings=False, year=year): the year
+    label separates standards years and skipping stage timings keeps the cost of timed calls down;
+    counters count every call and one call in sample_every is timed.
+    """
+    return MetricsServer([grader.stats for grader in graders], host, port).start()
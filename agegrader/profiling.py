@@ -0,0 +1,135 @@
+"""
+Profiling of batch grading runs: cProfile with pstats and collapsed-stack output, and tracemalloc.
+"""
+import cProfile
+import linecache
+import pstats
+import sys
+import threading
+import tracemalloc
+from collections import Counter
+
+# Functions whose share of a run is always reported, by function name
+HOT_FUNCTIONS = (
+    '_get_heading', '_get_standard', '_age_from_category', '_gender_from_category', 'parse_time',
+    'parse_time_value', 'parse_times', 'grade_results', 'grade_rows', 'lookup',
+)
+
+MAX_STACK_DEPTH = 64
+# Paths into a function that account for less than this share of the run are left out of the stacks
+MIN_STACK_SHARE = 1e-4
+
+# How often run_traced checks traced memory, and how far past its last snapshot memory must grow
+# for it to take another, so the snapshot reported is the one nearest the peak
+PEAK_POLL_SECONDS = 0.005
+PEAK_SNAPSHOT_GROWTH = 1.05
+# Allocations by the profilers and the snapshot thread, left out of the allocation sites
+PROFILER_FILES = (tracemalloc.__file__, cProfile.__file__, pstats.__file__, threading.__file__, __file__)
+
+
+def _label(func):
+    filename, line, name = func
+    if filename == '~':
+        return name
+    return f"{name} ({filename.rsplit('/', 1)[-1]}:{line})"
+
+
+def collapsed_stacks(stats):
+    """
+    Collapsed stacks ('root;caller;callee microseconds' lines) for flame graph tools, from a pstats.Stats.
+
+    cProfile only records caller/callee pairs, so a function's own time is split between the paths
+    into it in proportion to the time each caller spent calling it. Paths below MIN_STACK_SHARE of
+    the run are pruned, which keeps the walk of a large call graph bounded.
+    """
+    callees = {}
+    for func, (_, _, _, _, callers) in stats.stats.items():
+        for caller, edge in callers.items():
+            callees.setdefault(caller, {})[func] = edge[3]
+    roots = [func for func, entry in stats.stats.items() if not entry[4]]
+    stacks = Counter()
+    min_seconds = stats.total_tt * MIN_STACK_SHARE
+
+    def walk(func, path, fraction):
+        _, _, own_time, total_time, _ = stats.stats[func]
+        path = path + (func,)
+        stacks[';'.join(_label(f) for f in path)] += own_time * fraction
+        if len(path) >= MAX_STACK_DEPTH:
+            return
+        for callee, edge_time in callees.get(func, {}).items():
+            callee_total = stats.stats[callee][3]
+            if callee in path or not callee_total or fraction * edge_time < min_seconds:
+                continue
+            walk(callee, path, fraction * edge_time / callee_total)
+
+    for root in roots:
+        walk(root, (), 1.0)
+    return [f"{stack} {round(seconds * 1e6)}" for stack, seconds in stacks.items() if round(seconds * 1e6) > 0]
+
+
+def hot_function_report(stats, out=None):
+    """Print calls and time of the HOT_FUNCTIONS, to stderr by default"""
+    out = out or sys.stderr
+    total = stats.total_tt or 1
+    print(f"{'function':<28} {'calls':>10} {'own s':>9} {'cumulative s':>13} {'% of run':>9}", file=out)
+    for name in HOT_FUNCTIONS:
+        entries = [entry for func, entry in stats.stats.items() if func[2] == name]
+        calls = sum(entry[1] for entry in entries)
+        own = sum(entry[2] for entry in entries)
+        cumulative = sum(entry[3] for entry in entries)
+        print(f"{name:<28} {calls:>10,} {own:>9.3f} {cumulative:>13.3f} {cumulative / total:>9.1%}", file=out)
+
+
+def run_profiled(func, prefix, out=None):
+    """Run func under cProfile, writing prefix.pstats and prefix.collapsed, and report the hot functions"""
+    out = out or sys.stderr
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(func)
+    finally:
+        stats = pstats.Stats(profiler)
+        stats.dump_stats(f'{prefix}.pstats')
+        with open(f'{prefix}.collapsed', 'w') as f:
+            f.write('\n'.join(collapsed_stacks(stats)) + '\n')
+        print(f"\nProfile written to {prefix}.pstats and {prefix}.collapsed "
+              f"(total {stats.total_tt:.3f}s)", file=out)
+        hot_function_report(stats, out)
+
+
+def _snapshot_near_peak(stop, held):
+    """Until stop is set, snapshot traced memory whenever it grows PEAK_SNAPSHOT_GROWTH past the last snapshot"""
+    while not stop.wait(PEAK_POLL_SECONDS):
+        current, _ = tracemalloc.get_traced_memory()
+        if current > held['size'] * PEAK_SNAPSHOT_GROWTH:
+            held['snapshot'], held['size'] = tracemalloc.take_snapshot(), current
+
+
+def run_traced(func, top=10, out=None):
+    """
+    Run func under tracemalloc and report the top allocation sites by size when memory was nearest
+    its peak, rather than what is still held once func returns
+    """
+    out = out or sys.stderr
+    tracemalloc.start()
+    held = {'snapshot': None, 'size': 0}
+    stop = threading.Event()
+    watcher = threading.Thread(target=_snapshot_near_peak, args=(stop, held), daemon=True)
+    watcher.start()
+    try:
+        return func()
+    finally:
+        stop.set()
+        watcher.join()
+        current, peak = tracemalloc.get_traced_memory()
+        if held['snapshot'] is None or current > held['size']:
+            held['snapshot'], held['size'] = tracemalloc.take_snapshot(), current
+        tracemalloc.stop()
+        snapshot = held['snapshot'].filter_traces([tracemalloc.Filter(False, path) for path in PROFILER_FILES])
+        print(f"\nPeak traced memory {peak / 1e6:.1f} MB; top {top} allocation sites "
+              f"at {held['size'] / 1e6:.1f} MB, the nearest snapshot to the peak:", file=out)
+        for stat in snapshot.statistics('lineno')[:top]:
+            frame = stat.traceback[0]
+            print(f"{stat.size / 1e6:>9.2f} MB {stat.count:>9,} blocks  {frame.filename}:{frame.lineno}", file=out)
+            line = linecache.getline(frame.filename, frame.lineno).strip()
+            if line:
+                print(f"{'':>31}{line}", file=out)
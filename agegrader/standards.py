@@ -0,0 +1,106 @@
+"""
+Loading of the age grading standards.
+
+The standards are only read when a grader is first built, not when the package is imported.
+extract_standards.py writes them in several formats alongside the combined_standards module;
+load_standards uses the fastest of those that is present and readable here.
+
+The standards are validated when they are extracted, so loading only checks each file against
+the CRC recorded for it in the generated standards_manifest module.
+"""
+import io
+import marshal
+import os
+import pickle
+import warnings
+import zlib
+from functools import lru_cache
+
+STANDARDS_DIR = os.path.dirname(os.path.abspath(__file__))
+MARSHAL_FILE = 'standards.marshal'
+PICKLE_FILE = 'standards.pickle'
+NPZ_FILE = 'standards.npz'
+ARRAY_MODULE_FILE = 'standards_array.py'
+MODULE_FILE = 'combined_standards.py'
+MANIFEST_FILE = 'standards_manifest.py'
+
+
+class ChecksumError(ValueError):
+    """A standards file does not match the checksum recorded when it was generated"""
+
+
+def _verified_bytes(name):
+    from .standards_manifest import CHECKSUMS
+    with open(os.path.join(STANDARDS_DIR, name), 'rb') as f:
+        data = f.read()
+    if zlib.crc32(data) != CHECKSUMS[name]:
+        raise ChecksumError(f"{name} does not match its checksum, regenerate it with extract_standards.py")
+    return data
+
+
+def standards_version():
+    """Identifies the content of the standards, changing whenever they are regenerated with different data"""
+    from .standards_manifest import VERSION
+    return VERSION
+
+
+def _load_marshal():
+    return marshal.loads(_verified_bytes(MARSHAL_FILE))
+
+
+def _load_pickle():
+    return pickle.loads(_verified_bytes(PICKLE_FILE))
+
+
+def _load_array():
+    _verified_bytes(ARRAY_MODULE_FILE)
+    from .standards_array import standards
+    return standards()
+
+
+def _load_npz():
+    import numpy as np
+    standards = {}
+    with np.load(io.BytesIO(_verified_bytes(NPZ_FILE))) as npz:
+        for key in npz.files:
+            year, gender, heading = key.split('/', 2)
+            standards.setdefault(year, {}).setdefault(gender, {})[heading] = npz[key].tolist()
+    return standards
+
+
+def _load_module():
+    _verified_bytes(MODULE_FILE)
+    from .combined_standards import STANDARDS
+    return STANDARDS
+
+
+# Fastest first, as measured by the standards.load benchmarks; every format gives the same
+# {year: {gender: {heading: [seconds by age]}}} of str keys and lists of floats
+LOADERS = {
+    'marshal': _load_marshal,
+    'pickle': _load_pickle,
+    'array': _load_array,
+    'npz': _load_npz,
+    'module': _load_module,
+}
+
+
+def load_standards_from(format_name):
+    """The standards read from one format, uncached"""
+    return LOADERS[format_name]()
+
+
+@lru_cache(maxsize=None)
+def load_standards():
+    """All standards by year, gender and heading, loaded once on first use"""
+    for format_name, loader in LOADERS.items():
+        if format_name == 'module':
+            # The source the other formats are generated from, so its errors are raised
+            return loader()
+        try:
+            return loader()
+        except ChecksumError as e:
+            warnings.warn(str(e))
+        except (OSError, ImportError, ValueError, EOFError, pickle.UnpicklingError):
+            # Missing artifact, no numpy, or a marshal written by an incompatible Python
+            pass
@@ -0,0 +1,12 @@
+"""
+Generated by extract_standards.py: CRC32 of each standards file, checked when it loads
+"""
+VERSION = 'ef1eaeef574f41a4'
+
+CHECKSUMS = {
+    'combined_standards.py': 2331987069,
+    'standards.marshal': 1045890269,
+    'standards.pickle': 3828603424,
+    'standards.npz': 2567460948,
+    'standards_array.py': 537639871,
+}
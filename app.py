@@ -1,7 +1,28 @@
+import os
 import streamlit as st
 import pandas as pd
 from enum import Enum
-from agegrader.agegrader import power_of_ten_grader, parse_time
+from agegrader.agegrader import power_of_ten_grader
+from agegrader.batch import GradingJob, error_summary, validate_results
+from agegrader.export import EXPORT_FORMATS, export_bytes, frame_digest
+from agegrader.instrumentation import instrument
+from agegrader.metrics import serve_metrics
+from agegrader.times import parse_times
+
+PREVIEW_ROWS = 100
+STANDARDS_YEAR = 2015
+# Set to serve Prometheus metrics for the grader on this port
+METRICS_PORT = os.environ.get('AGEGRADER_METRICS_PORT')
+# and address; local only unless set, say to 0.0.0.0 for a scraper on another machine
+METRICS_HOST = os.environ.get('AGEGRADER_METRICS_HOST', '127.0.0.1')
+ROW_PROBLEMS = {
+    'unknown_discipline': 'an unknown distance',
+    'unknown_category': 'an unrecognised category',
+    'missing_gender': 'no gender',
+    'unparsable_time': 'a missing or unreadable time',
+    'out_of_range_age': 'an age outside 5-100',
+    'missing_age': 'no age or category',
+}
 
 class InputMode(Enum):
     CATEGORY = "Category"
@@ -14,9 +35,19 @@ st.set_page_config(
     layout="wide",      # "centered" (default) or "wide"
 )
 
+@st.cache_resource
+def shared_grader():
+    """One grader for every session and background grading job"""
+    grader = power_of_ten_grader(STANDARDS_YEAR)
+    if METRICS_PORT:
+        grader = instrument(grader, stage_timings=False, year=STANDARDS_YEAR)
+        serve_metrics([grader], host=METRICS_HOST, port=int(METRICS_PORT))
+    return grader
+
+
 # Initialize the age grader
 if 'age_grader' not in st.session_state:
-    st.session_state.age_grader = power_of_ten_grader()
+    st.session_state.age_grader = shared_grader()
 
 if 'input_mode' not in st.session_state:
     st.session_state.input_mode = InputMode.CATEGORY
@@ -73,41 +104,38 @@ with col1:
 # Data editor for results
 st.write("**Edit the table below** (you can add/remove rows and paste data):")
 
-if st.session_state.input_mode == InputMode.CATEGORY:
-    column_config = {
-        "Name": st.column_config.TextColumn("Runner Name"),
-        "Category": st.column_config.TextColumn("Category"),
-        "Distance": st.column_config.SelectboxColumn(
-            "Distance",
-            options=st.session_state.age_grader.discipline_to_heading.keys() ,
-            required=True
-        ),
-        "Time": st.column_config.TextColumn(
-            "Time (MM:SS or H:MM:SS)",
-            help="Format: 42:30 or 1:25:30"
-        ),
-        "Age Grade": st.column_config.TextColumn(
-            "Age Grade %",
-            disabled=True
-        )
-    }
-else:
-    column_config = {
+@st.cache_resource
+def distance_options():
+    return list(shared_grader().discipline_to_heading.keys())
+
+
+@st.cache_resource
+def column_config_for(input_mode_value):
+    """Column config for the results editor, built once per input mode"""
+    if input_mode_value == InputMode.CATEGORY.value:
+        runner_columns = {
+            "Category": st.column_config.TextColumn("Category"),
+        }
+    else:
+        runner_columns = {
+            "Age": st.column_config.NumberColumn("Age", min_value=5, max_value=100),
+            "Gender": st.column_config.SelectboxColumn(
+                'Gender',
+                options=['M', 'F'],
+                required=True
+            ),
+        }
+    return {
         "Name": st.column_config.TextColumn("Runner Name"),
-        "Age": st.column_config.NumberColumn("Age", min_value=5, max_value=100),
-        "Gender": st.column_config.SelectboxColumn(
-            'Gender',
-            options=['M', 'F'],
-            required=True
-        ),
+        **runner_columns,
         "Distance": st.column_config.SelectboxColumn(
             "Distance",
-            options=st.session_state.age_grader.discipline_to_heading.keys(),
+            options=distance_options(),
             required=True
         ),
         "Time": st.column_config.TextColumn(
             "Time (MM:SS or H:MM:SS)",
-            help="Format: 42:30 or 1:25:30"
+            help="Format: 42:30, 1:25:30, 1:25:30.4, 5130 or 1h25m30s"
         ),
         "Age Grade": st.column_config.TextColumn(
             "Age Grade %",
@@ -115,19 +143,12 @@ else:
         )
     }
 
-edited_df = st.data_editor(
-    st.session_state.results_df,
-    num_rows="dynamic",
-    use_container_width=True,
-    column_config=column_config
-)
 
-# Calculate button
-if st.button("🧮 Calculate Age Grades", type="primary"):
-    # Calculate age grades for each row
-    for idx, row in edited_df.iterrows():
-        if pd.notna(row['Time']) and row['Time'] != '':
-            time_seconds = parse_time(row['Time'])
+def grade_rows(edited_df):
+    """Calculate age grades for each row"""
+    times, _ = parse_times(edited_df['Time'])
+    for (idx, row), time_seconds in zip(edited_df.iterrows(), times):
+        if pd.notna(time_seconds):
             if time_seconds > 0:
                 # Check which columns are available to determine mode
                 if 'Category' in row and pd.notna(row['Category']):
@@ -145,27 +166,136 @@ if st.button("🧮 Calculate Age Grades", type="primary"):
                     )
                 else:
                     continue  # Skip row if missing required data
-                
-                formatted_grade = f"{age_grade:.2f}%"
+
+                # "" when there is no standard for the distance, gender and age
+                formatted_grade = f"{age_grade:.2f}%" if age_grade != "" else ""
                 edited_df.at[idx, 'Age Grade'] = formatted_grade
                 print('Graded:', row['Name'], row['Distance'], row['Time'], formatted_grade)
 
-    # Update session state
-    st.session_state.results_df = edited_df
 
-    # Display results
+def show_row_problems(row_errors):
+    """One warning summarising the rows that could not be graded, or were graded at a clamped age"""
+    summary = error_summary(row_errors)
+    problems = [f"{count:,} with {ROW_PROBLEMS[name]}" for name, count in summary.items() if name != 'ok' and count]
+    if problems:
+        st.warning("Rows with problems: " + "; ".join(problems))
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def export_payload(digest, format_name, _graded_df):
+    """Serialised results, cached by the hash of the graded frame so unchanged results are not re-serialised"""
+    return export_bytes(_graded_df, format_name)
+
+
+def download_graded(graded_df, label, key):
+    """Format picker and download button; only the selected format is ever serialised"""
+    col1, col2 = st.columns([1, 3])
+    with col1:
+        format_name = st.selectbox('Format', options=list(EXPORT_FORMATS), key=f'{key}_format',
+                                   label_visibility='collapsed')
+    export_format = EXPORT_FORMATS[format_name]
+    with col2:
+        st.download_button(
+            label=f"{label} as {format_name}",
+            data=export_payload(frame_digest(graded_df), format_name, graded_df),
+            file_name=f"age_graded_results.{export_format.extension}",
+            mime=export_format.mime,
+            key=f'{key}_download',
+            on_click="ignore"
+        )
+
+
+@st.fragment
+def graded_results(graded_df):
+    """Graded table and download, rerun on its own so downloading leaves the rest of the page alone"""
     st.subheader("📊 Results with Age Grades")
-    st.dataframe(edited_df, use_container_width=True, hide_index=True)
+    st.dataframe(graded_df, use_container_width=True, hide_index=True)
 
     # Download results
-    csv = edited_df.to_csv(index=False)
-    st.download_button(
-        label="📥 Download Results as CSV",
-        data=csv,
-        file_name="age_graded_results.csv",
-        mime="text/csv"
+    download_graded(graded_df, "📥 Download Results", key='results')
+
+
+@st.fragment
+def results_editor():
+    """Results editor and calculate button; editing a cell reruns only this fragment"""
+    edited_df = st.data_editor(
+        st.session_state.results_df,
+        num_rows="dynamic",
+        use_container_width=True,
+        column_config=column_config_for(st.session_state.input_mode.value)
     )
 
+    # Calculate button
+    if st.button("🧮 Calculate Age Grades", type="primary"):
+        grade_rows(edited_df)
+        show_row_problems(validate_results(st.session_state.age_grader, edited_df))
+
+        # Update session state
+        st.session_state.results_df = edited_df
+
+        # Display results
+        graded_results(edited_df)
+
+
+results_editor()
+
+# File upload section
+st.subheader("2. Or Upload a Results File")
+st.write("Upload a CSV or Excel file with the same columns as the table above. "
+         "Large files are graded in the background.")
+
+
+def read_results_file(uploaded_file):
+    if uploaded_file.name.lower().endswith(('.xlsx', '.xls')):
+        return pd.read_excel(uploaded_file, dtype={'Time': str})
+    return pd.read_csv(uploaded_file, dtype={'Time': str})
+
+
+uploaded_file = st.file_uploader("Results file", type=['csv', 'xlsx', 'xls'], label_visibility='collapsed')
+
+if uploaded_file is not None and st.button("🧮 Grade File"):
+    job = st.session_state.get('grading_job')
+    if job is not None:
+        job.cancel()
+    st.session_state.grading_job = GradingJob(shared_grader(), read_results_file(uploaded_file)).start()
+
+
+def grading_job_running():
+    job = st.session_state.get('grading_job')
+    return job is not None and job.running
+
+
+@st.fragment(run_every=0.5 if grading_job_running() else None)
+def grading_job_status():
+    job = st.session_state.get('grading_job')
+    if job is None:
+        return
+
+    if job.running:
+        st.progress(job.progress, text=f"Graded {job.rows_done:,} of {job.total_rows:,} rows")
+        if st.button("✖️ Cancel"):
+            job.cancel()
+        return
+
+    if job.cancelled:
+        st.warning("Grading cancelled")
+    elif job.error is not None:
+        st.error(f"Could not grade file: {job.error}")
+    elif job.result is not None:
+        graded = job.result
+        st.write(f"**Graded {len(graded):,} rows** (showing the first {min(PREVIEW_ROWS, len(graded)):,})")
+        show_row_problems(job.row_errors)
+        st.dataframe(graded.head(PREVIEW_ROWS), use_container_width=True, hide_index=True)
+        download_graded(graded, "📥 Download Graded File", key='graded_file')
+    # Stop polling once the job has finished
+    if st.session_state.get('grading_job_polling'):
+        st.session_state.grading_job_polling = False
+        st.rerun()
+
+
+st.session_state.grading_job_polling = grading_job_running()
+grading_job_status()
+
 # Instructions
 with st.expander("ℹ️ How to use this app"):
     st.markdown("""
@@ -178,7 +308,8 @@ with st.expander("ℹ️ How to use this app"):
            - **Distance**: Race distance (5K, 10K, HM, Marathon, etc.)
            - **Time**: Race time in MM:SS or H:MM:SS format (e.g., 42:30 or 1:25:30)
         3. **Calculate**: Click the button to calculate age grades
-        4. **Download**: Export results as CSV
+        4. **Download**: Export results as CSV, Excel or Parquet
+        5. **Large files**: Upload a CSV or Excel file instead of pasting, then download the graded file
 
         **Tips:**
         - You can copy/paste data from spreadsheets directly into the table
@@ -190,8 +321,7 @@ with st.expander("ℹ️ How to use this app"):
 
 # Show available distances
 with st.expander("📏 Available Distances"):
-    distances = st.session_state.age_grader.discipline_to_heading.keys()
-    st.write(", ".join(sorted(distances)))
+    st.write(", ".join(sorted(distance_options())))
 
 with st.expander("🙏 Credits"):
     st.markdown('''
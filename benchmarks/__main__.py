@@ -0,0 +1,41 @@
+"""
+Run the benchmark suite: python -m benchmarks [--quick] [--output bench_results.json]
+
+--compare checks the run against benchmarks/baseline.json and exits non-zero on regressions;
+--save-baseline stores the run as the new baseline.
+"""
+import argparse
+import sys
+
+from . import cases  # noqa: F401 registers the benchmarks
+from .compare import BASELINE_PATH, check, load, save_baseline
+from .runner import run_benchmarks, write_report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description=__doc__)
+    parser.add_argument('names', nargs='*', help='only run benchmarks whose name contains one of these')
+    parser.add_argument('--quick', action='store_true', help='skip the million row benchmarks')
+    parser.add_argument('--repeat', type=int, default=5, help='timed runs per benchmark (default 5)')
+    parser.add_argument('--output', default='bench_results.json', help="JSON results file, or - for stdout")
+    parser.add_argument('--compare', nargs='?', const=BASELINE_PATH, metavar='BASELINE',
+                        help='fail if slower than the baseline (default benchmarks/baseline.json)')
+    parser.add_argument('--save-baseline', action='store_true', help='store this run as the baseline')
+    args = parser.parse_args(argv)
+
+    baseline = load(args.compare) if args.compare else None
+    # The baseline's benchmarks by name, not every benchmark whose name contains one of them
+    exact = baseline is not None and not args.names
+    names = args.names or (list(baseline['results']) if baseline else None)
+    report = run_benchmarks(names, quick=args.quick, repeat=args.repeat, exact=exact)
+    write_report(report, args.output)
+
+    if args.save_baseline:
+        save_baseline(report)
+    if baseline:
+        print()
+        sys.exit(check(baseline, report))
+
+
+if __name__ == '__main__':
+    main()
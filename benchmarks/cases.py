@@ -0,0 +1,321 @@
+"""
+Benchmarks for the scalar, batch, import, UI and standards extraction paths.
+"""
+import marshal
+import random
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from agegrader import power_of_ten_grader
+from agegrader.agegrader import POWER_OF_TEN_DISCIPLINE_MAP, AgeGrader, format_time, parse_time
+from agegrader.batch import age_graded_results, grade_results, grade_results_deduped, grade_rows
+from agegrader.cache import GradeCache
+from agegrader.compact import CompactAgeGrader, _packed_standards, compact_grader
+from agegrader.export import export_bytes
+from agegrader.instrumentation import instrument
+from agegrader.standards import load_standards
+from agegrader.times import format_times, parse_times
+
+from .runner import benchmark, calibration_loop
+from .synthetic import PARKRUN, results_frame
+
+SCALAR_CALLS = 10_000
+CATEGORIES = ['SM', 'SF', 'M35', 'F35', 'M40', 'F40', 'M45', 'F45', 'M50', 'F50', 'M55', 'F55',
+              'M60', 'F60', 'M65', 'F65', 'M70', 'F70', 'MU17', 'FU17', 'MU20', 'FU20']
+DISCIPLINES = list(POWER_OF_TEN_DISCIPLINE_MAP)
+CALIBRATION_OPS = 1_000_000
+CALIBRATION_REPEAT = 15
+
+
+@benchmark('calibration.python_loop', min_repeat=CALIBRATION_REPEAT)
+def bench_calibration():
+    """
+    The calibration loop at length, for the machine factor of the whole run and of reports from
+    before each benchmark timed the loop alongside its own samples
+    """
+    return lambda: calibration_loop(CALIBRATION_OPS), CALIBRATION_OPS
+
+
+def _scalar_args(seed=42):
+    rng = random.Random(seed)
+    return [(rng.choice(DISCIPLINES), rng.choice('MF'), rng.randint(5, 100), rng.randint(900, 14400))
+            for _ in range(SCALAR_CALLS)]
+
+
+@benchmark('scalar.get_age_grade')
+def bench_get_age_grade():
+    grader = power_of_ten_grader()
+    args = _scalar_args()
+
+    def run():
+        for discipline, gender, age, seconds in args:
+            grader.get_age_grade(discipline, gender, age, seconds)
+    return run, len(args)
+
+
+def _instrumented_get_age_grade(stage_timings):
+    def setup():
+        grader = instrument(power_of_ten_grader(), stage_timings=stage_timings)
+        args = _scalar_args()
+
+        def run():
+            for discipline, gender, age, seconds in args:
+                grader.get_age_grade(discipline, gender, age, seconds)
+        return run, len(args)
+    return setup
+
+
+benchmark('scalar.get_age_grade.instrumented')(_instrumented_get_age_grade(True))
+# As served by the metrics endpoint: counters and the latency of sampled calls only
+benchmark('scalar.get_age_grade.metrics')(_instrumented_get_age_grade(False))
+
+
+def _scalar_get_age_grade(make_grader):
+    def setup():
+        grader = make_grader()
+        args = _scalar_args()
+
+        def run():
+            for discipline, gender, age, seconds in args:
+                grader.get_age_grade(discipline, gender, age, seconds)
+        return run, len(args)
+    return setup
+
+
+benchmark('compact.get_age_grade')(_scalar_get_age_grade(compact_grader))
+
+
+def _scalar_get_age_grade_by_category(make_grader):
+    def setup():
+        grader = make_grader()
+        rng = random.Random(42)
+        args = [(rng.choice(DISCIPLINES), rng.choice(CATEGORIES), rng.randint(900, 14400))
+                for _ in range(SCALAR_CALLS)]
+
+        def run():
+            for discipline, category, seconds in args:
+                grader.get_age_grade_by_category(discipline, category, seconds)
+        return run, len(args)
+    return setup
+
+
+benchmark('compact.get_age_grade_by_category')(_scalar_get_age_grade_by_category(compact_grader))
+
+
+@benchmark('memory.year.lists')
+def bench_year_lists():
+    """A grader and one year's standards as lists of floats; peak allocation is what it holds"""
+    blob = marshal.dumps(power_of_ten_grader(2015).standards)
+    return lambda: AgeGrader(marshal.loads(blob), POWER_OF_TEN_DISCIPLINE_MAP), 1
+
+
+@benchmark('memory.year.compact')
+def bench_year_compact():
+    """A CompactAgeGrader and one year's standards in arrays, with its precomputed tables"""
+    standards = _packed_standards('2015')
+    return lambda: CompactAgeGrader(standards, POWER_OF_TEN_DISCIPLINE_MAP), 1
+
+
+@benchmark('scalar.get_age_grade_by_category')
+def bench_get_age_grade_by_category():
+    grader = power_of_ten_grader()
+    rng = random.Random(42)
+    args = [(rng.choice(DISCIPLINES), rng.choice(CATEGORIES), rng.randint(900, 14400)) for _ in range(SCALAR_CALLS)]
+
+    def run():
+        for discipline, category, seconds in args:
+            grader.get_age_grade_by_category(discipline, category, seconds)
+    return run, len(args)
+
+
+def _time_strings(n, seed=42):
+    rng = random.Random(seed)
+    return [format_time(rng.randint(900, 14400)) for _ in range(n)]
+
+
+@benchmark('scalar.parse_time')
+def bench_parse_time():
+    strs = _time_strings(SCALAR_CALLS)
+
+    def run():
+        for s in strs:
+            parse_time(s)
+    return run, len(strs)
+
+
+@benchmark('scalar.format_time')
+def bench_format_time():
+    rng = random.Random(42)
+    seconds = [rng.uniform(900, 14400) for _ in range(SCALAR_CALLS)]
+
+    def run():
+        for s in seconds:
+            format_time(s)
+    return run, len(seconds)
+
+
+@benchmark('batch.parse_times.1m', quick=False)
+def bench_parse_times():
+    strs = _time_strings(1_000_000)
+    return lambda: parse_times(strs), len(strs)
+
+
+@benchmark('batch.format_times.1m', quick=False)
+def bench_format_times():
+    seconds = [random.Random(42).uniform(900, 14400) for _ in range(1_000_000)]
+    return lambda: format_times(seconds), len(seconds)
+
+
+@benchmark('grader.construct')
+def bench_construct():
+    """The first grader of a process: the standards are loaded afresh, not taken from the cache"""
+    def run():
+        load_standards.cache_clear()
+        power_of_ten_grader(2015)
+    return run, 1
+
+
+@benchmark('standards.load')
+def bench_standards_load():
+    """load_standards as the package loads them, from the first format that reads"""
+    def run():
+        load_standards.cache_clear()
+        load_standards()
+    return run, 1
+
+
+def _python(code):
+    return lambda: subprocess.run([sys.executable, '-c', code], check=True)
+
+
+@benchmark('import.interpreter')
+def bench_interpreter():
+    """Interpreter start up alone, to compare the import benchmarks against"""
+    return _python('pass'), 1
+
+
+@benchmark('import.agegrader')
+def bench_import():
+    return _python('import agegrader'), 1
+
+
+@benchmark('import.first_grader')
+def bench_import_first_grader():
+    """Import and build the first grader, which loads the standards"""
+    return _python('import agegrader; agegrader.power_of_ten_grader()'), 1
+
+
+@benchmark('import.app_modules')
+def bench_import_app():
+    """Everything app.py imports except streamlit itself"""
+    return _python('import agegrader.batch, agegrader.export, agegrader.times'), 1
+
+
+def _grade_frame(n):
+    def setup():
+        grader = power_of_ten_grader()
+        df = results_frame(n)
+        return lambda: grade_results(grader, df), n
+    return setup
+
+
+benchmark('batch.grade_results.1k')(_grade_frame(1_000))
+benchmark('batch.grade_results.100k')(_grade_frame(100_000))
+benchmark('batch.grade_results.1m', quick=False)(_grade_frame(1_000_000))
+
+
+def _grade_parkrun(engine):
+    def setup():
+        grader = power_of_ten_grader()
+        df = results_frame(5_000_000, disciplines=PARKRUN)
+        return lambda: engine(grader, df), len(df)
+    return setup
+
+
+# Distinct keys against per-column resolution and against resolving every row with the scalar grader
+benchmark('batch.parkrun.5m.deduped', quick=False)(_grade_parkrun(grade_results_deduped))
+benchmark('batch.parkrun.5m.grade_results', quick=False)(_grade_parkrun(grade_results))
+benchmark('batch.parkrun.5m.naive', quick=False)(_grade_parkrun(grade_rows))
+
+
+@benchmark('batch.age_graded_results.1m', quick=False)
+def bench_age_graded_results():
+    """Age grade, age factor and age-graded time columns together"""
+    grader = power_of_ten_grader()
+    df = results_frame(1_000_000)
+    return lambda: age_graded_results(grader, df), len(df)
+
+
+@benchmark('batch.cache.1m.warm', quick=False)
+def bench_cache_warm():
+    """A re-run of a graded file: load the grade cache, hash every row and look it up"""
+    grader = power_of_ten_grader()
+    df = results_frame(1_000_000)
+    path = str(Path(tempfile.mkdtemp()) / 'grades.npz')
+    with GradeCache(path) as cache:
+        cache.grade(grader, df)
+    return lambda: GradeCache(path).grade(grader, df), len(df)
+
+
+@benchmark('ui.grade_rows.1k')
+def bench_app_grade_rows():
+    """The per-row loop the app runs when Calculate is clicked"""
+    grader = power_of_ten_grader()
+    df = results_frame(1_000)
+    df['Age Grade'] = ''
+
+    def run():
+        times, _ = parse_times(df['Time'])
+        for (idx, row), seconds in zip(df.iterrows(), times):
+            age_grade = grader.get_age_grade_by_category(row['Distance'], row['Category'], seconds)
+            df.at[idx, 'Age Grade'] = f"{age_grade:.2f}%"
+    return run, len(df)
+
+
+@benchmark('ui.export_csv.100k')
+def bench_export_csv():
+    df = results_frame(100_000)
+    df['Age Grade'] = grade_results(power_of_ten_grader(), df)
+    return lambda: export_bytes(df, 'CSV'), len(df)
+
+
+STANDARDS_WORKBOOKS = sorted(str(path) for path in (Path(__file__).parent.parent / 'data').glob('*.xlsx'))
+
+
+def _read_workbooks(reader_name):
+    def setup():
+        import extract_standards
+        reader = getattr(extract_standards, reader_name)
+
+        def run():
+            for path in STANDARDS_WORKBOOKS:
+                reader(path)
+        return run, len(STANDARDS_WORKBOOKS)
+    return setup
+
+
+benchmark('extract.read_columns.streaming', quick=False)(_read_workbooks('read_columns'))
+benchmark('extract.read_columns.pandas', quick=False)(_read_workbooks('read_columns_pandas'))
+
+
+def _load_standards(format_name, cold):
+    def setup():
+        from agegrader.standards import load_standards_from
+        if cold:
+            return _python(f'from agegrader.standards import load_standards_from; '
+                           f'load_standards_from({format_name!r})'), 1
+
+        def run():
+            # Re-import generated modules each time, from their cached bytecode
+            sys.modules.pop('agegrader.combined_standards', None)
+            sys.modules.pop('agegrader.standards_array', None)
+            load_standards_from(format_name)
+        return run, 1
+    return setup
+
+
+for _format_name in ('marshal', 'pickle', 'array', 'npz', 'module'):
+    benchmark(f'standards.load.{_format_name}.cold', quick=False)(_load_standards(_format_name, cold=True))
+    benchmark(f'standards.load.{_format_name}.warm', quick=False)(_load_standards(_format_name, cold=False))
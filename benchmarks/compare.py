@@ -0,0 +1,138 @@
+"""
+Compare benchmark results against the stored baseline.
+
+python -m benchmarks.compare [results.json] [--baseline benchmarks/baseline.json]
+exits with status 1 when any benchmark is slower than its baseline by more than its tolerance.
+"""
+import argparse
+import json
+import os
+import sys
+from fnmatch import fnmatch
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), 'baseline.json')
+
+CALIBRATION = 'calibration.python_loop'
+
+# Allowed slow down as a fraction of the baseline time, by benchmark name pattern.
+# The baseline file's own "tolerances" take precedence; the first matching pattern wins.
+DEFAULT_TOLERANCES = {
+    'import.*': 0.5,
+    '*': 0.25,
+}
+
+
+def load(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def tolerance_for(name, tolerances):
+    for pattern, tolerance in tolerances.items():
+        if fnmatch(name, pattern):
+            return tolerance
+    return DEFAULT_TOLERANCES['*']
+
+
+def _seconds_per_op(result):
+    """The median time per operation, steadier than the best for a short loop, or the best for older reports"""
+    return result.get('median_seconds', result['best_seconds']) / result.get('ops', 1)
+
+
+def machine_factor(baseline, current):
+    """
+    How much slower the current machine ran the calibration workload than the baseline machine,
+    per operation, over the whole run
+    """
+    try:
+        return _seconds_per_op(current['results'][CALIBRATION]) / _seconds_per_op(baseline['results'][CALIBRATION])
+    except KeyError:
+        return 1.0
+
+
+def slow_down(base, result, factor):
+    """
+    How much slower result is than base: in calibration loop operations, timed next to each sample,
+    or in seconds scaled by the run's machine factor for reports without them
+    """
+    try:
+        return result['calibrated_seconds'] / base['calibrated_seconds'] - 1
+    except KeyError:
+        return result['best_seconds'] / (base['best_seconds'] * factor) - 1
+
+
+def compare(baseline, current):
+    """
+    Compare two reports, returning a list of (name, base_seconds, current_seconds, change, tolerance, status).
+
+    Changes are relative to the calibration loop timed with each benchmark, so a slower machine, or
+    one slowed down part way through the run, is not a regression.
+    """
+    factor = machine_factor(baseline, current)
+    tolerances = dict(baseline.get('tolerances', {}))
+    for pattern, tolerance in DEFAULT_TOLERANCES.items():
+        tolerances.setdefault(pattern, tolerance)
+    rows = []
+    for name, base in baseline['results'].items():
+        result = current['results'].get(name)
+        tolerance = tolerance_for(name, tolerances)
+        if result is None:
+            rows.append((name, base['best_seconds'], None, None, tolerance, 'missing'))
+            continue
+        change = slow_down(base, result, factor)
+        status = 'REGRESSION' if change > tolerance and name != CALIBRATION else 'ok'
+        rows.append((name, base['best_seconds'], result['best_seconds'], change, tolerance, status))
+    for name in current['results'].keys() - baseline['results'].keys():
+        rows.append((name, None, current['results'][name]['best_seconds'], None, None, 'new'))
+    return rows
+
+
+def _ms(seconds):
+    return '-' if seconds is None else f"{seconds * 1000:.4g}"
+
+
+def format_rows(rows):
+    lines = [f"{'benchmark':<40} {'baseline ms':>12} {'current ms':>12} {'change':>8} {'allowed':>8}  status"]
+    for name, base, current, change, tolerance, status in rows:
+        change_text = '-' if change is None else f"{change:+.0%}"
+        tolerance_text = '-' if tolerance is None else f"+{tolerance:.0%}"
+        lines.append(f"{name:<40} {_ms(base):>12} {_ms(current):>12} {change_text:>8} {tolerance_text:>8}  {status}")
+    return '\n'.join(lines)
+
+
+def regressions(rows):
+    return [row for row in rows if row[-1] == 'REGRESSION']
+
+
+def check(baseline, current, out=sys.stdout):
+    """Print the comparison and return the exit status: 1 if anything regressed"""
+    rows = compare(baseline, current)
+    print(f"machine speed factor {machine_factor(baseline, current):.2f} "
+          f"(changes below are adjusted by the factor measured with each benchmark)", file=out)
+    print(format_rows(rows), file=out)
+    failed = regressions(rows)
+    if failed:
+        print(f"\n{len(failed)} benchmark(s) slower than the baseline allows: "
+              f"{', '.join(row[0] for row in failed)}", file=out)
+        return 1
+    return 0
+
+
+def save_baseline(report, path=BASELINE_PATH):
+    """Store report as the baseline, keeping any tolerances already configured there"""
+    if os.path.exists(path):
+        report = {**report, 'tolerances': load(path).get('tolerances', {})}
+    with open(path, 'w') as f:
+        json.dump(report, f, indent=2)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.compare', description=__doc__)
+    parser.add_argument('results', nargs='?', default='bench_results.json')
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    args = parser.parse_args(argv)
+    sys.exit(check(load(args.baseline), load(args.results)))
+
+
+if __name__ == '__main__':
+    main()
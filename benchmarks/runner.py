@@ -0,0 +1,150 @@
+"""
+Registry and runner for the benchmark suite.
+
+A benchmark is a function that does its setup and returns (run, ops): run is the callable
+that is timed and ops the number of operations one call of run performs.
+"""
+import gc
+import json
+import platform
+import resource
+import sys
+import time
+import tracemalloc
+from collections import namedtuple
+from datetime import datetime, timezone
+
+Benchmark = namedtuple('Benchmark', ['name', 'setup', 'quick', 'min_repeat'])
+
+BENCHMARKS = {}
+
+
+def benchmark(name, quick=True, min_repeat=1):
+    """
+    Register a benchmark; quick=False leaves it out of --quick runs, and it is timed at least
+    min_repeat times however few runs are asked for
+    """
+    def register(setup):
+        BENCHMARKS[name] = Benchmark(name, setup, quick, min_repeat)
+        return setup
+    return register
+
+
+MIN_SAMPLE_SECONDS = 0.05
+# Operations in the calibration loop timed next to every sample of every benchmark
+CALIBRATION_LOOP_OPS = 200_000
+
+
+def calibration_loop(ops=CALIBRATION_LOOP_OPS):
+    """A fixed pure Python workload, whose speed stands for the speed of the machine"""
+    total = 0
+    for i in range(ops):
+        total += i % 7
+    return total
+
+
+def _calibration_sample():
+    start = time.perf_counter()
+    calibration_loop()
+    return (time.perf_counter() - start) / CALIBRATION_LOOP_OPS
+
+
+def _calls_per_sample(run):
+    """Enough calls of run that one timed sample takes at least MIN_SAMPLE_SECONDS, as timeit.autorange does"""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            run()
+        if time.perf_counter() - start >= MIN_SAMPLE_SECONDS:
+            return number
+        number *= 2
+
+
+def measure(bench, repeat=5):
+    """
+    Time one benchmark, returning a dict of its results; times are per call of run. Each sample is
+    taken straight after a run of calibration_loop, and calibrated_seconds is the best sample in
+    calibration loop operations, so compare can allow for the machine being slower while this
+    benchmark ran, not just on average.
+    """
+    run, ops = bench.setup()
+    number = _calls_per_sample(run)  # also warms up
+
+    timings, calibration = [], []
+    for _ in range(repeat):
+        gc.collect()
+        calibration.append(_calibration_sample())
+        start = time.perf_counter()
+        for _ in range(number):
+            run()
+        timings.append((time.perf_counter() - start) / number)
+
+    gc.collect()
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    timings_in_order = list(timings)
+    timings.sort()
+    best, median = timings[0], timings[len(timings) // 2]
+    return {
+        'ops': ops,
+        'repeat': repeat,
+        'number': number,
+        'best_seconds': best,
+        'median_seconds': median,
+        'ops_per_sec': ops / best if best else None,
+        'peak_alloc_bytes': peak,
+        'calibrated_seconds': min(t / c for t, c in zip(timings_in_order, calibration)),
+    }
+
+
+def _versions():
+    versions = {'python': platform.python_version()}
+    for module in ('numpy', 'pandas'):
+        try:
+            versions[module] = __import__(module).__version__
+        except ImportError:
+            versions[module] = None
+    return versions
+
+
+def _selected(bench, names, exact):
+    if not names:
+        return True
+    return bench.name in names if exact else any(name in bench.name for name in names)
+
+
+def run_benchmarks(names=None, quick=False, repeat=5, log=print, exact=False):
+    """
+    Run the selected benchmarks and return the machine readable report: those whose name contains
+    one of names, or with exact=True those named
+    """
+    results = {}
+    for bench in BENCHMARKS.values():
+        if not _selected(bench, names, exact):
+            continue
+        if quick and not bench.quick:
+            continue
+        result = measure(bench, max(repeat, bench.min_repeat))
+        results[bench.name] = result
+        log(f"{bench.name:<40} {result['ops_per_sec']:>14,.0f} ops/s "
+            f"{result['best_seconds'] * 1000:>10.2f} ms {result['peak_alloc_bytes'] / 1e6:>9.2f} MB")
+
+    return {
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'platform': platform.platform(),
+        'versions': _versions(),
+        'max_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        'results': results,
+    }
+
+
+def write_report(report, path):
+    if path == '-':
+        json.dump(report, sys.stdout, indent=2)
+        return
+    with open(path, 'w') as f:
+        json.dump(report, f, indent=2)
@@ -0,0 +1,155 @@
+"""
+Synthetic race results for load and scale testing.
+
+Times are derived from the age grading standards themselves (standard / a plausible age grade), so
+every generated row grades to a realistic percentage. Results are produced in chunks and can be
+streamed to CSV or Parquet without holding the whole set in memory.
+
+python -m benchmarks.synthetic results.csv --rows 1000000 [--mode age_gender] [--malformed 0.01]
+"""
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from agegrader import power_of_ten_grader
+from agegrader.agegrader import POWER_OF_TEN_DISCIPLINE_MAP
+from agegrader.batch import standards_table
+from agegrader.times import format_times
+
+CATEGORY = 'category'
+AGE_GENDER = 'age_gender'
+
+# Relative frequency of each discipline; every entry of POWER_OF_TEN_DISCIPLINE_MAP appears
+DISCIPLINE_WEIGHTS = {
+    'parkrun': 40, '5K': 12, '10K': 14, 'HM': 8, 'Mar': 4, '5M': 4, '10M': 3, '4M': 1, '6K': 1, '8K': 1,
+    '12K': 0.5, '15K': 0.5, '20K': 0.5, '25K': 0.3, '30K': 0.3, '50K': 0.3, '50M': 0.1, '100K': 0.1,
+    '150K': 0.05, '100M': 0.05, '200K': 0.05,
+}
+if DISCIPLINE_WEIGHTS.keys() != POWER_OF_TEN_DISCIPLINE_MAP.keys():
+    raise ValueError(f"DISCIPLINE_WEIGHTS must weight exactly the disciplines of POWER_OF_TEN_DISCIPLINE_MAP, "
+                     f"differing in {sorted(DISCIPLINE_WEIGHTS.keys() ^ POWER_OF_TEN_DISCIPLINE_MAP.keys())}")
+# A parkrun results archive: one discipline, many runners
+PARKRUN = {'parkrun': 1}
+
+MALFORMED_TIMES = ['DNF', 'abc', '1:2:3:4', '']
+MALFORMED_DISCIPLINES = ['Unknown', 'Fell', '7K']
+# Categories the graders cannot place, for want of a gender or an age
+MALFORMED_CATEGORIES = ['X45', 'U11', 'Open']
+
+
+def _categories(ages, genders, rng):
+    """Club style categories for each age and gender: U17/U20 juniors, SM/SF seniors, 5 year veteran bands"""
+    band = np.maximum(ages // 5 * 5, 35).astype(str)
+    veteran = np.char.add(genders, band)
+    # Some clubs write veteran categories as VM45 / VW45
+    old_style = rng.random(len(ages)) < 0.1
+    veteran = np.where(old_style, np.char.add(np.where(genders == 'M', 'VM', 'VW'), band), veteran)
+    junior = np.char.add(genders, np.where(ages < 17, 'U17', 'U20'))
+    senior = np.char.add('S', genders)
+    return np.where(ages < 20, junior, np.where(ages < 35, senior, veteran))
+
+
+def _malform(chunk, fraction, rng):
+    """Corrupt one field in roughly fraction of the rows"""
+    rows = np.flatnonzero(rng.random(len(chunk)) < fraction)
+    if not len(rows):
+        return
+    fields = rng.integers(0, 4, len(rows))
+    for field, column, choices in ((0, 'Time', MALFORMED_TIMES), (1, 'Distance', MALFORMED_DISCIPLINES)):
+        picked = rows[fields == field]
+        chunk.loc[chunk.index[picked], column] = rng.choice(choices, len(picked))
+    picked = rows[fields >= 2]
+    if 'Category' in chunk.columns:
+        chunk.loc[chunk.index[picked], 'Category'] = rng.choice(MALFORMED_CATEGORIES, len(picked))
+    else:
+        missing_gender, bad_age = picked[fields[fields >= 2] == 2], picked[fields[fields >= 2] == 3]
+        chunk.loc[chunk.index[missing_gender], 'Gender'] = None
+        chunk.loc[chunk.index[bad_age], 'Age'] = rng.choice([0, 2, 130, -1], len(bad_age))
+
+
+def generate_chunks(rows, chunk_size=100_000, mode=CATEGORY, malformed=0.0, seed=42, year=2015,
+                    disciplines=DISCIPLINE_WEIGHTS):
+    """
+    Yield DataFrames of synthetic results, rows in total, chunk_size at a time.
+
+    mode is CATEGORY (Name, Category, Distance, Time) or AGE_GENDER (Name, Age, Gender, Distance, Time);
+    malformed is the fraction of rows with one field corrupted; disciplines maps each discipline
+    to its relative frequency, such as PARKRUN.
+    """
+    grader = power_of_ten_grader(year)
+    table = standards_table(grader)
+    weights = np.array(list(disciplines.values()), dtype=float)
+    disciplines = np.array(list(disciplines))
+    heading_codes = np.array([table.heading_index.get(grader._get_heading(d), -1) for d in disciplines])
+    rng = np.random.default_rng(seed)
+
+    for start in range(0, rows, chunk_size):
+        n = min(chunk_size, rows - start)
+        discipline_codes = rng.choice(len(disciplines), n, p=weights / weights.sum())
+        genders = np.where(rng.random(n) < 0.55, 'M', 'F')
+        ages = np.clip(np.rint(rng.normal(42, 14, n)), 10, 90).astype(np.int64)
+        grades = np.clip(rng.normal(0.6, 0.1, n), 0.3, 0.95)
+
+        gender_codes = np.array([table.gender_index[g] for g in ('M', 'F')])[(genders == 'F').astype(int)]
+        standards = table.lookup(gender_codes, heading_codes[discipline_codes], ages)
+
+        chunk = pd.DataFrame({'Name': np.char.add('Runner ', np.arange(start, start + n).astype(str))})
+        if mode == CATEGORY:
+            chunk['Category'] = _categories(ages, genders, rng)
+        else:
+            chunk['Age'] = ages
+            chunk['Gender'] = genders
+        chunk['Distance'] = disciplines[discipline_codes]
+        chunk['Time'] = format_times(standards / grades)
+        chunk = chunk.astype({column: object for column in chunk.columns if column != 'Age'})
+        if malformed:
+            _malform(chunk, malformed, rng)
+        chunk.index = pd.RangeIndex(start, start + n)
+        yield chunk
+
+
+def results_frame(rows, **kwargs):
+    """A synthetic results frame held in memory, for benchmarks of in-memory grading"""
+    return pd.concat(generate_chunks(rows, **kwargs))
+
+
+def write_results(path, rows, chunk_size=100_000, **kwargs):
+    """Stream synthetic results to a .csv or .parquet file one chunk at a time"""
+    if path.endswith('.parquet'):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        writer = None
+        try:
+            for chunk in generate_chunks(rows, chunk_size, **kwargs):
+                batch = pa.Table.from_pandas(chunk, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(path, batch.schema)
+                writer.write_table(batch)
+        finally:
+            if writer is not None:
+                writer.close()
+    else:
+        with open(path, 'w', newline='') as f:
+            for i, chunk in enumerate(generate_chunks(rows, chunk_size, **kwargs)):
+                chunk.to_csv(f, header=i == 0, index=False)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.synthetic', description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('path', help='output .csv or .parquet file')
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--chunk-size', type=int, default=100_000)
+    parser.add_argument('--mode', choices=[CATEGORY, AGE_GENDER], default=CATEGORY)
+    parser.add_argument('--malformed', type=float, default=0.0, help='fraction of rows with a corrupted field')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--year', type=int, default=2015, help='standards year the times are derived from')
+    parser.add_argument('--parkrun', action='store_true', help='parkrun results only, instead of a mix of distances')
+    args = parser.parse_args(argv)
+    write_results(args.path, args.rows, args.chunk_size, mode=args.mode, malformed=args.malformed,
+                  seed=args.seed, year=args.year, disciplines=PARKRUN if args.parkrun else DISCIPLINE_WEIGHTS)
+
+
+if __name__ == '__main__':
+    main()
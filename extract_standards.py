@@ -1,60 +1,217 @@
 """
 Convert age grading Excel files to dictionary structure
 """
-import pandas as pd
+import hashlib
 import json
+import marshal
+import os
+import pickle
+import struct
+import zipfile
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from xml.etree import ElementTree
+
+from agegrader.agegrader import POWER_OF_TEN_DISCIPLINE_MAP
+from agegrader.standards import ARRAY_MODULE_FILE, MANIFEST_FILE, MARSHAL_FILE, NPZ_FILE, PICKLE_FILE
 
 '''
 Extracts the baseline times from XLSX sheets found here: 
 https://github.com/AlanLyttonJones/Age-Grade-Tables/tree/master
 
 Expects the files to be in the 'data' directory.
-Writes the python module agegrader.combined_standards.py which is then used in the application
+Writes the python module agegrader.combined_standards.py which is then used in the application,
+along with faster loading copies of the same data (see agegrader/standards.py)
+
+Extracted columns are cached in CACHE_DIR, keyed on the content hash of each workbook, the
+drop_leading_values setting and EXTRACTOR_VERSION, so regenerating only reads the workbooks that
+have changed.
 '''
 
-def excel_to_dict(file_path, drop_leading_values=2):
+CACHE_DIR = '.standards_cache'
+# Part of every cache key: bump it whenever a change here alters what excel_to_dict gives for a workbook
+EXTRACTOR_VERSION = 2
+
+# Ages 5 to 100
+N_AGES = 96
+GENDERS = ('M', 'F')
+# Headings every year and gender must have, as the graders look them up
+REQUIRED_HEADINGS = set(POWER_OF_TEN_DISCIPLINE_MAP.values())
+# Plus the other distances in the workbooks
+KNOWN_HEADINGS = REQUIRED_HEADINGS | {'1 Mile', '7 Mile'}
+# Headings misspelled in a workbook, and what they should be
+HEADING_CORRECTIONS = {'5 MIle': '5 Mile'}
+
+SPREADSHEET_NS = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+RELATIONSHIP_NS = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+PACKAGE_NS = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+
+# Cell strings that pd.read_excel reads as missing by default
+NA_STRINGS = {
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+    '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null',
+}
+
+
+def _column_index(cell_ref):
+    """0 based column of a cell reference like 'AB12'"""
+    index = 0
+    for char in cell_ref:
+        if not char.isalpha():
+            break
+        index = index * 26 + ord(char.upper()) - ord('A') + 1
+    return index - 1
+
+
+def _number(text):
+    value = float(text)
+    return int(value) if value.is_integer() else value
+
+
+def _shared_strings(workbook):
+    if 'xl/sharedStrings.xml' not in workbook.namelist():
+        return []
+    strings = []
+    with workbook.open('xl/sharedStrings.xml') as f:
+        for _, element in ElementTree.iterparse(f):
+            if element.tag == f'{SPREADSHEET_NS}si':
+                strings.append(''.join(t.text or '' for t in element.iter(f'{SPREADSHEET_NS}t')))
+                element.clear()
+    return strings
+
+
+def _sheet_path(workbook, sheet_index):
+    """Path within the workbook of the sheet at sheet_index, in workbook order"""
+    sheets = ElementTree.fromstring(workbook.read('xl/workbook.xml')).find(f'{SPREADSHEET_NS}sheets')
+    rel_id = sheets[sheet_index].get(f'{RELATIONSHIP_NS}id')
+    rels = ElementTree.fromstring(workbook.read('xl/_rels/workbook.xml.rels'))
+    target = next(rel.get('Target') for rel in rels.iter(f'{PACKAGE_NS}Relationship') if rel.get('Id') == rel_id)
+    return target.lstrip('/') if target.startswith('/') else f'xl/{target}'
+
+
+def _cell_value(cell, shared_strings):
+    cell_type = cell.get('t', 'n')
+    if cell_type == 'inlineStr':
+        return ''.join(t.text or '' for t in cell.iter(f'{SPREADSHEET_NS}t'))
+    value = cell.find(f'{SPREADSHEET_NS}v')
+    if value is None or value.text is None:
+        return None
+    if cell_type == 's':
+        return shared_strings[int(value.text)]
+    if cell_type == 'b':
+        return value.text == '1'
+    if cell_type in ('str', 'e'):
+        return value.text
+    return _number(value.text)
+
+
+def read_sheet_rows(file_path, sheet_index=1):
+    """
+    Yield the rows of a worksheet, from row 1, as lists of cell values with None for empty cells.
+
+    Streams the sheet XML without pandas or openpyxl. Cells give their cached values, so formulas
+    read as their last calculated result; numbers are not converted to dates.
+    """
+    with zipfile.ZipFile(file_path) as workbook:
+        shared_strings = _shared_strings(workbook)
+        with workbook.open(_sheet_path(workbook, sheet_index)) as sheet:
+            next_row = 1
+            for _, element in ElementTree.iterparse(sheet):
+                if element.tag != f'{SPREADSHEET_NS}row':
+                    continue
+                row_number = int(element.get('r', next_row))
+                for _ in range(next_row, row_number):
+                    yield []
+                row = []
+                for cell in element.iter(f'{SPREADSHEET_NS}c'):
+                    column = _column_index(cell.get('r')) if cell.get('r') else len(row)
+                    row.extend([None] * (column - len(row)))
+                    row.append(_cell_value(cell, shared_strings))
+                yield row
+                next_row = row_number + 1
+                element.clear()
+
+
+def _column_names(header, width):
+    """Column names as pd.read_excel gives them: Unnamed: i for blank headers, .1 etc. for duplicates"""
+    names = []
+    for i in range(width):
+        name = header[i] if i < len(header) and header[i] is not None else f'Unnamed: {i}'
+        unique, count = name, 0
+        while unique in names:
+            count += 1
+            unique = f'{name}.{count}'
+        names.append(unique)
+    return names
+
+
+def read_columns(file_path):
+    """Non-empty values of each column of sheet 2, under the header in its second row"""
+    rows = read_sheet_rows(file_path)
+    next(rows, None)
+    header = next(rows, [])
+    while header and header[-1] is None:
+        header.pop()
+    values = {}
+    for row in rows:
+        for i, value in enumerate(row):
+            if value is not None and not (isinstance(value, str) and value in NA_STRINGS):
+                values.setdefault(i, []).append(value)
+    names = _column_names(header, max([len(header), *(i + 1 for i in values)]))
+    return {name: values.get(i, []) for i, name in enumerate(names)}
+
+
+def read_columns_pandas(file_path):
+    """read_columns by way of pd.read_excel, which is slower and needs pandas and openpyxl"""
+    import pandas as pd
+
+    # Read from sheet 2 (index 1), skip first row like the original code
+    df = pd.read_excel(file_path, sheet_name=1, skiprows=1)
+    return {column: [value for value in df[column] if pd.notna(value) and value != ''] for column in df.columns}
+
+
+def excel_to_dict(file_path, drop_leading_values=2, reader=read_columns):
     """
     Convert Excel file (sheet 2) to dictionary structure where:
-    - Keys are distance column headers
+    - Keys are distance column headers, with HEADING_CORRECTIONS applied
     - Values are lists of times for all ages
+
+    A workbook that cannot be read raises ValueError, so it fails the build rather than giving no standards.
     """
     try:
-        # Read from sheet 2 (index 1), skip first row like the original code
-        df = pd.read_excel(file_path, sheet_name=1, skiprows=1)
-
-        result = {}
-
-        # Iterate through each column
-        for column in df.columns:
-            # Skip non-distance columns (like Age, if present)
-            if any(skip_word in str(column).lower() for skip_word in ['age', 'unnamed']):
-                continue
-
-            # Get all values in this column, excluding NaN/empty values
-            times = []
-            for value in df[column]:
-                if pd.notna(value) and value != '':
-                    try:
-                        # Convert to float if possible, otherwise keep as string
-                        times.append(float(value))
-                    except (ValueError, TypeError):
-                        times.append(str(value))
-
-            # Use column name as key
-            if times:  # Only add if we have data
-                result[str(column)] = times[drop_leading_values:]
-
-        # Print summary
-        print(f"\nProcessed {file_path}:")
-        print(f"Found {len(result)} distance columns")
-        for distance, times in result.items():
-            print(f"  {distance}: {len(times)} times")
-
-        return result
-
+        columns = reader(file_path)
     except Exception as e:
-        print(f"Error processing {file_path}: {e}")
-        return {}
+        raise ValueError(f"Error processing {file_path}: {e}") from e
+
+    result = {}
+
+    # Iterate through each column
+    for column, values in columns.items():
+        # Skip non-distance columns (like Age, if present)
+        if any(skip_word in str(column).lower() for skip_word in ['age', 'unnamed']):
+            continue
+
+        # Get all values in this column, excluding NaN/empty values
+        times = []
+        for value in values:
+            try:
+                # Convert to float if possible, otherwise keep as string
+                times.append(float(value))
+            except (ValueError, TypeError):
+                times.append(str(value))
+
+        # Use column name as key
+        if times:  # Only add if we have data
+            heading = HEADING_CORRECTIONS.get(str(column), str(column))
+            result[heading] = times[drop_leading_values:]
+
+    # Print summary
+    print(f"\nProcessed {file_path}:")
+    print(f"Found {len(result)} distance columns")
+    for distance, times in result.items():
+        print(f"  {distance}: {len(times)} times")
+
+    return result
 
 
 def extract_standard_times(standards_year, female_standards_file, male_standards_file, drop_leading_values):
@@ -85,12 +242,98 @@ def standards_for_year(year, male_standards_file, female_standards_file, drop_le
     return combined_standards
 
 
-def process_standards(*specs):
-    results = {}
+def file_digest(file_path):
+    """sha256 of a workbook's contents"""
+    with open(file_path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def cached_columns_path(cache_dir, file_path, drop_leading_values):
+    return os.path.join(cache_dir, f"{file_digest(file_path)}-{drop_leading_values}-v{EXTRACTOR_VERSION}.json")
+
+
+def extract_columns(jobs, cache_dir=CACHE_DIR):
+    """
+    Columns for each (file_path, drop_leading_values) job, read from the cache where the workbook is
+    unchanged. The remaining workbooks are extracted in parallel, one process per workbook, and cached.
+    """
+    columns = {}
+    missing = {}
+    for job in jobs:
+        path = cached_columns_path(cache_dir, *job)
+        if os.path.exists(path):
+            with open(path) as f:
+                columns[job] = json.load(f)
+            print(f"Using cached {job[0]}")
+        else:
+            missing[job] = path
+
+    if len(missing) > 1:
+        with ProcessPoolExecutor(max_workers=len(missing)) as pool:
+            extracted = dict(zip(missing, pool.map(excel_to_dict, *zip(*missing))))
+    else:
+        extracted = {job: excel_to_dict(*job) for job in missing}
+
+    os.makedirs(cache_dir, exist_ok=True)
+    for job, result in extracted.items():
+        with open(missing[job], 'w') as f:
+            json.dump(result, f)
+        columns[job] = result
+    return columns
+
+
+def _u_shaped(times):
+    """Times fall (or stay level) to the fastest age and rise (or stay level) after it"""
+    fastest = times.index(min(times))
+    return (all(a >= b for a, b in zip(times[:fastest], times[1:fastest + 1]))
+            and all(a <= b for a, b in zip(times[fastest:], times[fastest + 1:])))
+
+
+def validate(results):
+    """
+    Problems found in extracted standards, empty if there are none.
+
+    A wrong drop_leading_values shows up as the wrong number of ages, or as a distance or open
+    class value at the start of a column breaking the U-shape. Several published tables have an
+    age 5 time below age 6, so the shape is checked from age 6. Every year must have both genders
+    and every gender the REQUIRED_HEADINGS, so an empty or misread workbook is caught too.
+    """
+    problems = []
+    for year, by_gender in results.items():
+        for gender in GENDERS:
+            missing = REQUIRED_HEADINGS - set(by_gender.get(gender, {}))
+            if gender not in by_gender:
+                problems.append(f"{year} {gender}: no standards")
+            elif missing:
+                problems.append(f"{year} {gender}: missing headings {', '.join(sorted(missing))}")
+    for year, gender, heading, times in _columns(results):
+        where = f"{year} {gender} {heading}"
+        if heading not in KNOWN_HEADINGS:
+            problems.append(f"{where}: unrecognised heading")
+        if len(times) != N_AGES:
+            problems.append(f"{where}: {len(times)} ages, expected {N_AGES} (5-100)")
+        elif not all(isinstance(t, float) and t > 0 for t in times):
+            problems.append(f"{where}: times that are not positive numbers")
+        elif not _u_shaped(times[1:]):
+            problems.append(f"{where}: times do not fall to a fastest age and rise after it")
+    return problems
+
+
+def process_standards(*specs, output_name='agegrader/combined_standards.py', cache_dir=CACHE_DIR):
+    jobs = {}
     for spec in specs:
-        for_year = standards_for_year(**spec)
-        results[spec['year']] = for_year
-    write(results, 'agegrader/combined_standards.py')
+        drop = spec.get('drop_leading_values', 2)
+        jobs[spec['year']] = {'M': (spec['male_standards_file'], drop), 'F': (spec['female_standards_file'], drop)}
+    columns = extract_columns([job for year_jobs in jobs.values() for job in year_jobs.values()], cache_dir)
+    results = {year: {gender: columns[job] for gender, job in year_jobs.items()} for year, year_jobs in jobs.items()}
+    problems = validate(results)
+    if problems:
+        raise ValueError("Invalid standards, nothing written:\n" + '\n'.join(problems))
+    write(results, output_name)
+    output_dir = os.path.dirname(output_name)
+    write_artifacts(results, output_dir)
+    write_manifest(results, output_dir, [os.path.basename(output_name), MARSHAL_FILE, PICKLE_FILE, NPZ_FILE,
+                                         ARRAY_MODULE_FILE])
 
 
 def write(result, output_name):
@@ -103,6 +346,93 @@ def write(result, output_name):
         print(f"Saved to {output_name}.json")
 
 
+def _columns(standards):
+    for year, by_gender in standards.items():
+        for gender, by_heading in by_gender.items():
+            for heading, times in by_heading.items():
+                yield year, gender, heading, times
+
+
+def _array_module(standards):
+    index = []
+    data = bytearray()
+    for year, gender, heading, times in _columns(standards):
+        index.append((year, gender, heading, len(times)))
+        data += struct.pack(f'<{len(times)}d', *times)
+    index_lines = ''.join(f'    {entry!r},\n' for entry in index)
+    return f'''"""
+Generated by extract_standards.py: the standards as packed little-endian doubles
+"""
+import sys
+from array import array
+
+# (year, gender, heading, number of ages), in the order of the columns in DATA
+INDEX = [
+{index_lines}]
+
+DATA = {bytes(data)!r}
+
+
+def standards():
+    values = array('d', DATA)
+    if sys.byteorder == 'big':
+        values.byteswap()
+    result = {{}}
+    offset = 0
+    for year, gender, heading, n in INDEX:
+        result.setdefault(year, {{}}).setdefault(gender, {{}})[heading] = values[offset:offset + n].tolist()
+        offset += n
+    return result
+'''
+
+
+def _write_npz(standards, path):
+    """An npz of one array per year/gender/heading, with fixed timestamps so it regenerates identically"""
+    import numpy as np
+    with zipfile.ZipFile(path, 'w') as npz:
+        for year, gender, heading, times in _columns(standards):
+            info = zipfile.ZipInfo(f'{year}/{gender}/{heading}.npy', date_time=(1980, 1, 1, 0, 0, 0))
+            with npz.open(info, 'w') as f:
+                np.lib.format.write_array(f, np.asarray(times, dtype='<f8'))
+
+
+def write_artifacts(result, output_dir):
+    """Write the marshal, pickle, array module and npz copies of the standards that load_standards reads"""
+    standards = {str(year): by_gender for year, by_gender in result.items()}
+    with open(os.path.join(output_dir, MARSHAL_FILE), 'wb') as f:
+        marshal.dump(standards, f)
+    with open(os.path.join(output_dir, PICKLE_FILE), 'wb') as f:
+        pickle.dump(standards, f, protocol=pickle.HIGHEST_PROTOCOL)
+    with open(os.path.join(output_dir, ARRAY_MODULE_FILE), 'w') as f:
+        f.write(_array_module(standards))
+    try:
+        _write_npz(standards, os.path.join(output_dir, NPZ_FILE))
+    except ImportError:
+        print(f"numpy is not installed, not writing {NPZ_FILE}")
+    print(f"Saved {MARSHAL_FILE}, {PICKLE_FILE}, {ARRAY_MODULE_FILE} and {NPZ_FILE} to {output_dir}")
+
+
+def write_manifest(result, output_dir, file_names):
+    """Write the CRC of each generated file, which agegrader checks when loading it, and a content version"""
+    checksums = {}
+    for name in file_names:
+        path = os.path.join(output_dir, name)
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                checksums[name] = zlib.crc32(f.read())
+    version = hashlib.sha256(json.dumps(result, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+    checksum_lines = ''.join(f'    {name!r}: {crc},\n' for name, crc in checksums.items())
+    with open(os.path.join(output_dir, MANIFEST_FILE), 'w') as f:
+        f.write(f'''"""
+Generated by extract_standards.py: CRC32 of each standards file, checked when it loads
+"""
+VERSION = {version!r}
+
+CHECKSUMS = {{
+{checksum_lines}}}
+''')
+
+
 if __name__ == "__main__":
     '''
     settings for each year's standards:
@@ -0,0 +1,20 @@
+import pytest
+
+
+def pytest_addoption(parser):
+    parser.addoption('--benchmarks', action='store_true',
+                     help='also run the tests marked benchmark, which assert timing and memory bounds')
+
+
+def pytest_configure(config):
+    config.addinivalue_line('markers', 'benchmark: asserts a timing or memory bound that a loaded machine can miss; '
+                                       'run with --benchmarks')
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption('--benchmarks'):
+        return
+    skip = pytest.mark.skip(reason='timing or memory bound: run with --benchmarks')
+    for item in items:
+        if item.get_closest_marker('benchmark'):
+            item.add_marker(skip)
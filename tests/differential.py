@@ -0,0 +1,141 @@
+"""
+Differential harness: every optimised grading engine must give exactly what AgeGrader.get_age_grade
+and get_age_grade_by_category give, including "" (NaN here) for failed lookups, clamping of ages to
+5-100 and rounding to 2 places.
+
+Engines come in two kinds. GRADER_ENGINES build, from a plain AgeGrader, an object with the same
+scalar methods. FRAME_ENGINES grade a whole results frame like batch.grade_results. New engines are
+added to these registries.
+"""
+import math
+import random
+
+import numpy as np
+import pandas as pd
+
+from agegrader.agegrader import POWER_OF_TEN_DISCIPLINE_MAP, format_time
+from agegrader.batch import grade_results, grade_results_deduped, grade_rows
+from agegrader.compact import CompactAgeGrader
+from agegrader.instrumentation import instrument
+from agegrader.times import format_times, parse_times
+
+GRADER_ENGINES = {
+    'instrumented': instrument,
+    'instrumented_counters_only': lambda grader: instrument(grader, stage_timings=False),
+    'compact': lambda grader: CompactAgeGrader(grader.standards, grader.discipline_to_heading),
+}
+
+FRAME_ENGINES = {
+    'batch': grade_results,
+    'scalar_rows': grade_rows,
+    'deduped': grade_results_deduped,
+    'instrumented_batch': lambda grader, df: grade_results(instrument(grader), df),
+}
+
+GENDERS = ['M', 'F', 'X']
+AGES = list(range(-2, 104))
+# Ages only results frames have: not graded when infinite or missing, and clamped when huge
+ODD_AGES = [math.inf, -math.inf, math.nan, 1e300, -1e300, 40.7]
+CATEGORY_PREFIXES = ['M', 'F', 'V', 'VM', 'VW', 'SM', 'SF', 'SW', 'JM', 'JW', 'JF', 'JG', 'JB', 'W', 'X', 'S', 'U']
+CATEGORY_SUFFIXES = ['', '17', 'U17', 'U20', '35', '40', '45', '55', '70', '85', '99', '100', '120', '4', 'enior', 'X']
+
+
+def disciplines():
+    """Every Power of 10 discipline, with suffixes, plus spreadsheet headings and unknown names"""
+    names = list(POWER_OF_TEN_DISCIPLINE_MAP)
+    names += [name + suffix for name in ('5K', '10K', 'HM', 'Mar') for suffix in ('NAD', 'XC', 'MT', 'XCNAD')]
+    names += sorted(set(POWER_OF_TEN_DISCIPLINE_MAP.values())) + ['1 Mile', '7 Mile']
+    names += ['Fell', '5k', 'NAD', '']
+    return names
+
+
+def grades(results):
+    """Engine results as floats with NaN for the "" sentinel"""
+    return np.array([np.nan if grade == "" else grade for grade in results], dtype=float)
+
+
+def age_gender_cases(seed=0):
+    """Every (discipline, gender, age) with a random whole-second time"""
+    rng = random.Random(seed)
+    rows = [(d, g, a, rng.randint(600, 30000)) for d in disciplines() for g in GENDERS for a in AGES]
+    return pd.DataFrame(rows, columns=['Distance', 'Gender', 'Age', 'Seconds'])
+
+
+def category_cases(n=5000, seed=0):
+    """Random category strings, many of them malformed, with random disciplines and times"""
+    rng = random.Random(seed)
+    names = disciplines()
+    rows = [(rng.choice(names), rng.choice(CATEGORY_PREFIXES) + rng.choice(CATEGORY_SUFFIXES), rng.randint(600, 30000))
+            for _ in range(n)]
+    rows += [(rng.choice(names), 'Senior', rng.randint(600, 30000)) for _ in range(20)]
+    return pd.DataFrame(rows, columns=['Distance', 'Category', 'Seconds'])
+
+
+def odd_age_cases(seed=0):
+    """Every (discipline, gender) with each of ODD_AGES, for FRAME_ENGINES"""
+    rng = random.Random(seed)
+    rows = [(d, g, a, rng.randint(600, 30000)) for d in disciplines() for g in GENDERS for a in ODD_AGES]
+    return pd.DataFrame(rows, columns=['Distance', 'Gender', 'Age', 'Seconds'])
+
+
+def fractional_times(cases, seed=0):
+    """The same cases with random fractional second times, for engines that take seconds directly"""
+    rng = np.random.default_rng(seed)
+    return cases.assign(Seconds=rng.uniform(60, 40000, len(cases)))
+
+
+def reference_grades(grader, cases):
+    """What the plain scalar AgeGrader gives for each case"""
+    if 'Category' in cases.columns:
+        return grades(grader.get_age_grade_by_category(d, c, t)
+                       for d, c, t in zip(cases['Distance'], cases['Category'], cases['Seconds']))
+    return grades(grader.get_age_grade(d, g, int(a), t) if math.isfinite(a) else ""
+                   for d, g, a, t in zip(cases['Distance'], cases['Gender'], cases['Age'], cases['Seconds']))
+
+
+def reference_age_graded(grader, cases):
+    """(age factors, age-graded times) from the plain scalar AgeGrader for each case"""
+    if 'Category' in cases.columns:
+        rows = [(grader.get_age_factor_by_category(d, c), grader.get_age_graded_time_by_category(d, c, t))
+                for d, c, t in zip(cases['Distance'], cases['Category'], cases['Seconds'])]
+    else:
+        rows = [(grader.get_age_factor(d, g, a), grader.get_age_graded_time(d, g, a, t))
+                for d, g, a, t in zip(cases['Distance'], cases['Gender'], cases['Age'], cases['Seconds'])]
+    return grades(factor for factor, _ in rows), grades(time for _, time in rows)
+
+
+def as_results_frame(cases):
+    """Cases as a results frame for FRAME_ENGINES, times written as H:MM:SS / MM:SS"""
+    return cases.drop(columns='Seconds').assign(Time=[format_time(t) for t in cases['Seconds']])
+
+
+def as_varied_results_frame(cases, seed=0):
+    """
+    Cases as a results frame with times to the tenth of a second written in each format parse_times
+    takes, and for age and gender cases the odd_age_cases too. Returns (cases, frame), the cases'
+    Seconds being the times as they parse.
+    """
+    if 'Age' in cases.columns:
+        cases = pd.concat([cases, odd_age_cases(seed)], ignore_index=True)
+    rng = np.random.default_rng(seed)
+    tenths = np.round(rng.uniform(60, 40000, len(cases)), 1)
+    spellings = [
+        format_times(tenths, decimals=1),
+        [f'{s:.1f}' for s in tenths],
+        [f'{int(s // 3600)}h{int(s % 3600 // 60)}m{s % 60:.1f}s' for s in tenths],
+        [format_time(s) for s in np.trunc(tenths)],
+    ]
+    choice = rng.integers(0, len(spellings), len(cases))
+    times = [spellings[c][i] for i, c in enumerate(choice)]
+    frame = cases.drop(columns='Seconds').assign(Time=times)
+    return cases.assign(Seconds=parse_times(frame['Time'])[0]), frame
+
+
+def mismatches(cases, expected, actual, limit=10):
+    """A readable list of the rows where actual differs from expected"""
+    differ = ~((expected == actual) | (np.isnan(expected) & np.isnan(actual)))
+    rows = np.flatnonzero(differ)
+    report = [f"{dict(cases.iloc[i])}: expected {expected[i]!r}, got {actual[i]!r}" for i in rows[:limit]]
+    if len(rows) > limit:
+        report.append(f"... and {len(rows) - limit} more")
+    return report
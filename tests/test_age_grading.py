@@ -39,3 +39,36 @@ def test_age_grading(grader, age, gender, distance, time, expected_grade):
     grade = grader.get_age_grade(distance, gender, age, time)
     assert grade == expected_grade
 
+
+@pytest.mark.parametrize('year, expected_grade', [(2015, 74.17), (2025, 73.28)])
+def test_5_mile_grading_every_year(year, expected_grade):
+    # The 2025 workbooks spell the heading '5 MIle'
+    assert power_of_ten_grader(year).get_age_grade('5M', 'M', 40, hms_to_s(m=30)) == expected_grade
+    assert power_of_ten_grader(year).get_age_grade_by_category('5M', 'M45', hms_to_s(m=32, s=24)) != ""
+
+
+def test_age_factor_is_one_for_open_class_ages(grader):
+    assert grader.get_age_factor('5K', 'M', 25) == 1.0
+    assert grader.get_age_factor_by_category('5K', 'SM') == 1.0
+
+
+def test_age_factor_uses_clamped_age(grader):
+    assert grader.get_age_factor('5K', 'M', 5) == 779 / 1286
+    assert grader.get_age_factor('5K', 'M', 2) == 779 / 1286
+
+
+def test_age_factor_unknown_discipline(grader):
+    assert grader.get_age_factor('Fell', 'M', 40) == ""
+    assert grader.get_age_graded_time('Fell', 'M', 40, 1200) == ""
+
+
+@pytest.mark.parametrize('age, gender, distance, time, expected_grade', AGE_AND_GENDER_RESULTS)
+def test_age_graded_time_gives_age_grade(grader, age, gender, distance, time, expected_grade):
+    graded_time = grader.get_age_graded_time(distance, gender, age, time)
+    open_standard = min(grader.standards[gender][grader._get_heading(distance)])
+    assert round(open_standard / graded_time * 100, 2) == expected_grade
+
+
+def test_age_graded_time_by_category(grader):
+    time = hms_to_s(m=32, s=24)
+    assert grader.get_age_graded_time_by_category('5M', 'M45', time) == grader.get_age_graded_time('5M', 'M', 45, time)
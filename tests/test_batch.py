@@ -0,0 +1,150 @@
+import warnings
+
+import pandas as pd
+import pytest
+from agegrader import power_of_ten_grader
+from agegrader import batch
+from agegrader.batch import (grade_results, grade_results_deduped, grade_and_validate, error_summary, validate_results, GradingJob,
+                             MISSING_AGE, MISSING_GENDER, OUT_OF_RANGE_AGE, UNKNOWN_CATEGORY, UNKNOWN_DISCIPLINE, UNPARSABLE_TIME)
+from tests.test_age_grading import SUMMER_LEAGUE_5M_RESULTS, AGE_AND_GENDER_RESULTS
+
+
+@pytest.fixture
+def grader():
+    return power_of_ten_grader()
+
+
+def to_time_str(seconds):
+    return f"{seconds // 3600}:{seconds // 60 % 60:02d}:{seconds % 60:02d}"
+
+
+def test_grade_by_category(grader):
+    df = pd.DataFrame({
+        'Category': [category for category, _, _ in SUMMER_LEAGUE_5M_RESULTS],
+        'Distance': '5M',
+        'Time': [to_time_str(time) for _, time, _ in SUMMER_LEAGUE_5M_RESULTS],
+    })
+    grades = grade_results(grader, df)
+    assert grades.tolist() == [expected for _, _, expected in SUMMER_LEAGUE_5M_RESULTS]
+
+
+def test_grade_by_age_and_gender(grader):
+    df = pd.DataFrame({
+        'Age': [age for age, *_ in AGE_AND_GENDER_RESULTS],
+        'Gender': [gender for _, gender, *_ in AGE_AND_GENDER_RESULTS],
+        'Distance': [distance for _, _, distance, *_ in AGE_AND_GENDER_RESULTS],
+        'Time': [to_time_str(time) for *_, time, _ in AGE_AND_GENDER_RESULTS],
+    })
+    grades = grade_results(grader, df)
+    assert grades.tolist() == [expected for *_, expected in AGE_AND_GENDER_RESULTS]
+
+
+def test_ungradable_rows_are_nan(grader):
+    df = pd.DataFrame({
+        'Category': ['M45', 'X45', None, 'F40'],
+        'Distance': ['Unknown', '5K', '5K', '5K'],
+        'Time': ['20:00', '20:00', '20:00', 'abc'],
+    })
+    assert grade_results(grader, df).isna().all()
+
+
+def test_grading_job_matches_single_pass(grader):
+    df = pd.DataFrame({
+        'Category': ['M45', 'F35', 'SM', 'FU17'] * 25,
+        'Distance': ['5K', '10K', 'HM', 'parkrun'] * 25,
+        'Time': ['20:00', '45:10', '1:30:00', '25:00'] * 25,
+    })
+    job = GradingJob(grader, df, chunk_size=7).start()
+    job.join()
+    assert job.error is None
+    assert job.progress == 1.0
+    assert job.result['Age Grade'].tolist() == grade_results(grader, df).tolist()
+    assert job.row_errors.tolist() == validate_results(grader, df).tolist()
+
+
+def test_cancelled_job_has_no_result(grader):
+    df = pd.DataFrame({'Category': ['M45'] * 100, 'Distance': '5K', 'Time': '20:00'})
+    job = GradingJob(grader, df, chunk_size=1)
+    job.cancel()
+    job.start().join()
+    assert job.cancelled
+    assert job.result is None
+
+
+def test_row_errors(grader):
+    df = pd.DataFrame({
+        'Category': ['M45', 'M45', 'Q', 'X45', 'M45', 'M45', 'M120', None, None, None],
+        'Age': [None] * 7 + [3, 40, None],
+        'Gender': [None] * 7 + ['F', 'Z', None],
+        'Distance': ['5K', 'Fell', '5K', '5K', '5K', None, '5K', '5K', '5K', '5K'],
+        'Time': ['20:00', '20:00', '20:00', '20:00', 'abc', '20:00', '20:00', '20:00', '0', None],
+    })
+    assert validate_results(grader, df).tolist() == [
+        0,
+        UNKNOWN_DISCIPLINE,
+        UNKNOWN_CATEGORY | MISSING_GENDER,
+        MISSING_GENDER,
+        UNPARSABLE_TIME,
+        UNKNOWN_DISCIPLINE,
+        OUT_OF_RANGE_AGE,
+        OUT_OF_RANGE_AGE,
+        MISSING_GENDER | UNPARSABLE_TIME,
+        MISSING_GENDER | UNPARSABLE_TIME | MISSING_AGE,
+    ]
+
+
+def test_infinite_and_huge_ages(grader):
+    df = pd.DataFrame({'Age': ['inf', '-inf', 1e300, 100], 'Gender': 'M', 'Distance': '5K', 'Time': '20:00'})
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        grades, errors = grade_and_validate(grader, df)
+        deduped = grade_results_deduped(grader, df)
+    assert errors.tolist() == [OUT_OF_RANGE_AGE, OUT_OF_RANGE_AGE, OUT_OF_RANGE_AGE, 0]
+    # Infinite ages are not graded; a finite age clamps to 100, as AgeGrader clamps it
+    assert grades.isna().tolist() == [True, True, False, False]
+    assert grades[2] == grades[3] == grader.get_age_grade('5K', 'M', 100, 1200)
+    assert deduped.tolist()[2:] == grades.tolist()[2:] and deduped[:2].isna().all()
+
+
+def test_missing_age_is_not_reported_as_missing_gender(grader):
+    df = pd.DataFrame({'Age': [None, 'forty', 40], 'Gender': 'M', 'Distance': '5K', 'Time': '20:00'})
+    grades, errors = grade_and_validate(grader, df)
+    assert errors.tolist() == [MISSING_AGE, MISSING_AGE, 0]
+    assert grades.isna().tolist() == [True, True, False]
+    assert error_summary(errors)['missing_gender'] == 0
+
+
+def test_row_errors_come_with_grades(grader):
+    df = pd.DataFrame({'Category': ['M45', 'MX', 'M101'], 'Distance': '5K', 'Time': '20:00'})
+    grades, errors = grade_and_validate(grader, df)
+    assert grades.tolist() == grade_results(grader, df).tolist()
+    assert errors.tolist() == validate_results(grader, df).tolist() == [0, UNKNOWN_CATEGORY, OUT_OF_RANGE_AGE]
+    # Clamped ages are still graded, as AgeGrader does
+    assert grades.notna().all()
+
+
+def test_error_summary(grader):
+    df = pd.DataFrame({'Category': ['M45', 'M45', 'Q', None], 'Distance': ['5K', 'Fell', '5K', '5K'], 'Time': '20:00'})
+    assert error_summary(validate_results(grader, df)) == {
+        'unknown_discipline': 1, 'unknown_category': 1, 'missing_gender': 2, 'unparsable_time': 0,
+        'out_of_range_age': 0, 'missing_age': 1, 'ok': 1,
+    }
+
+
+def test_deduped_matches_grade_results_on_mixed_rows(grader):
+    df = pd.DataFrame({
+        'Category': ['M45', None, None, 'Q', None, 'F35', 45, None],
+        'Age': [30, 40, None, 50, 3, None, None, 41.7],
+        'Gender': ['F', 'M', 'M', 'M', 'F', None, 'M', 'F'],
+        'Distance': ['5K', '5K', '5K', '5K', '10KNAD', 'Fell', '5K', 'HM'],
+        'Time': ['20:00', '20:00', '20:00', '20:00', '50:00', '20:00', '20:00', '1:40:00'],
+    })
+    expected = grade_results(grader, df)
+    assert grade_results_deduped(grader, df).equals(expected)
+    assert expected.notna().sum() == 4
+
+
+def test_deduped_falls_back_for_many_keys(grader, monkeypatch):
+    df = pd.DataFrame({'Category': ['M45', 'F35'], 'Distance': ['5K', 'HM'], 'Time': ['20:00', '1:40:00']})
+    monkeypatch.setattr(batch, 'MAX_DEDUPED_KEYS', 1)
+    assert grade_results_deduped(grader, df).equals(grade_results(grader, df))
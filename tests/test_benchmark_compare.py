@@ -0,0 +1,70 @@
+import io
+
+from benchmarks import cases  # noqa: F401 registers the benchmarks
+from benchmarks.compare import check, compare, machine_factor
+from benchmarks.runner import BENCHMARKS, _selected
+
+
+def report(**seconds):
+    return {'results': {name.replace('_', '.', 1): {'best_seconds': s} for name, s in seconds.items()}}
+
+
+def test_within_tolerance():
+    rows = compare(report(scalar_grade=1.0), report(scalar_grade=1.2))
+    assert [row[-1] for row in rows] == ['ok']
+
+
+def test_regression_fails_check():
+    out = io.StringIO()
+    assert check(report(scalar_grade=1.0), report(scalar_grade=1.5), out) == 1
+    assert 'REGRESSION' in out.getvalue()
+
+
+def test_baseline_tolerances_override_defaults():
+    baseline = {**report(scalar_grade=1.0), 'tolerances': {'scalar.*': 0.6}}
+    assert check(baseline, report(scalar_grade=1.5), io.StringIO()) == 0
+
+
+def test_calibration_factors_out_machine_speed():
+    baseline = report(calibration_python_loop=1.0, scalar_grade=1.0)
+    current = report(calibration_python_loop=2.0, scalar_grade=2.1)
+    assert check(baseline, current, io.StringIO()) == 0
+
+
+def test_calibration_uses_the_median_per_operation():
+    baseline = {'results': {'calibration.python_loop': {'best_seconds': 0.006, 'median_seconds': 0.0065, 'ops': 100_000}}}
+    # A lucky best run does not skew the factor, and a longer loop compares per operation
+    current = {'results': {'calibration.python_loop': {'best_seconds': 0.04, 'median_seconds': 0.13, 'ops': 1_000_000}}}
+    assert machine_factor(baseline, current) == 2.0
+
+
+def test_small_machine_differences_are_scaled_out_too():
+    baseline = report(calibration_python_loop=1.0, scalar_grade=1.0)
+    current = report(calibration_python_loop=0.8, scalar_grade=1.1)
+    assert machine_factor(baseline, current) == 0.8
+    assert [row[-1] for row in compare(baseline, current)] == ['ok', 'REGRESSION']
+
+
+def test_each_benchmark_is_compared_in_calibration_loop_operations():
+    baseline = {'results': {'scalar.grade': {'best_seconds': 1.0, 'calibrated_seconds': 10.0}}}
+    # Twice the seconds, while the machine was running the calibration loop at half speed
+    slowed = {'results': {'scalar.grade': {'best_seconds': 2.0, 'calibrated_seconds': 10.5}}}
+    regressed = {'results': {'scalar.grade': {'best_seconds': 1.0, 'calibrated_seconds': 20.0}}}
+    assert check(baseline, slowed, io.StringIO()) == 0
+    assert check(baseline, regressed, io.StringIO()) == 1
+
+
+def test_standards_load_is_a_quick_benchmark():
+    assert BENCHMARKS['standards.load'].quick
+
+
+def test_missing_and_new_benchmarks():
+    rows = compare(report(scalar_grade=1.0), report(scalar_parse=1.0))
+    assert sorted(row[-1] for row in rows) == ['missing', 'new']
+
+
+def test_exact_names_select_only_those_benchmarks():
+    def selected(exact):
+        return [bench.name for bench in BENCHMARKS.values() if _selected(bench, ['scalar.get_age_grade'], exact)]
+    assert selected(exact=True) == ['scalar.get_age_grade']
+    assert 'scalar.get_age_grade.instrumented' in selected(exact=False)
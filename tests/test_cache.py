@@ -0,0 +1,110 @@
+import numpy as np
+import pandas as pd
+import pytest
+from agegrader import cache as cache_module
+from agegrader import power_of_ten_grader
+from agegrader.batch import grade_results, grade_rows
+from agegrader.cache import GradeCache
+from benchmarks.synthetic import AGE_GENDER, results_frame
+
+
+@pytest.fixture(scope='module')
+def grader():
+    return power_of_ten_grader()
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / 'grades.npz')
+
+
+def assert_same_grades(actual, expected):
+    np.testing.assert_array_equal(actual.to_numpy(), expected.to_numpy())
+
+
+@pytest.mark.parametrize('mode', ['category', AGE_GENDER])
+def test_rerun_grades_from_cache(grader, cache_path, mode):
+    df = results_frame(3000, mode=mode, malformed=0.05)
+    with GradeCache(cache_path) as cache:
+        assert_same_grades(cache.grade(grader, df), grade_results(grader, df))
+        assert cache.misses == len(df)
+
+    # The engine would give nothing if asked, so every grade must come from the cache
+    cache = GradeCache(cache_path)
+    assert_same_grades(cache.grade(grader, df, engine=None), grade_results(grader, df))
+    assert (cache.hits, cache.misses) == (len(df), 0)
+
+
+def test_only_new_and_changed_rows_are_graded(grader, cache_path):
+    df = results_frame(1000)
+    with GradeCache(cache_path) as cache:
+        cache.grade(grader, df)
+
+    season = pd.concat([df, results_frame(200, seed=1)], ignore_index=True)
+    season.loc[3, 'Time'] = '59:59'
+    graded = []
+
+    def engine(grader, df):
+        graded.extend(df.index)
+        return grade_rows(grader, df)
+
+    cache = GradeCache(cache_path)
+    assert_same_grades(cache.grade(grader, season, engine), grade_results(grader, season))
+    # New rows can repeat the inputs of an earlier runner, and those come from the cache too
+    assert 3 in graded and all(i == 3 or i >= 1000 for i in graded)
+    assert cache.misses == len(graded) > 150
+
+
+def test_equivalent_inputs_share_keys(grader, cache_path):
+    df = pd.DataFrame({'Distance': ['5K', '10K'], 'Category': ['M40', None], 'Age': [None, 40],
+                       'Gender': [None, 'F'], 'Time': ['20:00', '45:00']})
+    with GradeCache(cache_path) as cache:
+        expected = cache.grade(grader, df)
+    respelled = pd.DataFrame({'Distance': [' 5K', '10K '], 'Category': ['M40 ', None], 'Age': [None, '40'],
+                              'Gender': [None, ' F'], 'Time': ['0:20:00', '45:00.0']})
+    cache = GradeCache(cache_path)
+    assert_same_grades(cache.grade(grader, respelled, engine=None), expected)
+    assert cache.hits == 2
+
+
+@pytest.mark.parametrize('engine', [grade_results, grade_rows])
+@pytest.mark.parametrize('first, second', [('20:00', '20:00.0'), ('20:00.0', '1200'), ('1200', '0h20m0s')])
+def test_cached_grades_do_not_depend_on_the_spelling_graded_first(grader, tmp_path, engine, first, second):
+    frame = lambda time: pd.DataFrame({'Distance': ['5K'], 'Category': ['M40'], 'Time': [time]})
+    with GradeCache(str(tmp_path / 'grades.npz')) as cache:
+        cache.grade(grader, frame(first), engine)
+    cache = GradeCache(str(tmp_path / 'grades.npz'))
+    assert_same_grades(cache.grade(grader, frame(second), engine), engine(grader, frame(second)))
+    assert cache.hits == 1
+
+
+def test_trimmed_text_is_graded_as_it_is_keyed(grader, cache_path):
+    # Graded first with padding, then looked up without, both give the trimmed row's grade
+    padded = pd.DataFrame({'Distance': [' 5K '], 'Category': [' M40'], 'Time': ['20:00']})
+    plain = pd.DataFrame({'Distance': ['5K'], 'Category': ['M40'], 'Time': ['20:00']})
+    with GradeCache(cache_path) as cache:
+        assert_same_grades(cache.grade(grader, padded), grade_results(grader, plain))
+    assert_same_grades(GradeCache(cache_path).grade(grader, plain, engine=None), grade_results(grader, plain))
+
+
+def test_years_do_not_share_grades(grader, cache_path):
+    df = results_frame(500)
+    with GradeCache(cache_path, 2015) as cache:
+        cache.grade(grader, df)
+    cache = GradeCache(cache_path, 2025)
+    grades = cache.grade(power_of_ten_grader(2025), df)
+    assert cache.hits == 0
+    assert_same_grades(grades, grade_results(power_of_ten_grader(2025), df))
+
+
+def test_new_standards_invalidate_the_cache(grader, cache_path, monkeypatch):
+    df = results_frame(500)
+    with GradeCache(cache_path) as cache:
+        cache.grade(grader, df)
+
+    monkeypatch.setattr(cache_module, 'standards_version', lambda: 'regenerated')
+    with GradeCache(cache_path) as cache:
+        assert len(cache) == 0
+    with np.load(cache_path) as stored:
+        assert str(stored['version']) == 'regenerated'
+        assert len(stored['keys']) == 0
@@ -0,0 +1,142 @@
+import os
+import re
+import subprocess
+import sys
+
+import pandas as pd
+import pytest
+from agegrader.cli import main
+from benchmarks.synthetic import write_results as write_synthetic
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def results_csv(tmp_path):
+    path = tmp_path / 'results.csv'
+    pd.DataFrame({
+        'Name': ['John Smith', 'Jane Doe', 'Bad Row'],
+        'Category': ['SM', 'F40', 'SM'],
+        'Distance': ['10K', '5K', 'Fell'],
+        'Time': ['42:30', '22:15', '1:00:00'],
+    }).to_csv(path, index=False)
+    return str(path)
+
+
+@pytest.mark.parametrize('engine', ['batch', 'scalar'])
+def test_grade_file(tmp_path, results_csv, engine):
+    output = str(tmp_path / 'graded.csv')
+    main(['grade', results_csv, '-o', output, '--engine', engine])
+    graded = pd.read_csv(output)
+    assert graded['Age Grade'].tolist()[:2] == [62.86, 68.16]
+    assert pd.isna(graded['Age Grade'][2])
+
+
+def test_grade_to_parquet(tmp_path, results_csv):
+    output = str(tmp_path / 'graded.parquet')
+    main(['grade', results_csv, '-o', output])
+    assert pd.read_parquet(output)['Age Grade'].tolist()[:2] == [62.86, 68.16]
+
+
+def test_profile(tmp_path, results_csv, capsys):
+    prefix = str(tmp_path / 'profile')
+    main(['grade', results_csv, '-o', str(tmp_path / 'graded.csv'), '--engine', 'scalar', '--profile', prefix])
+    report = capsys.readouterr().err
+    assert '_get_standard' in report and 'parse_time' in report
+    with open(f'{prefix}.collapsed') as f:
+        lines = f.read().splitlines()
+    assert any('grade_rows' in line for line in lines)
+    assert all(line.rsplit(' ', 1)[1].isdigit() for line in lines)
+    with open(f'{prefix}.pstats', 'rb') as f:
+        assert f.read()
+
+
+def test_trace_malloc(tmp_path, results_csv, capsys):
+    main(['grade', results_csv, '-o', str(tmp_path / 'graded.csv'), '--trace-malloc', '3'])
+    assert 'top 3 allocation sites' in capsys.readouterr().err
+
+
+def test_trace_malloc_reports_sites_near_the_peak_without_the_profiler(tmp_path, capsys):
+    source = str(tmp_path / 'results.csv')
+    write_synthetic(source, 20_000)
+    main(['grade', source, '-o', str(tmp_path / 'graded.csv'), '--trace-malloc', '5',
+          '--profile', str(tmp_path / 'profile')])
+    report = capsys.readouterr().err.split('Peak traced memory')[1]
+    peak, near = (float(size) for size in re.findall(r'([\d.]+) MB', report)[:2])
+    # Not what is left once grading is done, a small fraction of the peak
+    assert near >= peak / 2
+    sites = [line for line in report.splitlines() if ' MB ' in line and 'blocks' in line]
+    assert len(sites) == 5
+    assert not any(name in line for line in sites for name in ('profiling.py', 'cProfile.py', 'pstats.py'))
+
+
+@pytest.mark.parametrize('output_format', ['csv', 'parquet'])
+@pytest.mark.parametrize('input_format', ['csv', 'parquet'])
+def test_windowed_matches_whole_file(tmp_path, input_format, output_format):
+    source = str(tmp_path / f'results.{input_format}')
+    write_synthetic(source, 5000, chunk_size=1000, malformed=0.05)
+    whole, windowed = (str(tmp_path / f'{name}.{output_format}') for name in ('whole', 'windowed'))
+    main(['grade', source, '-o', whole])
+    main(['grade', source, '-o', windowed, '--window', '700'])
+    read = pd.read_parquet if output_format == 'parquet' else pd.read_csv
+    # Windows of a CSV are read as text, so compare the values as they would be written out
+    assert read(windowed).to_csv(index=False) == read(whole).to_csv(index=False)
+
+
+@pytest.mark.parametrize('output_format', ['csv', 'parquet'])
+@pytest.mark.parametrize('engine', ['batch', 'scalar'])
+def test_windows_with_a_sparse_column(tmp_path, output_format, engine):
+    source = str(tmp_path / 'results.csv')
+    pd.DataFrame({
+        'Name': [f'Runner {i}' for i in range(30)],
+        'Club': [None] * 20 + ['Herne Hill'] * 10,
+        'Age': [None] * 5 + [40] * 25,
+        'Gender': ['M'] * 30,
+        'Distance': ['5K'] * 30,
+        'Time': ['20:00'] * 30,
+    }).to_csv(source, index=False)
+    output = str(tmp_path / f'graded.{output_format}')
+    main(['grade', source, '-o', output, '--window', '10', '--engine', engine])
+    graded = pd.read_parquet(output) if output_format == 'parquet' else pd.read_csv(output)
+    assert graded['Club'].iloc[:20].isna().all() and graded['Club'].iloc[20:].eq('Herne Hill').all()
+    assert graded['Age Grade'].iloc[:5].isna().all() and graded['Age Grade'].iloc[5:].eq(68.58).all()
+
+
+def test_window_rejects_excel(tmp_path, results_csv):
+    with pytest.raises(SystemExit, match='Excel'):
+        main(['grade', results_csv, '-o', str(tmp_path / 'graded.xlsx'), '--window', '10'])
+
+
+def _peak_rss_mb(*argv):
+    """
+    Peak resident memory of a fresh interpreter running the CLI. VmHWM rather than ru_maxrss,
+    which a child can inherit from the pytest process that started it.
+    """
+    script = ("import sys\nfrom agegrader.cli import main\nmain(sys.argv[1:])\n"
+              "print(open('/proc/self/status').read().split('VmHWM:')[1].split()[0], file=sys.stderr)")
+    run = subprocess.run([sys.executable, '-c', script, *argv], capture_output=True, text=True, check=True,
+                         cwd=REPO_ROOT)
+    return int(run.stderr.split()[-1]) / 1024
+
+
+@pytest.mark.benchmark
+@pytest.mark.skipif(not os.path.exists('/proc/self/status'), reason='needs /proc for peak RSS')
+def test_window_bounds_peak_rss(tmp_path):
+    small, large = str(tmp_path / 'small.csv'), str(tmp_path / 'large.csv')
+    write_synthetic(small, 50_000)
+    write_synthetic(large, 400_000)
+    output = str(tmp_path / 'graded.csv')
+    bounded = [_peak_rss_mb('grade', path, '-o', output, '--window', '5000') for path in (small, large)]
+    # Eight times the rows and about 10 MB more CSV, but the same window: memory must not follow the file
+    assert bounded[1] - bounded[0] < 10
+    whole = _peak_rss_mb('grade', large, '-o', output)
+    assert whole - bounded[1] > 30
+
+
+def test_cache(tmp_path, results_csv, capsys):
+    output, cache = str(tmp_path / 'graded.csv'), str(tmp_path / 'grades.npz')
+    main(['grade', results_csv, '-o', output, '--cache', cache])
+    assert '0 rows from the cache, 3 graded' in capsys.readouterr().err
+    main(['grade', results_csv, '-o', output, '--cache', cache, '--window', '2'])
+    assert '3 rows from the cache, 0 graded' in capsys.readouterr().err
+    assert pd.read_csv(output)['Age Grade'].tolist()[:2] == [62.86, 68.16]
@@ -0,0 +1,68 @@
+import subprocess
+import sys
+
+import pytest
+from agegrader import power_of_ten_grader
+from agegrader import compact
+from agegrader.compact import compact_grader
+from tests.test_age_grading import AGE_AND_GENDER_RESULTS, SUMMER_LEAGUE_5M_RESULTS
+
+
+@pytest.fixture
+def grader():
+    return compact_grader()
+
+
+@pytest.mark.parametrize('year', [2015, 2025])
+def test_packed_standards_match_lists(year):
+    standards = power_of_ten_grader(year).standards
+    columns = compact_grader(year).columns
+    assert {key: column.tolist() for key, column in columns.items()} == \
+        {(gender, heading): times for gender, by_heading in standards.items() for heading, times in by_heading.items()}
+
+
+def test_falls_back_to_loaded_standards(monkeypatch):
+    def missing(year):
+        raise ImportError
+
+    packed = compact_grader(2025).columns
+    monkeypatch.setattr(compact, '_packed_standards', missing)
+    assert compact_grader(2025).columns == packed
+
+
+@pytest.mark.parametrize('category, time, expected_grade', SUMMER_LEAGUE_5M_RESULTS)
+def test_grade_by_category(grader, category, time, expected_grade):
+    assert grader.get_age_grade_by_category('5M', category, time) == expected_grade
+    assert grader.grade_by_category('5M', category, time).grade == expected_grade
+
+
+@pytest.mark.parametrize('age, gender, distance, time, expected_grade', AGE_AND_GENDER_RESULTS)
+def test_grade_by_age_and_gender(grader, age, gender, distance, time, expected_grade):
+    assert grader.get_age_grade(distance, gender, age, time) == expected_grade
+
+
+def test_failed_grade(grader):
+    assert grader.get_age_grade('Fell', 'M', 40, 1200) == ""
+    grade = grader.grade('5KNAD', 'X', 40, 1200)
+    assert (grade.heading, grade.gender, grade.age, grade.grade) == ('5 km', 'X', 40, None)
+
+
+def test_slots(grader):
+    with pytest.raises(AttributeError):
+        grader.extra = 1
+    with pytest.raises(AttributeError):
+        grader.grade('5K', 'M', 40, 1200).extra = 1
+
+
+def test_memo_tables_are_bounded(grader, monkeypatch):
+    monkeypatch.setattr(compact, 'MEMO_LIMIT', len(grader.categories) + 1)
+    for i in range(10):
+        grader.get_age_grade_by_category('5K', f'Q{i}', 1200)
+    assert len(grader.categories) == compact.MEMO_LIMIT
+
+
+def test_no_numpy_or_pandas():
+    code = ("import sys; from agegrader.compact import compact_grader; compact_grader().get_age_grade('5K', 'M', 40, 1200); "
+            "print(sorted(m for m in ('numpy', 'pandas') if m in sys.modules))")
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == '[]'
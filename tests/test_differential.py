@@ -0,0 +1,57 @@
+import pytest
+from agegrader import power_of_ten_grader
+from agegrader.batch import age_graded_results
+from tests.differential import (FRAME_ENGINES, GRADER_ENGINES, age_gender_cases, as_results_frame,
+                                as_varied_results_frame, category_cases, fractional_times, grades, mismatches,
+                                reference_age_graded, reference_grades)
+
+YEARS = [2015, 2025]
+
+
+@pytest.fixture(scope='module', params=YEARS)
+def grader(request):
+    return power_of_ten_grader(request.param)
+
+
+@pytest.fixture(scope='module', params=['age_gender', 'category'])
+def cases(request):
+    return age_gender_cases() if request.param == 'age_gender' else category_cases()
+
+
+def check(cases, expected, actual):
+    report = mismatches(cases, expected, actual)
+    assert not report, '\n'.join(report)
+
+
+@pytest.mark.parametrize('engine', GRADER_ENGINES)
+@pytest.mark.parametrize('fractional', [False, True])
+def test_grader_engine(grader, cases, engine, fractional):
+    cases = fractional_times(cases) if fractional else cases
+    engine_grader = GRADER_ENGINES[engine](grader)
+    if 'Category' in cases.columns:
+        actual = grades(engine_grader.get_age_grade_by_category(d, c, t)
+                         for d, c, t in zip(cases['Distance'], cases['Category'], cases['Seconds']))
+    else:
+        actual = grades(engine_grader.get_age_grade(d, g, a, t)
+                         for d, g, a, t in zip(cases['Distance'], cases['Gender'], cases['Age'], cases['Seconds']))
+    check(cases, reference_grades(grader, cases), actual)
+
+
+@pytest.mark.parametrize('engine', FRAME_ENGINES)
+def test_frame_engine(grader, cases, engine):
+    actual = FRAME_ENGINES[engine](grader, as_results_frame(cases)).to_numpy()
+    check(cases, reference_grades(grader, cases), actual)
+
+
+@pytest.mark.parametrize('engine', FRAME_ENGINES)
+def test_frame_engine_varied_inputs(grader, cases, engine):
+    cases, frame = as_varied_results_frame(cases)
+    check(cases, reference_grades(grader, cases), FRAME_ENGINES[engine](grader, frame).to_numpy())
+
+
+def test_age_graded_results(grader, cases):
+    actual = age_graded_results(grader, as_results_frame(cases))
+    factors, graded_times = reference_age_graded(grader, cases)
+    check(cases, reference_grades(grader, cases), actual['Age Grade'].to_numpy())
+    check(cases, factors, actual['Age Factor'].to_numpy())
+    check(cases, graded_times, actual['Age Graded Time'].to_numpy())
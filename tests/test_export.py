@@ -0,0 +1,42 @@
+import io
+import pandas as pd
+import pytest
+from agegrader.export import EXPORT_FORMATS, export_bytes, frame_digest
+
+
+@pytest.fixture
+def graded():
+    return pd.DataFrame({
+        'Name': ['John Smith', 'Jane Doe'],
+        'Category': ['SM', 'F40'],
+        'Distance': ['10K', '5K'],
+        'Time': ['42:30', '22:15'],
+        'Age Grade': [62.86, 68.16]
+    })
+
+
+def test_digest_is_stable(graded):
+    assert frame_digest(graded) == frame_digest(graded.copy())
+
+
+def test_digest_changes_with_values(graded):
+    changed = graded.copy()
+    changed.at[0, 'Time'] = '42:31'
+    assert frame_digest(changed) != frame_digest(graded)
+
+
+def test_digest_changes_with_columns(graded):
+    assert frame_digest(graded.rename(columns={'Time': 'Chip Time'})) != frame_digest(graded)
+
+
+READERS = {
+    'CSV': pd.read_csv,
+    'Excel': pd.read_excel,
+    'Parquet': pd.read_parquet,
+}
+
+
+@pytest.mark.parametrize('format_name', EXPORT_FORMATS)
+def test_export_round_trips(graded, format_name):
+    payload = export_bytes(graded, format_name)
+    pd.testing.assert_frame_equal(READERS[format_name](io.BytesIO(payload)), graded)
@@ -0,0 +1,103 @@
+import os
+
+import pytest
+from agegrader.standards import ARRAY_MODULE_FILE, MANIFEST_FILE, MARSHAL_FILE, NPZ_FILE, PICKLE_FILE, load_standards
+from extract_standards import excel_to_dict, process_standards, read_columns_pandas, validate
+
+SPECS = [
+    {'year': 2015, 'male_standards_file': 'data/MaleRoadStd2015.xlsx',
+     'female_standards_file': 'data/FemaleRoadStd2015.xlsx', 'drop_leading_values': 2},
+    {'year': 2025, 'male_standards_file': 'data/MaleRoadStd2025.xlsx',
+     'female_standards_file': 'data/FemaleRoadStd2025.xlsx', 'drop_leading_values': 3},
+]
+
+
+def read(path, mode='r'):
+    with open(path, mode) as f:
+        return f.read()
+
+
+def test_extraction_matches_committed_standards(tmp_path):
+    output = tmp_path / 'combined_standards.py'
+    process_standards(*SPECS, output_name=output, cache_dir=tmp_path / 'cache')
+    assert read(output) == read('agegrader/combined_standards.py')
+    for artifact in (MARSHAL_FILE, PICKLE_FILE, NPZ_FILE, ARRAY_MODULE_FILE, MANIFEST_FILE):
+        assert read(tmp_path / artifact, 'rb') == read(os.path.join('agegrader', artifact), 'rb'), artifact
+
+
+@pytest.mark.parametrize('spec', SPECS)
+@pytest.mark.parametrize('gender', ['male', 'female'])
+def test_streaming_reader_matches_pandas(spec, gender):
+    path, drop = spec[f'{gender}_standards_file'], spec['drop_leading_values']
+    assert excel_to_dict(path, drop) == excel_to_dict(path, drop, reader=read_columns_pandas)
+
+
+def test_unchanged_workbooks_come_from_cache(tmp_path, capsys):
+    cache_dir = tmp_path / 'cache'
+    process_standards(SPECS[0], output_name=tmp_path / 'first.py', cache_dir=cache_dir)
+    capsys.readouterr()
+
+    process_standards(*SPECS, output_name=tmp_path / 'second.py', cache_dir=cache_dir)
+    out = capsys.readouterr().out
+    assert 'Using cached data/MaleRoadStd2015.xlsx' in out
+    assert 'Using cached data/FemaleRoadStd2015.xlsx' in out
+    assert 'Using cached data/MaleRoadStd2025.xlsx' not in out
+    assert len(list(cache_dir.iterdir())) == 4
+    assert read(tmp_path / 'second.py') == read('agegrader/combined_standards.py')
+
+
+def test_extractor_changes_invalidate_the_cache(tmp_path, monkeypatch, capsys):
+    cache_dir = tmp_path / 'cache'
+    process_standards(SPECS[0], output_name=tmp_path / 'first.py', cache_dir=cache_dir)
+    monkeypatch.setattr('extract_standards.EXTRACTOR_VERSION', -1)
+    capsys.readouterr()
+    process_standards(SPECS[0], output_name=tmp_path / 'second.py', cache_dir=cache_dir)
+    assert 'Using cached' not in capsys.readouterr().out
+
+
+def test_committed_standards_are_valid():
+    assert validate(load_standards()) == []
+
+
+def test_wrong_leading_values_are_caught():
+    male_2025 = excel_to_dict('data/MaleRoadStd2025.xlsx', 2)
+    problems = validate({2025: {'M': male_2025}})
+    assert '2025 M 5 km: 97 ages, expected 96 (5-100)' in problems
+
+
+def test_shape_and_headings_are_checked():
+    standards = load_standards()['2015']
+    times = [300.0 + abs(age - 30) for age in range(5, 101)]
+    times[80] = 250.0
+    male = {**standards['M'], '5 km': times, '3 km': [300.0 + abs(t - 30) for t in range(96)]}
+    problems = validate({2015: {'M': male, 'F': standards['F']}})
+    assert problems == ['2015 M 5 km: times do not fall to a fastest age and rise after it',
+                        '2015 M 3 km: unrecognised heading']
+
+
+def test_missing_genders_and_headings_are_caught():
+    standards = load_standards()['2025']
+    male = {heading: times for heading, times in standards['M'].items() if heading != '5 Mile'}
+    assert validate({2025: {'M': male}}) == ['2025 M: missing headings 5 Mile', '2025 F: no standards']
+    assert validate({2025: {'M': standards['M'], 'F': {}}}) == [
+        '2025 F: missing headings ' + ', '.join(sorted(set(standards['F']) - {'1 Mile', '7 Mile'}))]
+
+
+def test_misspelled_heading_is_corrected():
+    assert '5 Mile' in excel_to_dict('data/MaleRoadStd2025.xlsx', 3)
+
+
+def test_unreadable_workbook_fails_the_build(tmp_path):
+    junk = tmp_path / 'FemaleRoadStd2015.xlsx'
+    junk.write_bytes(b'not a workbook')
+    spec = {**SPECS[0], 'female_standards_file': str(junk)}
+    with pytest.raises(ValueError, match='FemaleRoadStd2015.xlsx'):
+        process_standards(spec, output_name=tmp_path / 'combined_standards.py', cache_dir=tmp_path / 'cache')
+    assert not (tmp_path / 'combined_standards.py').exists()
+
+
+def test_invalid_standards_are_not_written(tmp_path, monkeypatch):
+    monkeypatch.setattr('extract_standards.N_AGES', 95)
+    with pytest.raises(ValueError, match='Invalid standards'):
+        process_standards(SPECS[0], output_name=tmp_path / 'combined_standards.py', cache_dir=tmp_path / 'cache')
+    assert not (tmp_path / 'combined_standards.py').exists()
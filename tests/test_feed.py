@@ -0,0 +1,152 @@
+import asyncio
+
+import numpy as np
+import pandas as pd
+import pytest
+from agegrader import power_of_ten_grader
+from agegrader.batch import grade_results
+from agegrader.compact import compact_grader
+from agegrader.feed import FeedConsumer, serve_records
+from agegrader.live import percentile
+from benchmarks.synthetic import results_frame
+
+
+@pytest.fixture(scope='module')
+def grader():
+    return compact_grader()
+
+
+def records(n, **kwargs):
+    df = results_frame(n, **kwargs)
+    return df, [{key: value for key, value in row.items() if pd.notna(value)} for row in df.to_dict('records')]
+
+
+async def run_feed(consumer, feed_records, rate=None, subscribers=1):
+    server = await serve_records(feed_records, rate=rate)
+    port = server.sockets[0].getsockname()[1]
+    queues = [consumer.subscribe() for _ in range(subscribers)]
+
+    async def collect(queue):
+        received = []
+        while (record := await queue.get()) is not None:
+            received.append(record)
+        return received
+
+    async with server:
+        collected = asyncio.gather(*(collect(queue) for queue in queues))
+        await consumer.run('127.0.0.1', port)
+        return await collected
+
+
+def test_grades_match_grade_results(grader):
+    df, feed_records = records(2000, malformed=0.1)
+    consumer = FeedConsumer(grader)
+    first, second = asyncio.run(run_feed(consumer, feed_records, subscribers=2))
+    assert first == second
+    grades = np.array([np.nan if r['Age Grade'] is None else r['Age Grade'] for r in first])
+    np.testing.assert_array_equal(grades, grade_results(power_of_ten_grader(), df).to_numpy())
+    assert [r['Name'] for r in first] == df['Name'].tolist()
+
+
+def test_malformed_lines_are_counted(grader):
+    consumer = FeedConsumer(grader)
+    queue = consumer.subscribe()
+    for line in (b'not json\n', b'[1, 2]\n', b'{"Distance": "5K", "Category": 45, "Time": "20:00"}\n',
+                 b'{"Distance": "5K", "Gender": "M", "Age": 40, "Time": [20]}\n',
+                 b'{"Distance": "5K", "Category": "SM", "Time": "20:00"}\n'):
+        consumer.handle_line(line, 0)
+    assert (consumer.records, consumer.malformed) == (1, 4)
+    assert queue.get_nowait()['Age Grade'] == 64.92
+
+
+def test_malformed_record_does_not_stop_the_feed(grader):
+    feed_records = [{'Distance': '5K', 'Category': 45, 'Time': '20:00'},
+                    {'Distance': '10K', 'Category': 'SM', 'Time': '42:30'}]
+    consumer = FeedConsumer(grader)
+    received, = asyncio.run(run_feed(consumer, feed_records))
+    assert [r['Age Grade'] for r in received] == [62.86]
+    assert consumer.malformed == 1
+
+
+def test_lines_over_the_limit_are_skipped(grader):
+    async def read_lines(data, limit):
+        reader = asyncio.StreamReader(limit=limit)
+        reader.feed_data(data)
+        reader.feed_eof()
+        consumer = FeedConsumer(grader)
+        lines = []
+        while line := await consumer.read_line(reader):
+            lines.append(line)
+        return lines, consumer.malformed
+
+    long_line = b'{"Name": "' + b'x' * 200 + b'"}\n'
+    data = b'first\n' + long_line + b'second\n' + long_line + b'third\n'
+    assert asyncio.run(read_lines(data, 64)) == ([b'first\n', b'second\n', b'third\n'], 2)
+    assert asyncio.run(read_lines(b'first\n' + long_line[:-1], 64)) == ([b'first\n'], 1)
+
+
+def test_long_record_does_not_stop_the_feed(grader):
+    feed_records = [{'Distance': '5K', 'Category': 'SM', 'Time': '20:00'},
+                    {'Distance': '5K', 'Category': 'SM', 'Time': '20:00', 'Name': 'x' * 200_000},
+                    {'Distance': '10K', 'Category': 'SM', 'Time': '42:30'}]
+    consumer = FeedConsumer(grader)
+    received, = asyncio.run(run_feed(consumer, feed_records))
+    assert [r['Age Grade'] for r in received] == [64.92, 62.86]
+    assert consumer.malformed == 1
+
+
+def test_numeric_times_are_seconds(grader):
+    consumer = FeedConsumer(grader)
+    queue = consumer.subscribe()
+    consumer.handle_line(b'{"Distance": "10K", "Category": "SM", "Time": 2550}\n', 0)
+    consumer.handle_line(b'{"Distance": "10K", "Category": "SM", "Time": 2550.0}\n', 0)
+    assert [queue.get_nowait()['Age Grade'] for _ in range(2)] == [62.86, 62.86]
+
+
+def test_fractional_chip_times_are_graded(grader):
+    feed_records = [{'Distance': '5K', 'Category': 'SM', 'Time': time} for time in ('20:00.4', '1200.4', '1h0m0.5s')]
+    received, = asyncio.run(run_feed(FeedConsumer(grader), feed_records))
+    expected = grade_results(power_of_ten_grader(), pd.DataFrame(feed_records))
+    assert [r['Age Grade'] for r in received] == expected.tolist() == [64.9, 64.9, 21.64]
+
+
+def test_slow_subscriber_loses_oldest_records(grader):
+    consumer = FeedConsumer(grader, queue_size=10)
+    queue = consumer.subscribe()
+    for i in range(25):
+        consumer.handle_line(b'{"Name": %d}\n' % i, 0)
+    assert consumer.dropped == 15
+    assert queue.get_nowait()['Name'] == 15
+
+
+@pytest.fixture(scope='module')
+def fast_feed(grader):
+    """A consumer and the records it published from 5,000 finishers a second for 4 seconds"""
+    _, feed_records = records(20_000)
+    consumer = FeedConsumer(grader)
+    received, = asyncio.run(run_feed(consumer, feed_records, rate=5000))
+    return consumer, received
+
+
+def test_grades_all_of_a_fast_feed(fast_feed):
+    consumer, received = fast_feed
+    assert len(received) == 20_000 and consumer.dropped == 0
+    assert len(consumer.latencies) == 20_000
+    assert 'latency p50' in consumer.report()
+
+
+@pytest.mark.benchmark
+def test_keeps_up_with_a_fast_feed(fast_feed):
+    consumer, _ = fast_feed
+    # Not falling behind: records are graded within milliseconds of being sent, all the way through
+    assert percentile(consumer.latencies, 0.5) < 0.01
+    assert percentile(list(consumer.latencies)[-1000:], 0.99) < 0.05
+
+
+@pytest.mark.benchmark
+def test_throughput(grader):
+    _, feed_records = records(20_000)
+    consumer = FeedConsumer(grader)
+    asyncio.run(run_feed(consumer, feed_records))
+    assert consumer.records == 20_000
+    assert consumer.throughput > 5000
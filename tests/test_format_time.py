@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+from agegrader.agegrader import format_time
+from agegrader.times import format_times
+
+def test_format_times_matches_format_time():
+    seconds = np.concatenate([
+        np.arange(-100, 40000, dtype=float),
+        np.random.default_rng(42).uniform(0, 400000, 10000),
+        [0.49999, 0.5, 59.5, 3599.5, 3599.49],
+    ])
+    assert format_times(seconds).tolist() == [format_time(s) for s in seconds]
+
+def test_format_times_missing():
+    assert format_times([np.nan, 4100]).tolist() == ['', '1:08:20']
+
+@pytest.mark.parametrize('seconds, expected', [
+    (4100, '01:08:20'),
+    (500, '00:08:20'),
+    (45, '00:00:45'),
+])
+def test_format_times_fixed_width(seconds, expected):
+    assert format_times([seconds], fixed_width=True).tolist() == [expected]
+
+@pytest.mark.parametrize('seconds, decimals, expected', [
+    (4100.4, 1, '1:08:20.4'),
+    (500.06, 2, '8:20.06'),
+    (45.96, 1, '46.0'),
+    (59.96, 1, '1:00.0'),
+])
+def test_format_times_fractional(seconds, decimals, expected):
+    assert format_times([seconds], decimals=decimals).tolist() == [expected]
@@ -0,0 +1,43 @@
+import subprocess
+import sys
+import pytest
+
+# Generous compared with the ~1ms it takes, so only eager loading of standards or numpy/pandas trips it
+IMPORT_BUDGET_SECONDS = 0.05
+
+
+def run_python(code):
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    return result.stdout.strip()
+
+
+def test_import_within_budget():
+    elapsed = min(float(run_python(
+        "import time; start = time.perf_counter(); import agegrader; print(time.perf_counter() - start)"
+    )) for _ in range(3))
+    assert elapsed < IMPORT_BUDGET_SECONDS
+
+
+def test_import_does_not_load_standards_or_dependencies():
+    loaded = run_python(
+        "import sys, agegrader; "
+        "print(sorted(m for m in ('agegrader.combined_standards', 'numpy', 'pandas') if m in sys.modules))"
+    )
+    assert loaded == '[]'
+
+
+def test_standards_load_when_first_grader_built():
+    loaded = run_python(
+        "import agegrader, agegrader.standards; agegrader.power_of_ten_grader(); "
+        "print(agegrader.standards.load_standards.cache_info().currsize)"
+    )
+    assert loaded == '1'
+
+
+def test_lazy_attributes():
+    import agegrader
+    from agegrader.agegrader import power_of_ten_grader
+    assert agegrader.power_of_ten_grader is power_of_ten_grader
+    assert 'grade_results' in dir(agegrader)
+    with pytest.raises(AttributeError):
+        agegrader.not_a_name
@@ -0,0 +1,107 @@
+import threading
+
+import pandas as pd
+import pytest
+from agegrader import power_of_ten_grader
+from agegrader.batch import grade_results
+from agegrader.agegrader import AgeGrader
+from agegrader.instrumentation import GraderStats, instrument
+from tests.test_age_grading import SUMMER_LEAGUE_5M_RESULTS, AGE_AND_GENDER_RESULTS
+
+
+@pytest.fixture
+def grader():
+    return instrument(power_of_ten_grader(), year=2015)
+
+
+def test_plain_grader_is_not_instrumented():
+    assert power_of_ten_grader().stats is None
+
+
+@pytest.mark.parametrize('category, time, expected_grade', SUMMER_LEAGUE_5M_RESULTS)
+def test_same_grades_by_category(grader, category, time, expected_grade):
+    assert grader.get_age_grade_by_category('5M', category, time) == expected_grade
+
+
+@pytest.mark.parametrize('age, gender, distance, time, expected_grade', AGE_AND_GENDER_RESULTS)
+def test_same_grades_by_age(grader, age, gender, distance, time, expected_grade):
+    assert grader.get_age_grade(distance, gender, age, time) == expected_grade
+
+
+def test_scalar_counters(grader):
+    grader.get_age_grade('5K', 'M', 40, 1200)
+    grader.get_age_grade('5K', 'M', 104, 1200)
+    grader.get_age_grade('Fell', 'M', 40, 1200)
+    grader.get_age_grade_by_category('5K', 'X', 1200)
+    counters = grader.stats.snapshot()['counters']
+    assert counters['calls'] == {'5 km': 3, 'unknown': 1}
+    assert counters['clamped_age'] == {'5 km': 1}
+    assert counters['unknown_discipline'] == {'unknown': 1}
+    assert counters['unknown_category'] == {'5 km': 1}
+    assert counters['failed_lookup'] == {'5 km': 1, 'unknown': 1}
+
+
+def test_uses_the_plain_graders_lookup(grader, monkeypatch):
+    monkeypatch.setattr(AgeGrader, '_standard_for_heading', lambda *args: 600.0)
+    assert grader.get_age_grade('5K', 'M', 40, 1200) == 50.0
+    assert grader.get_age_grade_by_category('5K', 'M40', 1200) == 50.0
+
+
+def test_labels_cannot_be_given_with_stats():
+    stats = GraderStats(year=2015)
+    with pytest.raises(ValueError, match='race'):
+        instrument(power_of_ten_grader(), stats=stats, race='summer league')
+    assert instrument(power_of_ten_grader(), stats=stats).stats is stats
+
+
+def test_scalar_timings(grader):
+    grader.get_age_grade_by_category('5K', 'M40', 1200)
+    snapshot = grader.stats.snapshot()
+    assert set(snapshot['timings']['scalar']) == {'parse', 'resolve', 'lookup', 'compute', 'total'}
+    assert snapshot['latency']['5 km']['count'] == 1
+    assert snapshot['labels'] == {'year': '2015'}
+
+
+def test_one_call_in_sample_every_is_timed():
+    grader = instrument(power_of_ten_grader(), sample_every=4)
+    for _ in range(10):
+        grader.get_age_grade('5K', 'M', 40, 1200)
+    grader.get_age_grade_by_category('5K', 'M104', 1200)
+    snapshot = grader.stats.snapshot()
+    assert snapshot['counters']['calls'] == {'5 km': 11}
+    assert snapshot['counters']['clamped_age'] == {'5 km': 1}
+    assert snapshot['latency']['5 km']['count'] == 3
+    assert snapshot['timings']['scalar']['total']['count'] == 3
+
+
+def test_untimed_calls_are_all_counted_across_threads(grader):
+    def grade():
+        for _ in range(1000):
+            grader.get_age_grade('5K', 'M', 40, 1200)
+    threads = [threading.Thread(target=grade) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert grader.stats.snapshot()['counters']['calls'] == {'5 km': 4000}
+
+
+def test_batch_counters_and_timings(grader):
+    df = pd.DataFrame({
+        'Category': ['M45', 'X45', 'F40', 'M45'],
+        'Distance': ['5K', '5K', 'Fell', '10K'],
+        'Time': ['20:00', '20:00', '20:00', '40:00'],
+    })
+    grade_results(grader, df)
+    snapshot = grader.stats.snapshot()
+    assert snapshot['counters']['rows'] == {'5 km': 2, 'unknown': 1, '10 km': 1}
+    assert snapshot['counters']['unknown_category'] == {'5 km': 1}
+    assert snapshot['counters']['unknown_discipline'] == {'unknown': 1}
+    assert snapshot['counters']['failed_lookup'] == {'5 km': 1, 'unknown': 1}
+    assert snapshot['timings']['batch']['total']['count'] == 1
+
+
+def test_reset(grader):
+    grader.get_age_grade('5K', 'M', 40, 1200)
+    grader.stats.reset()
+    assert grader.stats.snapshot()['counters']['calls'] == {}
@@ -0,0 +1,178 @@
+import csv
+import io
+import os
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+from agegrader import power_of_ten_grader
+from agegrader.batch import grade_results
+from agegrader.compact import compact_grader
+from agegrader.live import ResultsTail, grade_record, percentile
+from benchmarks.synthetic import AGE_GENDER, write_results
+
+
+@pytest.fixture(scope='module')
+def grader():
+    return compact_grader()
+
+
+def csv_lines(path):
+    with open(path) as f:
+        return f.read().splitlines(keepends=True)
+
+
+def expected_grades(path):
+    return grade_results(power_of_ten_grader(), pd.read_csv(path, dtype={'Time': str})).to_numpy()
+
+
+@pytest.mark.parametrize('mode', ['category', AGE_GENDER])
+def test_grade_record_matches_grade_results(grader, tmp_path, mode):
+    path = str(tmp_path / 'results.csv')
+    write_results(path, 3000, mode=mode, malformed=0.1)
+    with open(path) as f:
+        grades = [grade_record(grader, record) for record in csv.DictReader(f)]
+    np.testing.assert_array_equal(np.array(grades, dtype=float), expected_grades(path))
+
+
+def test_follows_appended_lines_across_restarts(grader, tmp_path):
+    source = str(tmp_path / 'source.csv')
+    write_results(source, 100, malformed=0.1)
+    lines = csv_lines(source)
+    path, state = str(tmp_path / 'results.csv'), str(tmp_path / 'results.offset')
+    output = io.StringIO()
+
+    with open(path, 'w') as f:
+        f.writelines(lines[:41])
+        # Half a line, still being written
+        f.write(lines[41][:10])
+    tail = ResultsTail(grader, path, output, state)
+    assert tail.poll() == 40
+    assert tail.poll() == 0
+
+    with open(path, 'a') as f:
+        f.write(lines[41][10:])
+        f.writelines(lines[42:70])
+    assert tail.poll() == 29
+
+    # A new watch picks up from the saved offset
+    with open(path, 'a') as f:
+        f.writelines(lines[70:])
+    restarted = ResultsTail(grader, path, output, state)
+    assert restarted.poll() == 31
+
+    graded = pd.read_csv(io.StringIO(output.getvalue()), dtype={'Time': str})
+    assert graded.columns[-1] == 'Age Grade' and len(graded) == 100
+    np.testing.assert_array_equal(graded['Age Grade'].to_numpy(), expected_grades(source))
+
+
+# Fractional chip times, plain seconds and h/m/s, as well as the whole-second times write_results gives
+TIME_SPELLINGS = ['20:00.4', '1200', '1h0m0s', '1200.5', '20m', ' 0:20:00 ', '0', 'DNF', '', '1h2']
+
+
+def test_time_formats_match_grade_results(grader):
+    df = pd.DataFrame({'Distance': '5K', 'Category': 'SM', 'Time': TIME_SPELLINGS})
+    grades = [grade_record(grader, record) for record in df.to_dict('records')]
+    np.testing.assert_array_equal(np.array(grades, dtype=float), grade_results(power_of_ten_grader(), df).to_numpy())
+    assert grades[:3] == [64.9, 64.92, 21.64]
+
+
+@pytest.mark.parametrize('age', ['inf', '1e400', 'nan', 'forty'])
+def test_unusable_ages_are_not_graded(grader, age):
+    assert grade_record(grader, {'Distance': '5K', 'Time': '20:00', 'Age': age, 'Gender': 'M'}) is None
+
+
+def test_lines_longer_than_a_read(grader, tmp_path, monkeypatch):
+    monkeypatch.setattr('agegrader.live.MAX_READ_BYTES', 64)
+    path = str(tmp_path / 'results.csv')
+    with open(path, 'w') as f:
+        f.write('Name,Category,Distance,Time\n' + 'x' * 100 + ',SM,10K,42:30\n')
+    output = io.StringIO()
+    tail = ResultsTail(grader, path, output, str(tmp_path / 'results.offset'))
+    # The header fits in the first read, and the next line does not
+    assert (tail.poll(), tail.poll()) == (0, 1)
+    assert output.getvalue().splitlines()[1].endswith(',62.86')
+
+
+def test_replaced_file_is_read_from_the_start(grader, tmp_path):
+    source = str(tmp_path / 'source.csv')
+    write_results(source, 60)
+    lines = csv_lines(source)
+    path, replacement = str(tmp_path / 'results.csv'), str(tmp_path / 'replacement.csv')
+    with open(path, 'w') as f:
+        f.writelines(lines[:11])
+    output = io.StringIO()
+    tail = ResultsTail(grader, path, output, str(tmp_path / 'results.offset'))
+    assert tail.poll() == 10
+
+    # Larger than the first file, so only its identity shows it is new
+    with open(replacement, 'w') as f:
+        f.write(lines[0])
+        f.writelines(lines[11:])
+    os.replace(replacement, path)
+    restarted = ResultsTail(grader, path, output, str(tmp_path / 'results.offset'))
+    assert restarted.poll() == 50
+    graded = pd.read_csv(io.StringIO(output.getvalue()), dtype={'Time': str})
+    assert graded['Name'].tolist() == [f'Runner {i}' for i in range(60)]
+
+
+class TimedOutput(io.StringIO):
+    """Records when each graded line is flushed"""
+
+    def __init__(self):
+        super().__init__()
+        self.flushed = []
+
+    def flush(self):
+        lines = self.getvalue().count('\n')
+        self.flushed += [time.perf_counter()] * (lines - len(self.flushed))
+
+
+def follow_appends(grader, tmp_path):
+    """Append 50 rows a line at a time to a followed file; the tail and each row's latency from append to output"""
+    source = str(tmp_path / 'source.csv')
+    write_results(source, 50)
+    lines = csv_lines(source)
+    path = str(tmp_path / 'results.csv')
+    with open(path, 'w') as f:
+        f.write(lines[0])
+
+    output = TimedOutput()
+    tail = ResultsTail(grader, path, output, str(tmp_path / 'results.offset'))
+    stop = threading.Event()
+    follower = threading.Thread(target=tail.follow, args=(stop,))
+    follower.start()
+    appended = []
+    try:
+        with open(path, 'a') as f:
+            for line in lines[1:]:
+                f.write(line)
+                f.flush()
+                appended.append(time.perf_counter())
+                time.sleep(0.005)
+        deadline = time.perf_counter() + 5
+        while tail.rows < 50 and time.perf_counter() < deadline:
+            time.sleep(0.005)
+    finally:
+        stop.set()
+        follower.join()
+
+    # The first flushed line is the header
+    return tail, [flushed - appended for flushed, appended in zip(output.flushed[1:], appended)]
+
+
+def test_appended_rows_are_output_as_they_arrive(grader, tmp_path):
+    tail, latencies = follow_appends(grader, tmp_path)
+    assert tail.rows == 50
+    assert len(latencies) == len(tail.latencies) == 50
+    assert 'latency from append to output' in tail.latency_report()
+
+
+@pytest.mark.benchmark
+def test_latency_from_append_to_output(grader, tmp_path):
+    tail, latencies = follow_appends(grader, tmp_path)
+    assert tail.rows == 50
+    assert percentile(latencies, 0.5) < 0.01
+    assert percentile(tail.latencies, 0.5) < 0.01
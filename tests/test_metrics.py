@@ -0,0 +1,71 @@
+import urllib.error
+import urllib.request
+import pandas as pd
+import pytest
+from agegrader import power_of_ten_grader
+from agegrader.batch import grade_results
+from agegrader.instrumentation import instrument
+from agegrader.metrics import render_prometheus, serve_metrics
+
+
+@pytest.fixture
+def graders():
+    graders = [instrument(power_of_ten_grader(year), stage_timings=False, year=year) for year in (2015, 2025)]
+    for grader in graders:
+        grader.get_age_grade('5K', 'M', 40, 1200)
+        grader.get_age_grade('Fell', 'M', 40, 1200)
+    return graders
+
+
+def test_counters_by_year_and_discipline(graders):
+    text = render_prometheus([grader.stats for grader in graders])
+    assert 'agegrader_grading_calls_total{year="2015",discipline="5 km"} 1' in text
+    assert 'agegrader_grading_calls_total{year="2025",discipline="5 km"} 1' in text
+    assert 'agegrader_failed_lookups_total{year="2015",discipline="unknown"} 1' in text
+
+
+def test_latency_histogram(graders):
+    text = render_prometheus([graders[0].stats])
+    assert '# TYPE agegrader_grading_latency_seconds histogram' in text
+    assert 'agegrader_grading_latency_seconds_bucket{year="2015",discipline="5 km",le="+Inf"} 1' in text
+    assert 'agegrader_grading_latency_seconds_count{year="2015",discipline="5 km"} 1' in text
+
+
+def test_batch_stage_timings(graders):
+    grade_results(graders[0], pd.DataFrame({'Category': ['M40'], 'Distance': ['5K'], 'Time': ['20:00']}))
+    text = render_prometheus([graders[0].stats])
+    assert 'agegrader_rows_graded_total{year="2015",discipline="5 km"} 1' in text
+    assert 'agegrader_stage_seconds_count{year="2015",path="batch",stage="lookup"} 1' in text
+
+
+def test_label_values_are_escaped():
+    grader = instrument(power_of_ten_grader(), year='20"15')
+    grader.get_age_grade('5K', 'M', 40, 1200)
+    assert 'year="20\\"15"' in render_prometheus([grader.stats])
+
+
+def test_unknown_disciplines_share_a_label():
+    grader = instrument(power_of_ten_grader(), stage_timings=False, year=2015)
+    for i in range(500):
+        grader.get_age_grade(f'junk {i}', 'M', 40, 1200)
+    grader.get_age_grade('5KXC', 'M', 40, 1200)
+    grade_results(grader, pd.DataFrame({'Distance': [f'junk {i}' for i in range(500)] + ['5K'],
+                                        'Category': 'M40', 'Time': '20:00'}))
+    text = render_prometheus([grader.stats])
+    assert 'agegrader_grading_calls_total{year="2015",discipline="unknown"} 500' in text
+    assert 'agegrader_rows_graded_total{year="2015",discipline="unknown"} 500' in text
+    assert 'agegrader_rows_graded_total{year="2015",discipline="5 km"} 1' in text
+    assert len(text.splitlines()) < 200
+
+
+def test_metrics_endpoint(graders):
+    server = serve_metrics(graders, port=0)
+    try:
+        url = f'http://127.0.0.1:{server.port}'
+        with urllib.request.urlopen(f'{url}/metrics') as response:
+            assert response.headers['Content-Type'].startswith('text/plain; version=0.0.4')
+            assert 'agegrader_grading_calls_total' in response.read().decode()
+        with pytest.raises(urllib.error.HTTPError):
+            urllib.request.urlopen(f'{url}/other')
+    finally:
+        server.stop()
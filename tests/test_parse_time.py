@@ -1,5 +1,8 @@
+import numpy as np
+import pandas as pd
 import pytest
 from agegrader.agegrader import parse_time
+from agegrader.times import parse_time_value, parse_times
 
 def test_parse_hms():
     parsed = parse_time('1:08:20')
@@ -11,4 +14,45 @@ def test_parse_hms_zero_h():
 
 def test_parse_ms():
     parsed = parse_time('08:20')
-    assert parsed == 8 * 60 + 20
\ No newline at end of file
+    assert parsed == 8 * 60 + 20
+
+VECTOR_TIMES = [
+    ('1:08:20', 3600 + 8 * 60 + 20),
+    ('0:08:20', 8 * 60 + 20),
+    ('08:20', 8 * 60 + 20),
+    ('1:08:20.4', 3600 + 8 * 60 + 20.4),
+    ('42:30.25', 42 * 60 + 30.25),
+    ('2550', 2550),
+    ('2550.5', 2550.5),
+    ('1h08m20s', 3600 + 8 * 60 + 20),
+    ('1h', 3600),
+    ('20m5s', 20 * 60 + 5),
+    (' 42:30 ', 42 * 60 + 30),
+]
+
+def test_parse_times():
+    seconds, invalid = parse_times([time_str for time_str, _ in VECTOR_TIMES])
+    assert seconds.tolist() == pytest.approx([expected for _, expected in VECTOR_TIMES])
+    assert not invalid.any()
+
+def test_parse_times_matches_parse_time():
+    time_strs = ['1:08:20', '0:08:20', '08:20', '59:59', '3:00:01', '08:20']
+    seconds, _ = parse_times(time_strs)
+    assert seconds.tolist() == [parse_time(time_str) for time_str in time_strs]
+
+def test_parse_times_invalid():
+    seconds, invalid = parse_times(['abc', '1:2:3:4', '1:ab', '1h2', '42:30'])
+    assert np.isnan(seconds[:4]).all()
+    assert invalid.tolist() == [True, True, True, True, False]
+
+def test_parse_times_missing_is_not_invalid():
+    seconds, invalid = parse_times([None, '', np.nan])
+    assert np.isnan(seconds).all()
+    assert not invalid.any()
+
+def test_parse_time_value_matches_parse_times():
+    values = [time_str for time_str, _ in VECTOR_TIMES] + ['abc', '1:2:3:4', '1h2', '', None, np.nan, 2550, 2550.5, -5]
+    seconds, _ = parse_times(pd.Series(values, dtype=object))
+    scalar = [parse_time_value(value) for value in values]
+    assert [np.nan if s is None else s for s in scalar] == pytest.approx(seconds.tolist(), nan_ok=True)
+    assert [s for s in scalar if s is not None] == seconds[~np.isnan(seconds)].tolist()
@@ -0,0 +1,49 @@
+import shutil
+
+import pytest
+from agegrader import standards
+from agegrader.standards import (LOADERS, MARSHAL_FILE, MODULE_FILE, PICKLE_FILE, STANDARDS_DIR, ChecksumError,
+                                 load_standards, load_standards_from)
+
+
+@pytest.mark.parametrize('format_name', LOADERS)
+def test_every_format_gives_the_same_standards(format_name):
+    expected = load_standards_from('module')
+    loaded = load_standards_from(format_name)
+    assert loaded == expected
+    assert list(loaded['2025']['M']) == list(expected['2025']['M'])
+    assert type(loaded['2015']['F']['5 km'][0]) is float
+
+
+def test_falls_back_when_artifacts_are_missing(monkeypatch, tmp_path):
+    def missing_module():
+        raise ImportError
+
+    shutil.copy(f'{STANDARDS_DIR}/{MODULE_FILE}', tmp_path / MODULE_FILE)
+    monkeypatch.setattr(standards, 'STANDARDS_DIR', str(tmp_path))
+    monkeypatch.setitem(LOADERS, 'array', missing_module)
+    load_standards.cache_clear()
+    try:
+        assert load_standards() == load_standards_from('module')
+    finally:
+        load_standards.cache_clear()
+
+
+def test_corrupt_artifact_fails_its_checksum(monkeypatch, tmp_path):
+    expected = load_standards_from('module')
+    for name in (MARSHAL_FILE, PICKLE_FILE):
+        shutil.copy(f'{STANDARDS_DIR}/{name}', tmp_path / name)
+    data = bytearray((tmp_path / MARSHAL_FILE).read_bytes())
+    data[1000] ^= 1
+    (tmp_path / MARSHAL_FILE).write_bytes(data)
+    monkeypatch.setattr(standards, 'STANDARDS_DIR', str(tmp_path))
+
+    with pytest.raises(ChecksumError):
+        load_standards_from('marshal')
+
+    load_standards.cache_clear()
+    try:
+        with pytest.warns(UserWarning, match=MARSHAL_FILE):
+            assert load_standards() == expected
+    finally:
+        load_standards.cache_clear()
@@ -0,0 +1,50 @@
+import pandas as pd
+import pytest
+from agegrader import power_of_ten_grader
+from agegrader.agegrader import POWER_OF_TEN_DISCIPLINE_MAP
+from agegrader.batch import grade_results
+from benchmarks.synthetic import (AGE_GENDER, MALFORMED_CATEGORIES, generate_chunks, results_frame,
+                                  write_results)
+
+
+def test_chunks_cover_all_rows():
+    chunks = list(generate_chunks(2500, chunk_size=1000))
+    assert [len(chunk) for chunk in chunks] == [1000, 1000, 500]
+    assert pd.concat(chunks).index.tolist() == list(range(2500))
+
+
+def test_every_discipline_appears():
+    assert set(results_frame(50_000)['Distance']) == set(POWER_OF_TEN_DISCIPLINE_MAP)
+
+
+@pytest.mark.parametrize('mode', ['category', AGE_GENDER])
+def test_times_grade_plausibly(mode):
+    grades = grade_results(power_of_ten_grader(), results_frame(5000, mode=mode))
+    assert grades.notna().all()
+    assert grades.between(25, 100).all()
+
+
+def test_malformed_fraction():
+    grades = grade_results(power_of_ten_grader(), results_frame(20_000, malformed=0.1))
+    assert 0.08 < grades.isna().mean() < 0.12
+
+
+@pytest.mark.parametrize('category', MALFORMED_CATEGORIES)
+def test_malformed_categories_do_not_grade(category):
+    grader = power_of_ten_grader()
+    df = pd.DataFrame({'Category': [category], 'Distance': ['5K'], 'Time': ['20:00']})
+    assert grade_results(grader, df).isna().all()
+    assert grader.get_age_grade_by_category('5K', category, 1200) == ""
+
+
+def test_deterministic_for_seed():
+    pd.testing.assert_frame_equal(results_frame(1000, seed=3), results_frame(1000, seed=3))
+
+
+@pytest.mark.parametrize('suffix, reader', [('csv', pd.read_csv), ('parquet', pd.read_parquet)])
+def test_write_results_streams_to_file(tmp_path, suffix, reader):
+    path = str(tmp_path / f'results.{suffix}')
+    write_results(path, 2500, chunk_size=1000)
+    written = reader(path, dtype=str) if suffix == 'csv' else reader(path)
+    expected = results_frame(2500, chunk_size=1000).reset_index(drop=True)
+    pd.testing.assert_frame_equal(written, expected, check_dtype=False)